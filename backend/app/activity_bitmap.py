@@ -0,0 +1,158 @@
+"""Activity days as per-user, per-year bitsets.
+
+Bit n of a `user_activity_years` row is day-of-year n (0-based), so a year
+is 46 bytes whatever the user did. Heat maps read at most two rows; streak
+and longest-run math is done on Python ints with shifts and masks.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import UserActivity, UserActivityYear
+
+YEAR_BYTES = 46  # 366 bits
+
+
+def _day_index(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def _to_int(bits: Optional[bytes]) -> int:
+    return int.from_bytes(bits or b"", "little")
+
+
+def _to_bytes(value: int) -> bytes:
+    return value.to_bytes(YEAR_BYTES, "little")
+
+
+def _year_row(db: Session, user_id: int, year: int) -> Optional[UserActivityYear]:
+    return (
+        db.query(UserActivityYear)
+        .filter(UserActivityYear.user_id == user_id, UserActivityYear.year == year)
+        .first()
+    )
+
+
+def mark_day(db: Session, user_id: int, day: date) -> bool:
+    """Set the bit for `day`; returns False when it was already set."""
+    row = _year_row(db, user_id, day.year)
+    bit = 1 << _day_index(day)
+    if row is None:
+        try:
+            with db.begin_nested():
+                db.add(UserActivityYear(user_id=user_id, year=day.year, bits=_to_bytes(bit)))
+            return True
+        except IntegrityError:
+            # A concurrent ping created this year's row first; set the bit on theirs.
+            row = _year_row(db, user_id, day.year)
+            if row is None:
+                raise
+    value = _to_int(row.bits)
+    if value & bit:
+        return False
+    row.bits = _to_bytes(value | bit)
+    return True
+
+
+def _window_query(user_id: int, start: date, end: date):
+    return select(UserActivityYear.year, UserActivityYear.bits).where(
+        UserActivityYear.user_id == user_id,
+        UserActivityYear.year.between(start.year, end.year),
+    )
+
+
+def _days_in_window(rows, start: date, end: date) -> List[str]:
+    by_year = {year: _to_int(bits) for year, bits in rows}
+    result = []
+    for year in sorted(by_year):
+        value = by_year[year]
+        lo = _day_index(start) if year == start.year else 0
+        hi = _day_index(end) if year == end.year else 365
+        window = (value >> lo) & ((1 << (hi - lo + 1)) - 1)
+        first = date(year, 1, 1) + timedelta(days=lo)
+        while window:
+            low_bit = window & -window
+            result.append((first + timedelta(days=low_bit.bit_length() - 1)).isoformat())
+            window ^= low_bit
+    return result
+
+
+def recent_days(db: Session, user_id: int, end: date, days: int) -> List[str]:
+    """Active days in the `days`-day window ending at `end`, ascending."""
+    start = end - timedelta(days=days - 1)
+    return _days_in_window(db.execute(_window_query(user_id, start, end)).all(), start, end)
+
+
+async def recent_days_async(db: AsyncSession, user_id: int, end: date, days: int) -> List[str]:
+    start = end - timedelta(days=days - 1)
+    return _days_in_window((await db.execute(_window_query(user_id, start, end))).all(), start, end)
+
+
+def _history_query(user_id: int):
+    return (
+        select(UserActivityYear.year, UserActivityYear.bits)
+        .where(UserActivityYear.user_id == user_id)
+        .order_by(UserActivityYear.year)
+    )
+
+
+def _join_years(rows) -> Tuple[Optional[date], int]:
+    if not rows:
+        return None, 0
+    origin = date(rows[0][0], 1, 1)
+    combined = 0
+    for year, bits in rows:
+        combined |= _to_int(bits) << (date(year, 1, 1) - origin).days
+    return origin, combined
+
+
+def load_history(db: Session, user_id: int) -> Tuple[Optional[date], int]:
+    """All of a user's years joined into one int; bit n is `origin + n` days."""
+    return _join_years(db.execute(_history_query(user_id)).all())
+
+
+async def load_history_async(db: AsyncSession, user_id: int) -> Tuple[Optional[date], int]:
+    return _join_years((await db.execute(_history_query(user_id))).all())
+
+
+def runs(value: int) -> Tuple[int, int, int]:
+    """(run ending at the highest set bit, longest run, index of highest set bit)."""
+    if not value:
+        return 0, 0, -1
+    top = value.bit_length() - 1
+    gaps = ~value & ((1 << (top + 1)) - 1)
+    current = top + 1 if not gaps else top - (gaps.bit_length() - 1)
+
+    longest, x = 0, value
+    while x:
+        x &= x >> 1
+        longest += 1
+    return current, longest, top
+
+
+def migrate_activity_storage(db: Session) -> int:
+    """Fold legacy one-row-per-day user_activity rows into yearly bitsets."""
+    rows = db.query(UserActivity.user_id, UserActivity.activity_date).all()
+    if not rows:
+        return 0
+    pending: Dict[Tuple[int, int], int] = {}
+    for user_id, activity_date in rows:
+        day = date.fromisoformat(activity_date)
+        key = (user_id, day.year)
+        pending[key] = pending.get(key, 0) | (1 << _day_index(day))
+
+    existing = {(r.user_id, r.year): r for r in db.query(UserActivityYear).all()}
+    for (user_id, year), value in pending.items():
+        row = existing.get((user_id, year))
+        if row is None:
+            db.add(UserActivityYear(user_id=user_id, year=year, bits=_to_bytes(value)))
+        else:
+            row.bits = _to_bytes(_to_int(row.bits) | value)
+    db.query(UserActivity).delete(synchronize_session=False)
+    db.commit()
+    return len(rows)
@@ -0,0 +1,48 @@
+"""
+Ollama AI Engine: MCQ Question Generator
+
+Drafts multiple-choice questions for skills the bank does not cover yet.
+Output only ever lands in the review queue; nothing reaches users unreviewed.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.ai.ollama_client import chat_json
+
+
+class GeneratedQuestion(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    question_text: str
+    options: List[str] = Field(default_factory=list)
+    correct_answer: int = 0
+    difficulty: int = 3
+    explanation: Optional[str] = None
+
+
+class GeneratedQuestionSet(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    questions: List[GeneratedQuestion] = Field(default_factory=list)
+
+
+def generate_questions(skill_name: str, count: int = 5, career_goal: Optional[str] = None) -> List[GeneratedQuestion]:
+    """Ask the LLM for `count` MCQs on `skill_name`; raises HTTPException when AI is down."""
+    context = f" for someone aiming to be a {career_goal}" if career_goal else ""
+    result = chat_json(
+        system=(
+            "You write multiple-choice assessment questions. Return JSON "
+            '{"questions":[{"question_text":"...","options":["a","b","c","d"],'
+            '"correct_answer":0,"difficulty":3,"explanation":"..."}]}. '
+            "Exactly 4 options, correct_answer is the 0-based index, difficulty 1-5, "
+            "mix difficulties, one short explanation sentence."
+        ),
+        user=f"Write {count} questions testing {skill_name}{context}.",
+        schema=GeneratedQuestionSet,
+        timeout=40.0,
+        num_predict=180 * count,
+        retries=1,
+    )
+    return result.questions[:count]
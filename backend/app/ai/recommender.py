@@ -1,36 +1,26 @@
 """
 Ollama AI Engine: Progress Recommender
 
-Career readiness is computed from cached targets. Path adaptation uses a
-short Ollama call.
+Career readiness is computed from cached targets. Path adaptation applies
+local rules; Ollama only rewords the change list when asked.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from fastapi import HTTPException
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.ai.gap_analyzer import get_cached_readiness
-from app.ai.learning_path_engine import ResourceItem, resources_from_model, search_resources_for_skill
 from app.ai.ollama_client import chat_json
 
-
-class AdaptedWeek(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-
-    week_number: int = 1
-    skill_name: str = "Skill"
-    skills: List[str] = Field(default_factory=list)
-    resources: List[ResourceItem] = Field(default_factory=list)
-    estimated_hours: float = 8.0
-    status: str = "pending"
-    is_revision: bool = False
-    explanation: List[str] = Field(default_factory=list)
+REVISION_THRESHOLD = 40.0
+AHEAD_THRESHOLD = 80.0
+MAX_PATH_WEEKS = 5
 
 
-class AdaptationResult(BaseModel):
+class AdaptationExplanation(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
-    adapted_path: List[AdaptedWeek] = Field(default_factory=list)
     changes: List[str] = Field(default_factory=list)
 
 
@@ -67,78 +57,147 @@ def calculate_progress_velocity(assessments: list) -> float:
     return velocity
 
 
+def _week_progress(
+    week: Dict,
+    progress_data: Dict[str, float],
+    completion: Tuple[int, int],
+    teachbacks: Dict[str, int],
+) -> Tuple[bool, Optional[float]]:
+    """Return (started, progress %) for one week from reported and recorded signals."""
+    reported = None
+    for skill in [week.get("skill_name")] + list(week.get("skills") or []):
+        if skill in progress_data:
+            reported = float(progress_data[skill])
+            break
+
+    completed, total = completion
+    attempts = teachbacks.get("passed", 0) + teachbacks.get("failed", 0)
+    started = reported is not None or completed > 0 or attempts > 0
+    if reported is not None:
+        return started, reported
+    if started and total:
+        return started, round(completed / total * 100, 1)
+    return started, None
+
+
 def adapt_learning_path(
     learning_path: List[Dict],
     progress_data: Dict[str, float],
     hours_per_week: int,
+    week_completion: Optional[Dict[int, Tuple[int, int]]] = None,
+    teachback_stats: Optional[Dict[int, Dict[str, int]]] = None,
+    velocity: float = 0.5,
 ) -> Dict[str, Any]:
-    """Adapt the learning path based on user progress using Ollama."""
-    compact_path = []
-    for week in learning_path[:6]:
-        compact_path.append({
-            "week": week.get("week_number"),
-            "skill": week.get("skill_name"),
-            "hours": week.get("estimated_hours", 0),
-        })
-
-    original_by_week = {
-        week.get("week_number"): week.get("resources") or []
-        for week in learning_path
-    }
-    original_by_skill = {
-        week.get("skill_name"): week.get("resources") or []
-        for week in learning_path
+    """Adapt the learning path with deterministic rules.
+
+    Started weeks under 40% (or with repeated failed teach-backs and no pass)
+    get a revision week right after the started block; weeks reported above
+    80% with nothing recorded yet get shorter hours; the path is capped at
+    five weeks. Weeks the rules do not touch are returned exactly as given so
+    their stored resources and progress carry over.
+    """
+    week_completion = week_completion or {}
+    teachback_stats = teachback_stats or {}
+    hours = float(hours_per_week or 10)
+
+    kept: List[Dict] = []
+    revisions: List[Dict] = []
+    changes: List[str] = []
+    notes: List[str] = []  # shown to the learner but not edits, so they don't make a new version
+    last_started = -1
+    existing_revisions = {
+        week.get("skill_name") for week in learning_path if week.get("is_revision")
     }
 
-    result = chat_json(
-        system=(
-            "Adapt a learning path. Return compact JSON: "
-            "{\"adapted_path\":[{\"week_number\":1,\"skill_name\":\"Python\","
-            "\"skills\":[\"Python\"],\"resources\":[{\"title\":\"Python docs\","
-            "\"type\":\"article\",\"url\":\"https://docs.python.org/3/tutorial/\","
-            "\"estimated_hours\":6}],\"estimated_hours\":8,"
-            "\"status\":\"pending\",\"is_revision\":false,\"explanation\":[\"...\"]}],"
-            "\"changes\":[\"Added revision week for Python\"]}. "
-            "Each week MUST include 2 resources with real https URLs on official docs "
-            "(python.org, react.dev, MDN, freecodecamp.org, github.com, kaggle.com). "
-            "Never invent URLs. If progress < 40 insert a revision week. "
-            "If progress > 80 shorten hours. Keep at most 5 weeks."
-        ),
-        user=f"Hours/week: {hours_per_week}. Progress: {progress_data}. Path: {compact_path}",
-        schema=AdaptationResult,
-        timeout=50.0,
-        num_predict=1200,
-        retries=1,
-    )
+    for index, week in enumerate(learning_path):
+        week_number = week.get("week_number")
+        skill = week.get("skill_name") or "Skill"
+        completion = week_completion.get(week_number, (0, 0))
+        teachbacks = teachback_stats.get(week_number, {})
+        started, progress = _week_progress(week, progress_data, completion, teachbacks)
+        adapted = dict(week)
+
+        if started:
+            last_started = index
+
+        struggling = started and (
+            (progress is not None and progress < REVISION_THRESHOLD)
+            or (teachbacks.get("failed", 0) >= 2 and not teachbacks.get("passed", 0))
+        )
+        if struggling and not week.get("is_revision") and skill not in existing_revisions:
+            existing_revisions.add(skill)
+            revision_hours = hours if velocity < 0.4 else max(1.0, round(hours * 0.5, 1))
+            label = f"{progress:.0f}%" if progress is not None else "repeated teach-back misses"
+            revisions.append({
+                "skill_name": skill,
+                "skills": list(week.get("skills") or [skill]),
+                "resources": [
+                    {k: v for k, v in resource.items() if k != "id"}
+                    for resource in week.get("resources") or []
+                ],
+                "estimated_hours": revision_hours,
+                "is_revision": True,
+                "explanation": [
+                    f"Revision: {skill} is at {label}",
+                    "Revisit the same resources before moving on",
+                ],
+            })
+            changes.append(f"Added a revision week for {skill} ({label}).")
+
+        already_shortened = any(str(line).startswith("Shortened:") for line in week.get("explanation") or [])
+        if progress is not None and progress > AHEAD_THRESHOLD and not already_shortened:
+            if completion[0] == 0:
+                factor = 0.6 if velocity >= 0.75 else 0.75
+                adapted["estimated_hours"] = max(1.0, round(float(week.get("estimated_hours") or hours) * factor, 1))
+                adapted["explanation"] = [
+                    f"Shortened: {skill} is already at {progress:.0f}%",
+                    f"Hours cut to {adapted['estimated_hours']:g}",
+                ]
+                changes.append(f"Shortened {skill} to {adapted['estimated_hours']:g}h ({progress:.0f}% done).")
+            else:
+                notes.append(f"{skill} is {progress:.0f}% done — kept as is.")
+
+        kept.append(adapted)
+
+    ordered = kept[:last_started + 1] + revisions + kept[last_started + 1:]
+    limit = max(MAX_PATH_WEEKS, last_started + 1)
+    if len(ordered) > limit:
+        dropped = [w.get("skill_name") for w in ordered[limit:]]
+        ordered = ordered[:limit]
+        changes.append(f"Capped the path at {limit} weeks (dropped {', '.join(dropped)}).")
 
     adapted_path = []
-    for index, week in enumerate(result.adapted_path[:6], start=1):
-        skills = week.skills or [week.skill_name]
-        resources = resources_from_model(week.skill_name or skills[0], week.resources, limit=2)
-        if not resources:
-            week_num = week.week_number or index
-            resources = list(original_by_week.get(week_num) or original_by_skill.get(week.skill_name) or [])
-            resources = resources_from_model(week.skill_name or skills[0], resources, limit=2)
-        if not resources:
-            resources = search_resources_for_skill(week.skill_name or skills[0], limit=2)
-        adapted_path.append({
-            "week_number": week.week_number or index,
-            "skill_name": week.skill_name or skills[0],
-            "skills": skills,
-            "resources": resources,
-            "estimated_hours": float(week.estimated_hours or hours_per_week),
-            "status": week.status or "pending",
-            "is_revision": bool(week.is_revision),
-            "explanation": (week.explanation or [])[:2],
-        })
-
-    changes = result.changes or ["Path updated based on your recent progress."]
+    for number, week in enumerate(ordered, start=1):
+        adapted_path.append({**week, "week_number": number})
+
     return {
         "adapted_path": adapted_path,
-        "changes": changes,
+        "changes": (changes or ["Your path already fits your progress — no changes needed."]) + notes,
+        "changed": bool(changes),
     }
 
 
+def explain_adaptation(changes: List[str], progress_data: Dict[str, float]) -> List[str]:
+    """Optional LLM pass that rewords rule-based changes for the learner."""
+    try:
+        result = chat_json(
+            system=(
+                "Rewrite each change as one short encouraging sentence. "
+                "Return JSON {\"changes\":[\"...\"]} with the same number of items."
+            ),
+            user=f"Progress: {progress_data}. Changes: {changes}",
+            schema=AdaptationExplanation,
+            timeout=15.0,
+            num_predict=240,
+            retries=0,
+        )
+    except HTTPException:
+        return changes
+    if len(result.changes) != len(changes):
+        return changes
+    return result.changes
+
+
 def calculate_career_readiness(
     user_skills: Dict[str, float],
     career_requirements: Dict[str, float],
@@ -84,7 +84,7 @@ def generate_assessment_breakdown(
     score: float,
     skill_name: Optional[str] = None,
 ) -> dict:
-    """Generate detailed breakdown of assessment results, plus Ollama feedback."""
+    """Generate detailed breakdown of assessment results (deterministic, no LLM)."""
     total_questions = len(questions)
     correct_count = sum(1 for q in questions if answers.get(q['id']) == q['correct_answer'])
 
@@ -121,16 +121,18 @@ def generate_assessment_breakdown(
         "accuracy_by_difficulty": accuracy_by_difficulty,
     }
 
+    return breakdown
+
+
+def fallback_feedback(score: float, level: str) -> str:
+    return f"You scored {score}/10 ({level}). Review missed questions and retry this skill."
+
+
+def generate_assessment_feedback(skill_name: Optional[str], breakdown: dict) -> str:
+    """Ollama feedback for a finished breakdown, or the fixed fallback when AI is down."""
+    score = breakdown.get("score", 0.0)
+    level = breakdown.get("level") or classify_skill_level(score)
     try:
-        breakdown["feedback"] = _generate_feedback(
-            skill_name or "this skill",
-            score,
-            level,
-            breakdown,
-        )
+        return _generate_feedback(skill_name or "this skill", score, level, breakdown)
     except HTTPException:
-        breakdown["feedback"] = (
-            f"You scored {score}/10 ({level}). Review missed questions and retry this skill."
-        )
-
-    return breakdown
+        return fallback_feedback(score, level)
@@ -3,6 +3,7 @@
 from datetime import date, timedelta
 from typing import Dict, List, Optional
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.ai.coach import build_coach_context
@@ -43,6 +44,14 @@ def _heuristic_plan(user: User, skill_gaps: List[dict], stale_skills: List[str])
     }
 
 
+def load_weekly_plan(db: Session, user_id: int, week_start: str) -> Optional[WeeklyPlan]:
+    return (
+        db.query(WeeklyPlan)
+        .filter(WeeklyPlan.user_id == user_id, WeeklyPlan.week_start == week_start)
+        .first()
+    )
+
+
 def generate_weekly_plan(
     db: Session,
     user: User,
@@ -53,11 +62,7 @@ def generate_weekly_plan(
     week_start: Optional[str] = None,
 ) -> WeeklyPlan:
     ws = week_start or monday_of(date.today())
-    existing = (
-        db.query(WeeklyPlan)
-        .filter(WeeklyPlan.user_id == user.id, WeeklyPlan.week_start == ws)
-        .first()
-    )
+    existing = load_weekly_plan(db, user.id, ws)
     if existing:
         return existing
 
@@ -103,8 +108,15 @@ def generate_weekly_plan(
         check_in=str(payload.get("check_in") or "Complete one learning resource with teach-back."),
         next_step=str(payload.get("next") or "Review gaps and schedule a recert if any skill is stale."),
     )
-    db.add(row)
-    db.flush()
+    try:
+        with db.begin_nested():
+            db.add(row)
+    except IntegrityError:
+        # Another request or the precompute job stored this week's plan while the LLM ran.
+        existing = load_weekly_plan(db, user.id, ws)
+        if existing is None:
+            raise
+        return existing
     return row
 
 
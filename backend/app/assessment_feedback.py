@@ -0,0 +1,50 @@
+"""Assessment feedback written after the submit response has gone out.
+
+Scores and breakdowns are deterministic and returned immediately; the LLM
+coaching sentence is generated by a FastAPI background task and stored in
+`assessment_feedback`, where clients poll for it.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import AssessmentFeedback
+from app.ai.skill_evaluator import generate_assessment_feedback
+
+logger = logging.getLogger(__name__)
+
+
+def queue_feedback(db: Session, assessment_id: int) -> AssessmentFeedback:
+    """Add the pending row; commit it together with the assessment."""
+    row = AssessmentFeedback(assessment_id=assessment_id, status="pending")
+    db.add(row)
+    return row
+
+
+def run_feedback_job(assessment_id: int, skill_name: Optional[str], breakdown: dict) -> None:
+    text = generate_assessment_feedback(skill_name, breakdown)
+    db = SessionLocal()
+    try:
+        row = db.get(AssessmentFeedback, assessment_id)
+        if row is None:
+            row = AssessmentFeedback(assessment_id=assessment_id)
+            db.add(row)
+        row.feedback = text
+        row.status = "ready"
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Storing feedback failed for assessment %s", assessment_id)
+    finally:
+        db.close()
+
+
+def feedback_payload(row: Optional[AssessmentFeedback], assessment_id: int) -> dict:
+    return {
+        "assessment_id": assessment_id,
+        "feedback_status": row.status if row else "unavailable",
+        "feedback": row.feedback if row else None,
+    }
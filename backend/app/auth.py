@@ -1,12 +1,17 @@
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+import os
+import threading
+import time
+from typing import Optional, Tuple
 from jose import JWTError, jwt
-import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models import User
+from app.password_hashing import check_password, hash_password
 
 # Security configuration
 SECRET_KEY = "your-secret-key-change-in-production-please-use-env-vars"
@@ -14,22 +19,18 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24 * 60  # 30 days
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login", auto_error=False)
+
+# Comma-separated emails allowed to use /api/admin endpoints
+ADMIN_EMAILS = {e.strip().lower() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()}
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a bcrypt hash."""
-    if isinstance(hashed_password, str):
-        hashed_password = hashed_password.encode('utf-8')
-    if isinstance(plain_password, str):
-        plain_password = plain_password.encode('utf-8')
-    return bcrypt.checkpw(plain_password, hashed_password)
+    """Verify a password against a bcrypt hash (blocking; routes use check_password_async)."""
+    return check_password(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    if isinstance(password, str):
-        password = password.encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password, salt)
-    return hashed.decode('utf-8')
+    """Hash a password using bcrypt at BCRYPT_ROUNDS (blocking; routes use hash_password_async)."""
+    return hash_password(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -45,24 +46,87 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _token_user_id(token: str) -> int:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id_str: str = payload.get("sub")
         if user_id_str is None:
-            raise credentials_exception
+            raise _credentials_exception()
         # Convert string back to int
-        user_id = int(user_id_str)
+        return int(user_id_str)
     except (JWTError, ValueError, TypeError):
-        raise credentials_exception
-    
+        raise _credentials_exception()
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    user_id = _token_user_id(token)
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
+
+@dataclass(frozen=True)
+class Principal:
+    """What most routes need to know about the caller, without an ORM row."""
+    id: int
+    email: str
+    career_goal: Optional[str]
+    hours_per_week: Optional[int]
+
+
+# Principals by user id. The token itself is verified on every request; the
+# cache only saves the users lookup, and profile updates invalidate it.
+PRINCIPAL_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_SIZE = 10000
+_principal_lock = threading.Lock()
+_principals: "OrderedDict[int, Tuple[float, Principal]]" = OrderedDict()
+
+def invalidate_principal(user_id: int) -> None:
+    with _principal_lock:
+        _principals.pop(user_id, None)
+
+def _load_principal(user_id: int) -> Optional[Principal]:
+    now = time.monotonic()
+    with _principal_lock:
+        entry = _principals.get(user_id)
+        if entry is not None and entry[0] > now:
+            _principals.move_to_end(user_id)
+            return entry[1]
+    with SessionLocal() as db:
+        row = db.query(User.id, User.email, User.career_goal, User.hours_per_week).filter(User.id == user_id).first()
+    if row is None:
+        return None
+    principal = Principal(id=row.id, email=row.email, career_goal=row.career_goal, hours_per_week=row.hours_per_week)
+    with _principal_lock:
+        _principals[user_id] = (now + PRINCIPAL_TTL_SECONDS, principal)
+        _principals.move_to_end(user_id)
+        while len(_principals) > PRINCIPAL_CACHE_SIZE:
+            _principals.popitem(last=False)
+    return principal
+
+def get_current_principal(token: str = Depends(oauth2_scheme)) -> Principal:
+    principal = _load_principal(_token_user_id(token))
+    if principal is None:
+        raise _credentials_exception()
+    return principal
+
+def get_optional_principal(token: Optional[str] = Depends(optional_oauth2_scheme)) -> Optional[Principal]:
+    """The signed-in caller when a valid token is sent, otherwise None."""
+    if not token:
+        return None
+    try:
+        return get_current_principal(token)
+    except HTTPException:
+        return None
+
+def get_admin_user(current_user: Principal = Depends(get_current_principal)) -> Principal:
+    if (current_user.email or "").lower() not in ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return current_user
@@ -0,0 +1,104 @@
+"""Connection profile for running on a SQLite file in production.
+
+Every new connection gets WAL journaling (readers no longer block the writer),
+`synchronous=NORMAL` (fsync at checkpoints instead of every commit, safe
+under WAL), a busy timeout, and larger page cache / mmap windows. File
+databases use a sized QueuePool.
+
+SQLite allows one writer at a time, and its busy handler polls with sleeps,
+so contended writers waste time and eventually fail with "database is
+locked". `serialize_writes` queues this process's write transactions on a
+lock instead: a session takes it at its first flush or Core write and
+hands it over as soon as it commits or rolls back. Other processes are
+still covered by busy_timeout.
+
+Any other URL is treated as a server database (PostgreSQL): a QueuePool of
+DB_POOL_SIZE connections plus DB_POOL_MAX_OVERFLOW burst connections,
+checked with a ping on checkout and recycled after DB_POOL_RECYCLE_SECONDS
+so connections dropped by the server or a proxy are never handed out.
+
+Every value can be overridden through the SQLITE_* and DB_POOL_* env vars.
+"""
+
+import os
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "20"))
+POOL_TIMEOUT_SECONDS = int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+
+_WRITER_KEY = "sqlite_writer"
+
+
+def is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_file(url: str) -> bool:
+    return is_sqlite(url) and ":memory:" not in url and url.rstrip("/") not in ("sqlite:", "sqlite+pysqlite:")
+
+
+def engine_options(url: str) -> dict:
+    """Keyword arguments for `create_engine` under this profile."""
+    if not is_sqlite(url):
+        return {
+            "pool_size": POOL_SIZE,
+            "max_overflow": POOL_MAX_OVERFLOW,
+            "pool_timeout": POOL_TIMEOUT_SECONDS,
+            "pool_recycle": POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": True,
+        }
+    options = {"connect_args": {"check_same_thread": False}}
+    if _is_file(url):
+        options.update(pool_size=POOL_SIZE, max_overflow=POOL_MAX_OVERFLOW)
+    return options
+
+
+def apply_sqlite_pragmas(engine: Engine) -> None:
+    """Set the per-connection pragmas on every new connection of `engine`."""
+    file_backed = _is_file(str(engine.url))
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if file_backed:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        cursor.execute(f"PRAGMA synchronous={SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+        cursor.close()
+
+
+def serialize_writes(session_factory) -> None:
+    """Make sessions from `session_factory` hold a process-wide writer lock
+    from their first write until their transaction ends."""
+    lock = threading.Lock()
+
+    def acquire(session) -> None:
+        if session.info.get(_WRITER_KEY):
+            return
+        # Past the busy timeout, fall back to SQLite's own locking rather than fail here.
+        session.info[_WRITER_KEY] = lock.acquire(timeout=BUSY_TIMEOUT_MS / 1000)
+
+    @event.listens_for(session_factory, "before_flush")
+    def _before_flush(session, flush_context, instances):
+        acquire(session)
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def _before_core_write(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            acquire(orm_execute_state.session)
+
+    @event.listens_for(session_factory, "after_transaction_end")
+    def _release(session, transaction):
+        if transaction.parent is None and session.info.pop(_WRITER_KEY, False):
+            lock.release()
@@ -1,9 +1,10 @@
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.models import Assessment, LearningPath, TeachBack
+from app.models import ActivePath, Assessment, PathVersionWeek, PathWeek, RecertQueueItem, SkillLastTouch, TeachBack
 
 AGING_DAYS = 7
 STALE_DAYS = 14
@@ -17,36 +18,79 @@ def _aware(dt: Optional[datetime]) -> Optional[datetime]:
     return dt
 
 
-def compute_freshness(db: Session, user_id: int, user_skills: dict) -> list[dict]:
-    now = datetime.now(timezone.utc)
-    last_touch: dict[str, datetime] = {}
+def touch_skills(db: Session, user_id: int, skill_names, stamp: Optional[datetime] = None) -> None:
+    """Move each skill's last touch forward to `stamp` (now by default) and drop
+    the skills from the user's recert queue."""
+    stamp = _aware(stamp) or datetime.now(timezone.utc)
+    skill_names = list(dict.fromkeys(skill_names))
+    db.query(RecertQueueItem).filter(
+        RecertQueueItem.user_id == user_id, RecertQueueItem.skill_name.in_(skill_names)
+    ).delete(synchronize_session=False)
+    for skill_name in skill_names:
+        row = db.get(SkillLastTouch, (user_id, skill_name))
+        if row is None:
+            db.add(SkillLastTouch(user_id=user_id, skill_name=skill_name, touched_at=stamp))
+        elif _aware(row.touched_at) < stamp:
+            row.touched_at = stamp
 
-    assessments = db.query(Assessment).filter(Assessment.user_id == user_id).all()
-    for row in assessments:
-        stamp = _aware(row.created_at)
-        if not stamp:
-            continue
-        prev = last_touch.get(row.skill_name)
-        if not prev or stamp > prev:
-            last_touch[row.skill_name] = stamp
 
-    passed = (
-        db.query(TeachBack, LearningPath)
+def migrate_last_touch(db: Session) -> int:
+    """Backfill skill_last_touch from assessments and passed teach-backs.
+
+    Runs only while the table is empty. Teach-backs map to the skills of the
+    week they belong to in the user's active path version.
+    """
+    if db.query(SkillLastTouch.user_id).first() is not None:
+        return 0
+    latest: dict[tuple, datetime] = {}
+
+    def fold(user_id: int, skill_name: str, stamp: Optional[datetime]) -> None:
+        stamp = _aware(stamp)
+        key = (user_id, skill_name)
+        if stamp and (key not in latest or stamp > latest[key]):
+            latest[key] = stamp
+
+    for user_id, skill_name, stamp in (
+        db.query(Assessment.user_id, Assessment.skill_name, func.max(Assessment.created_at))
+        .group_by(Assessment.user_id, Assessment.skill_name)
+    ):
+        fold(user_id, skill_name, stamp)
+    for user_id, stamp, week_skills in (
+        db.query(TeachBack.user_id, func.max(TeachBack.created_at), PathWeek.skills)
+        .join(ActivePath, ActivePath.user_id == TeachBack.user_id)
         .join(
-            LearningPath,
-            (LearningPath.user_id == TeachBack.user_id)
-            & (LearningPath.week_number == TeachBack.week_number),
+            PathVersionWeek,
+            (PathVersionWeek.version_id == ActivePath.version_id)
+            & (PathVersionWeek.week_number == TeachBack.week_number),
         )
-        .filter(TeachBack.user_id == user_id, TeachBack.passed.is_(True))
-        .all()
+        .join(PathWeek, PathWeek.id == PathVersionWeek.week_id)
+        .filter(TeachBack.passed.is_(True))
+        .group_by(TeachBack.user_id, PathWeek.id)
+    ):
+        for skill_name in week_skills or []:
+            fold(user_id, skill_name, stamp)
+
+    if not latest:
+        return 0
+    db.add_all(
+        SkillLastTouch(user_id=user_id, skill_name=skill_name, touched_at=stamp)
+        for (user_id, skill_name), stamp in latest.items()
     )
-    for teach, path in passed:
-        stamp = _aware(teach.created_at)
-        if not stamp:
-            continue
-        prev = last_touch.get(path.skill_name)
-        if not prev or stamp > prev:
-            last_touch[path.skill_name] = stamp
+    db.commit()
+    return len(latest)
+
+
+def _last_touch_query(user_id: int):
+    return select(SkillLastTouch.skill_name, SkillLastTouch.touched_at).where(SkillLastTouch.user_id == user_id)
+
+
+def compute_freshness(db: Session, user_id: int, user_skills: dict) -> list[dict]:
+    return _freshness_items(db.execute(_last_touch_query(user_id)).all(), user_skills)
+
+
+def _freshness_items(rows, user_skills: dict) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    last_touch: dict[str, datetime] = {skill_name: _aware(stamp) for skill_name, stamp in rows}
 
     skills = sorted(set(user_skills.keys()) | set(last_touch.keys()))
     items = []
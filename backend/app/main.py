@@ -2,14 +2,29 @@ from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from app.database import engine, Base
-from app.routers import auth, assessment, dashboard, learning_path, profile, chat, streak, career_fork, teachback, readiness_report, coach_plan
+from app.database import async_engine, async_read_engine, engine, SessionLocal
+from app.migrations import run_migrations
+from app.path_store import migrate_path_storage
+from app.path_progress import migrate_progress_counters
+from app.activity_bitmap import migrate_activity_storage
+from app.freshness import migrate_last_touch
+from app.routers import auth, assessment, dashboard, learning_path, profile, chat, streak, career_fork, teachback, readiness_report, coach_plan, admin
 from app.ai.ollama_client import llm_status, warm_model
+from app.password_hashing import shutdown_hashing
 import traceback
 import threading
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Bring the schema up to date
+run_migrations(engine)
+
+# Bring legacy learning_paths rows and unversioned weeks up to the versioned layout,
+# build progress counters for older paths, fold legacy per-day activity rows into
+# yearly bitsets, and backfill skill last touches
+with SessionLocal() as _db:
+    migrate_path_storage(_db)
+    migrate_progress_counters(_db)
+    migrate_activity_storage(_db)
+    migrate_last_touch(_db)
 
 app = FastAPI(
     title="SkillSync API",
@@ -56,12 +71,23 @@ app.include_router(career_fork.router)
 app.include_router(teachback.router)
 app.include_router(readiness_report.router)
 app.include_router(coach_plan.router)
+app.include_router(admin.router)
 
 
 @app.on_event("startup")
 def _warm_ollama():
     threading.Thread(target=warm_model, daemon=True).start()
 
+@app.on_event("shutdown")
+def _stop_hashing_pool():
+    shutdown_hashing()
+
+@app.on_event("shutdown")
+async def _close_async_engine():
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
 @app.get("/")
 def root():
     return {"message": "SkillSync API", "version": "1.0.0"}
@@ -0,0 +1,166 @@
+"""Versioned schema migrations.
+
+`run_migrations` applies every entry of MIGRATIONS newer than the version
+recorded in `schema_migrations`, each in its own transaction, and records
+it. Schema changes go here as a new numbered function rather than relying
+on `create_all` at import: a new table or index on an existing database is
+only created by a migration. On a fresh database the baseline already builds
+the current models, so later migrations must tolerate finding their objects
+in place (`checkfirst`, IF NOT EXISTS).
+
+Data backfills that depend on the ORM (path storage, activity bitsets, skill
+last touches) still run from app/main.py after the schema is current.
+"""
+
+from datetime import datetime, timezone
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.database import Base
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+_meta = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _meta,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+JSONB_COLUMNS = [
+    ("assessments", "answers"),
+    ("learning_paths", "resources"),
+    ("readiness_reports", "snapshot"),
+    ("weekly_plans", "plan_items"),
+]
+
+
+def _create_missing_indexes(conn: Connection, names: List[str]) -> None:
+    indexes = {index.name: index for table in Base.metadata.tables.values() for index in table.indexes}
+    for name in names:
+        indexes[name].create(conn, checkfirst=True)
+
+
+def _0001_baseline(conn: Connection) -> None:
+    """Every table as of the switch to migrations (what create_all used to build)."""
+    Base.metadata.create_all(conn)
+
+
+def _0002_hot_query_indexes(conn: Connection) -> None:
+    """Indexes for the per-user and per-skill lookups the routers run on every request."""
+    # The dashboard upserts gaps by (user_id, skill_name); keep the newest row of any duplicates.
+    conn.execute(text(
+        "DELETE FROM skill_gaps WHERE id NOT IN "
+        "(SELECT MAX(id) FROM skill_gaps GROUP BY user_id, skill_name)"
+    ))
+    _create_missing_indexes(conn, [
+        "ix_assessments_user_skill_score",
+        "ix_assessments_user_created",
+        "uq_skill_gap_user_skill",
+        "ix_learning_paths_user_week",
+        "ix_teachbacks_user_week_resource",
+        "ix_mcq_questions_skill",
+        "ix_question_candidates_status_skill",
+        "ix_readiness_reports_user_created",
+        "ix_coach_messages_user_created",
+    ])
+
+
+def _0003_postgres_jsonb(conn: Connection) -> None:
+    """JSON document columns become JSONB on PostgreSQL; SQLite keeps JSON text."""
+    if conn.dialect.name != "postgresql":
+        return
+    for table, column in JSONB_COLUMNS:
+        conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"))
+
+
+def _0004_parked_progress(conn: Connection) -> None:
+    """Progress on weeks of inactive path versions is parked instead of deleted."""
+    Base.metadata.tables["parked_progress"].create(conn, checkfirst=True)
+
+
+def _0005_scoring_question_ids(conn: Connection) -> None:
+    """Full-test scores record the bank they were normalised over.
+
+    Re-scoring used to divide by the skill's current bank, so every question
+    added later lowered old scores. Existing rows are backfilled against the
+    bank as it stands now, which is the closest record left of what they were
+    scored on; rows from before `assessment_scoring` get their method here too
+    (full when the answers cover the whole bank, recert otherwise).
+    """
+    if "question_ids" not in {c["name"] for c in inspect(conn).get_columns("assessment_scoring")}:
+        conn.execute(text("ALTER TABLE assessment_scoring ADD COLUMN question_ids JSON"))
+
+    tables = Base.metadata.tables
+    questions, assessments, scoring = tables["mcq_questions"], tables["assessments"], tables["assessment_scoring"]
+    bank: dict = {}
+    for qid, skill_name in conn.execute(select(questions.c.id, questions.c.skill_name).order_by(questions.c.id)):
+        bank.setdefault(skill_name, []).append(qid)
+
+    full = conn.execute(
+        select(scoring.c.assessment_id, assessments.c.skill_name)
+        .join(assessments, assessments.c.id == scoring.c.assessment_id)
+        .where(scoring.c.method == "full", scoring.c.question_ids.is_(None))
+    ).all()
+    for assessment_id, skill_name in full:
+        conn.execute(
+            scoring.update().where(scoring.c.assessment_id == assessment_id)
+            .values(question_ids=bank.get(skill_name, []))
+        )
+
+    legacy = conn.execute(
+        select(assessments.c.id, assessments.c.skill_name, assessments.c.answers)
+        .outerjoin(scoring, scoring.c.assessment_id == assessments.c.id)
+        .where(scoring.c.assessment_id.is_(None))
+    ).all()
+    rows = []
+    for assessment_id, skill_name, answers in legacy:
+        ids = bank.get(skill_name)
+        answered = {int(qid) for qid in (answers or {})}
+        if ids and answered >= set(ids):
+            rows.append({"assessment_id": assessment_id, "method": "full", "question_ids": ids})
+        else:
+            rows.append({"assessment_id": assessment_id, "method": "recert", "question_ids": None})
+    if rows:
+        conn.execute(scoring.insert(), rows)
+
+
+def _0006_question_generation_runs(conn: Connection) -> None:
+    """Admin-started question drafting runs in the background and is polled by id."""
+    Base.metadata.tables["question_generation_runs"].create(conn, checkfirst=True)
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "baseline", _0001_baseline),
+    (2, "hot_query_indexes", _0002_hot_query_indexes),
+    (3, "postgres_jsonb", _0003_postgres_jsonb),
+    (4, "parked_progress", _0004_parked_progress),
+    (5, "scoring_question_ids", _0005_scoring_question_ids),
+    (6, "question_generation_runs", _0006_question_generation_runs),
+]
+
+
+def current_version(engine: Engine) -> int:
+    _meta.create_all(engine)
+    with engine.connect() as conn:
+        return conn.execute(select(schema_migrations.c.version).order_by(schema_migrations.c.version.desc())).scalar() or 0
+
+
+def run_migrations(engine: Engine) -> List[str]:
+    """Apply pending migrations in order; returns the names applied."""
+    applied = []
+    start = current_version(engine)
+    for version, name, migrate in MIGRATIONS:
+        if version <= start:
+            continue
+        with engine.begin() as conn:
+            migrate(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=version, name=name, applied_at=datetime.now(timezone.utc)
+            ))
+        applied.append(f"{version:04d}_{name}")
+    return applied
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, DateTime, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, DateTime, ForeignKey, Text, UniqueConstraint, LargeBinary, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
+# JSON documents: plain JSON text on SQLite, binary JSONB (indexable, containment queries) on PostgreSQL.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 class User(Base):
     __tablename__ = "users"
     
@@ -20,19 +24,45 @@ class User(Base):
 
 class Assessment(Base):
     __tablename__ = "assessments"
+    __table_args__ = (
+        Index("ix_assessments_user_skill_score", "user_id", "skill_name", "score"),
+        Index("ix_assessments_user_created", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     skill_name = Column(String, nullable=False)
     score = Column(Float, nullable=False)  # 0-10 normalized score
     level = Column(String, nullable=False)  # "Beginner", "Intermediate", "Advanced"
-    answers = Column(JSON, nullable=True)  # Store question-answer pairs
+    answers = Column(JSONDocument, nullable=True)  # Store question-answer pairs
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     user = relationship("User", back_populates="assessments")
 
+class AssessmentFeedback(Base):
+    """Narrative feedback for one assessment, written after the submit response."""
+    __tablename__ = "assessment_feedback"
+
+    assessment_id = Column(Integer, ForeignKey("assessments.id"), primary_key=True)
+    status = Column(String, nullable=False, default="pending")  # pending | ready
+    feedback = Column(Text, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    assessment = relationship("Assessment")
+
+class AssessmentScoring(Base):
+    """How an assessment's score was computed, so re-scoring can repeat it."""
+    __tablename__ = "assessment_scoring"
+
+    assessment_id = Column(Integer, ForeignKey("assessments.id"), primary_key=True)
+    method = Column(String, nullable=False)  # "full", "recert", "adaptive"
+    question_ids = Column(JSON(none_as_null=True), nullable=True)  # bank a "full" score was normalised over
+
 class SkillGap(Base):
     __tablename__ = "skill_gaps"
+    __table_args__ = (
+        Index("uq_skill_gap_user_skill", "user_id", "skill_name", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -46,19 +76,102 @@ class SkillGap(Base):
     user = relationship("User")
 
 class LearningPath(Base):
+    """Legacy per-skill path rows; copied into path_versions at startup and no longer written."""
     __tablename__ = "learning_paths"
+    __table_args__ = (
+        Index("ix_learning_paths_user_week", "user_id", "week_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     skill_name = Column(String, nullable=False)
     week_number = Column(Integer, nullable=False)
-    resources = Column(JSON, nullable=True)  # List of resources
+    resources = Column(JSONDocument, nullable=True)  # List of resources
     status = Column(String, default="pending")  # "pending", "in_progress", "completed"
     estimated_hours = Column(Float, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     user = relationship("User", back_populates="learning_paths")
 
+class PathVersion(Base):
+    """Immutable snapshot of a user's learning path; ActivePath points at the current one."""
+    __tablename__ = "path_versions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    source = Column(String, nullable=False, default="generate")  # "generate", "adapt", "legacy"
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    user = relationship("User")
+    weeks = relationship(
+        "PathWeek",
+        secondary="path_version_weeks",
+        order_by="PathWeek.week_number",
+        viewonly=True,
+    )
+
+
+class PathWeek(Base):
+    """One week's content. Shared by every version whose week is unchanged."""
+    __tablename__ = "path_weeks"
+    __table_args__ = (
+        UniqueConstraint("version_id", "week_number", name="uq_path_week_number"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    version_id = Column(Integer, ForeignKey("path_versions.id"), nullable=False)  # version that first wrote it
+    week_number = Column(Integer, nullable=False)
+    skill_name = Column(String, nullable=False)
+    skills = Column(JSON, nullable=False)  # every skill covered this week, skill_name first
+    estimated_hours = Column(Float, nullable=False)
+    is_revision = Column(Boolean, default=False, nullable=False)
+    explanation = Column(JSON, nullable=True)
+
+    resources = relationship(
+        "PathResource",
+        back_populates="week",
+        order_by="PathResource.position",
+        cascade="all, delete-orphan",
+    )
+
+
+class PathVersionWeek(Base):
+    __tablename__ = "path_version_weeks"
+    __table_args__ = (
+        UniqueConstraint("version_id", "week_number", name="uq_path_version_week"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    version_id = Column(Integer, ForeignKey("path_versions.id"), nullable=False)
+    week_number = Column(Integer, nullable=False)
+    week_id = Column(Integer, ForeignKey("path_weeks.id"), nullable=False, index=True)
+
+
+class ActivePath(Base):
+    __tablename__ = "active_paths"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    version_id = Column(Integer, ForeignKey("path_versions.id"), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class PathResource(Base):
+    __tablename__ = "path_resources"
+    __table_args__ = (
+        UniqueConstraint("week_id", "position", name="uq_path_resource_position"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    week_id = Column(Integer, ForeignKey("path_weeks.id"), nullable=False)
+    position = Column(Integer, nullable=False)  # resource_index used by progress and teach-back
+    title = Column(String, nullable=False)
+    type = Column(String, nullable=False, default="article")
+    url = Column(String, nullable=True)
+    estimated_hours = Column(Float, nullable=False, default=1.0)
+
+    week = relationship("PathWeek", back_populates="resources")
+
+
 class LearningProgress(Base):
     __tablename__ = "learning_progress"
     __table_args__ = (
@@ -74,8 +187,48 @@ class LearningProgress(Base):
     user = relationship("User")
 
 
+class ParkedProgress(Base):
+    """Completions on weeks that left the active path, keyed by PathWeek so
+    switching back to a version that contains the week restores them."""
+    __tablename__ = "parked_progress"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    week_id = Column(Integer, ForeignKey("path_weeks.id"), primary_key=True)
+    resource_index = Column(Integer, primary_key=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class LearningWeekProgress(Base):
+    """Per-week resource counters, kept in step with LearningProgress writes."""
+    __tablename__ = "learning_week_progress"
+    __table_args__ = (
+        UniqueConstraint("user_id", "week_number", name="uq_learning_week_progress"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    week_number = Column(Integer, nullable=False)
+    resource_count = Column(Integer, nullable=False, default=0)
+    completed_count = Column(Integer, nullable=False, default=0)
+    status = Column(String, nullable=False, default="pending")  # "pending", "in_progress", "completed"
+
+    user = relationship("User")
+
+
+class LearningProgressSummary(Base):
+    """Whole-path completion totals for one user (one row per user)."""
+    __tablename__ = "learning_progress_summary"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_resources = Column(Integer, nullable=False, default=0)
+    resources_completed = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    user = relationship("User")
+
+
 class UserActivity(Base):
-    """One calendar day of learning activity per user (streak heat map)."""
+    """Legacy one-row-per-day activity; folded into user_activity_years at startup and no longer written."""
     __tablename__ = "user_activity"
     __table_args__ = (
         UniqueConstraint("user_id", "activity_date", name="uq_user_activity_day"),
@@ -89,8 +242,56 @@ class UserActivity(Base):
     user = relationship("User")
 
 
+class UserActivityYear(Base):
+    """A user's active days in one calendar year as a 366-bit set (bit n = day-of-year n, 0-based)."""
+    __tablename__ = "user_activity_years"
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", name="uq_user_activity_year"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    year = Column(Integer, nullable=False)
+    bits = Column(LargeBinary, nullable=False)
+
+
+class UserStreak(Base):
+    """Running streak per user, advanced once per new activity day."""
+    __tablename__ = "user_streaks"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    current_count = Column(Integer, nullable=False, default=0)  # run ending at last_date
+    last_date = Column(String, nullable=True)  # YYYY-MM-DD
+    longest = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class SkillLastTouch(Base):
+    """Latest assessment or passed teach-back per user and skill; drives freshness."""
+    __tablename__ = "skill_last_touch"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    skill_name = Column(String, primary_key=True)
+    touched_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class RecertQueueItem(Base):
+    """An aging or stale skill staged for recert by the freshness batch job."""
+    __tablename__ = "recert_queue"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    skill_name = Column(String, primary_key=True)
+    status = Column(String, nullable=False)  # aging | stale
+    days_stale = Column(Integer, nullable=False)
+    question_ids = Column(JSON, nullable=False)  # pre-sampled recert set
+    scheduled_at = Column(DateTime(timezone=True), nullable=False)
+
+
 class TeachBack(Base):
     __tablename__ = "teachbacks"
+    __table_args__ = (
+        Index("ix_teachbacks_user_week_resource", "user_id", "week_number", "resource_index"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -108,6 +309,9 @@ class TeachBack(Base):
 
 class MCQQuestion(Base):
     __tablename__ = "mcq_questions"
+    __table_args__ = (
+        Index("ix_mcq_questions_skill", "skill_name"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     skill_name = Column(String, nullable=False)
@@ -118,13 +322,92 @@ class MCQQuestion(Base):
     explanation = Column(Text, nullable=True)
 
 
+class QuestionCandidate(Base):
+    """LLM-drafted question waiting for review before it joins mcq_questions."""
+    __tablename__ = "question_candidates"
+    __table_args__ = (
+        Index("ix_question_candidates_status_skill", "status", "skill_name"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    skill_name = Column(String, nullable=False, index=True)
+    question_text = Column(Text, nullable=False)
+    options = Column(JSON, nullable=False)
+    correct_answer = Column(Integer, nullable=False)
+    difficulty = Column(Integer, nullable=False)
+    explanation = Column(Text, nullable=True)
+    content_hash = Column(String, nullable=False, unique=True)
+    status = Column(String, nullable=False, default="pending")  # pending | approved | rejected
+    career_goal = Column(String, nullable=True)  # goal whose requirements surfaced the skill
+    question_id = Column(Integer, ForeignKey("mcq_questions.id"), nullable=True)  # set on approval
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    reviewed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class QuestionGenerationRun(Base):
+    """One background drafting run started from the admin API; polled by id."""
+    __tablename__ = "question_generation_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String, nullable=False, default="running")  # running | done | failed
+    report = Column(JSON, nullable=True)  # QuestionGenerationReport once done, {"error": ...} if failed
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class QuestionBankVersion(Base):
+    """Single-row counter bumped whenever mcq_questions is seeded or imported."""
+    __tablename__ = "question_bank_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class QuestionCalibration(Base):
+    """Running item statistics and calibrated parameters for one MCQ question.
+
+    The sums are sufficient statistics, so incremental runs add to them
+    instead of rescanning every stored answer.
+    """
+    __tablename__ = "question_calibration"
+
+    question_id = Column(Integer, ForeignKey("mcq_questions.id"), primary_key=True)
+    responses = Column(Integer, nullable=False, default=0)
+    sum_correct = Column(Float, nullable=False, default=0.0)
+    sum_rest = Column(Float, nullable=False, default=0.0)  # rest score: accuracy on the other items answered
+    sum_rest_sq = Column(Float, nullable=False, default=0.0)
+    sum_correct_rest = Column(Float, nullable=False, default=0.0)
+    p_value = Column(Float, nullable=True)
+    discrimination = Column(Float, nullable=True)  # point-biserial
+    irt_a = Column(Float, nullable=True)
+    irt_b = Column(Float, nullable=True)
+    weight = Column(Float, nullable=True)  # scoring weight on the 1-5 difficulty scale
+    version = Column(Integer, nullable=False, default=0)
+
+
+class CalibrationRun(Base):
+    __tablename__ = "calibration_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    version = Column(Integer, nullable=False)
+    mode = Column(String, nullable=False)  # "full" or "incremental"
+    last_assessment_id = Column(Integer, nullable=False, default=0)
+    assessments_read = Column(Integer, nullable=False, default=0)
+    answers_read = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class ReadinessReport(Base):
     __tablename__ = "readiness_reports"
+    __table_args__ = (
+        Index("ix_readiness_reports_user_created", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     share_token = Column(String, unique=True, index=True, nullable=False)
-    snapshot = Column(JSON, nullable=False)
+    snapshot = Column(JSONDocument, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -133,6 +416,9 @@ class ReadinessReport(Base):
 
 class CoachMessage(Base):
     __tablename__ = "coach_messages"
+    __table_args__ = (
+        Index("ix_coach_messages_user_created", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -153,7 +439,7 @@ class WeeklyPlan(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     week_start = Column(String, nullable=False)  # YYYY-MM-DD (Monday)
     focus = Column(Text, nullable=False)
-    plan_items = Column(JSON, nullable=False)  # [{skill, hours, action}]
+    plan_items = Column(JSONDocument, nullable=False)  # [{skill, hours, action}]
     check_in = Column(Text, nullable=False)
     next_step = Column(Text, nullable=False)
     generated_at = Column(DateTime(timezone=True), server_default=func.now())
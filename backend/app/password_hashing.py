@@ -0,0 +1,94 @@
+"""bcrypt off the request threads.
+
+Hashing and checking run in a process pool sized to the machine's cores, so
+a burst of logins queues on the pool instead of tying up the threadpool
+every other sync route runs on. The cost factor is configurable
+(BCRYPT_ROUNDS); hashes made with another cost are upgraded on the next
+successful login. Kept free of app imports so spawned workers start fast.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import bcrypt
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0")) or os.cpu_count() or 1
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _bytes(value) -> bytes:
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    return bcrypt.hashpw(_bytes(password), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def check_password(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(_bytes(password), _bytes(hashed))
+
+
+def hash_rounds(hashed: str) -> Optional[int]:
+    """Cost factor of a "$2b$12$..." hash."""
+    try:
+        return int(hashed.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def needs_rehash(hashed: str) -> bool:
+    return hash_rounds(hashed) != BCRYPT_ROUNDS
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the API process already runs threads. Scripts that
+            # hash through the pool need an `if __name__ == "__main__"` guard.
+            _pool = ProcessPoolExecutor(max_workers=HASH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _replace_broken(pool: ProcessPoolExecutor) -> None:
+    """Drop `pool` after a worker died; the next call starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run(fn, *args):
+    loop = asyncio.get_running_loop()
+    pool = _executor()
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # A worker was killed (OOM, segfault); without this every later call fails too.
+        _replace_broken(pool)
+        return await loop.run_in_executor(_executor(), fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run(hash_password, password, BCRYPT_ROUNDS)
+
+
+async def check_password_async(password: str, hashed: str) -> bool:
+    return await _run(check_password, password, hashed)
+
+
+def shutdown_hashing() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
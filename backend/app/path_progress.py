@@ -1,39 +1,224 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy import case
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models import LearningPath, LearningProgress
+from app.models import (
+    ActivePath,
+    LearningProgress,
+    LearningProgressSummary,
+    LearningWeekProgress,
+    ParkedProgress,
+    PathVersionWeek,
+    PathWeek,
+)
+from app.path_store import RESOURCE_LIMIT, active_version_id, diff_versions, load_path_weeks, set_active_version
 
-RESOURCE_LIMIT = 10
 
+def week_status_for(resource_count: int, completed_count: int, fallback: str = "pending") -> str:
+    if resource_count == 0:
+        return fallback
+    if completed_count <= 0:
+        return "pending"
+    if completed_count >= resource_count:
+        return "completed"
+    return "in_progress"
 
-def compute_path_completion(db: Session, user_id: int) -> dict:
-    learning_paths = db.query(LearningPath).filter(LearningPath.user_id == user_id).all()
-    if not learning_paths:
-        return {
-            "path_completion_pct": 0.0,
-            "resources_completed": 0,
-            "total_resources": 0,
-        }
 
-    weeks_dict: dict = {}
-    for lp in learning_paths:
-        week_num = lp.week_number
-        if week_num not in weeks_dict:
-            weeks_dict[week_num] = {"resources": []}
-        weeks_dict[week_num]["resources"].extend(lp.resources or [])
+def rebuild_progress_counters(db: Session, user_id: int, weeks: Optional[List[PathWeek]] = None) -> LearningProgressSummary:
+    """Recount a user's week and path counters from scratch.
 
-    completed_rows = db.query(LearningProgress).filter(LearningProgress.user_id == user_id).all()
-    completed = {(r.week_number, r.resource_index) for r in completed_rows}
+    Called when the path itself is (re)written; toggles use `apply_progress_delta`.
+    """
+    if weeks is None:
+        weeks = load_path_weeks(db, user_id)
+    completed = {
+        (row.week_number, row.resource_index)
+        for row in db.query(LearningProgress.week_number, LearningProgress.resource_index)
+        .filter(LearningProgress.user_id == user_id)
+        .all()
+    }
 
+    db.query(LearningWeekProgress).filter(LearningWeekProgress.user_id == user_id).delete()
     total_resources = 0
     resources_completed = 0
-    for week_num, week_data in weeks_dict.items():
-        resource_count = min(len(week_data["resources"]), RESOURCE_LIMIT)
+    for week in weeks:
+        week_num = week.week_number
+        resource_count = min(len(week.resources), RESOURCE_LIMIT)
+        week_completed = sum(1 for idx in range(resource_count) if (week_num, idx) in completed)
         total_resources += resource_count
-        resources_completed += sum(
-            1 for idx in range(resource_count) if (week_num, idx) in completed
+        resources_completed += week_completed
+        db.add(LearningWeekProgress(
+            user_id=user_id,
+            week_number=week_num,
+            resource_count=resource_count,
+            completed_count=week_completed,
+            status=week_status_for(resource_count, week_completed),
+        ))
+
+    summary = db.get(LearningProgressSummary, user_id)
+    if summary is None:
+        summary = LearningProgressSummary(user_id=user_id)
+        db.add(summary)
+    summary.total_resources = total_resources
+    summary.resources_completed = resources_completed
+    db.flush()
+    return summary
+
+
+def _version_week_ids(db: Session, version_id: int) -> Dict[int, int]:
+    """week_number -> PathWeek id for one version."""
+    return dict(
+        db.query(PathVersionWeek.week_number, PathVersionWeek.week_id)
+        .filter(PathVersionWeek.version_id == version_id)
+        .all()
+    )
+
+
+def _park_progress(db: Session, user_id: int, week_ids: Dict[int, int]) -> None:
+    """Move live completions on these week numbers aside, keyed by their PathWeek."""
+    rows = (
+        db.query(LearningProgress)
+        .filter(LearningProgress.user_id == user_id, LearningProgress.week_number.in_(list(week_ids)))
+        .all()
+    )
+    db.query(ParkedProgress).filter(
+        ParkedProgress.user_id == user_id,
+        ParkedProgress.week_id.in_(list(week_ids.values())),
+    ).delete(synchronize_session=False)
+    for row in rows:
+        db.add(ParkedProgress(
+            user_id=user_id,
+            week_id=week_ids[row.week_number],
+            resource_index=row.resource_index,
+            completed_at=row.completed_at,
+        ))
+        db.delete(row)
+
+
+def _restore_progress(db: Session, user_id: int, week_ids: Dict[int, int]) -> None:
+    """Bring back completions parked on these PathWeeks at their week numbers."""
+    numbers = {week_id: week_number for week_number, week_id in week_ids.items()}
+    parked = (
+        db.query(ParkedProgress)
+        .filter(ParkedProgress.user_id == user_id, ParkedProgress.week_id.in_(list(numbers)))
+        .all()
+    )
+    for row in parked:
+        db.add(LearningProgress(
+            user_id=user_id,
+            week_number=numbers[row.week_id],
+            resource_index=row.resource_index,
+            completed_at=row.completed_at,
+        ))
+        db.delete(row)
+
+
+def activate_path_version(db: Session, user_id: int, version_id: int) -> LearningProgressSummary:
+    """Point the user at `version_id`, keeping progress on weeks that did not change.
+
+    Progress on changed weeks is parked against the outgoing weeks and comes
+    back if a version containing them is activated again.
+    """
+    previous = active_version_id(db, user_id)
+    if previous is not None and previous != version_id:
+        changed = [
+            item["week_number"]
+            for item in diff_versions(db, previous, version_id)
+            if item["change"] != "unchanged"
+        ]
+        if changed:
+            outgoing = _version_week_ids(db, previous)
+            incoming = _version_week_ids(db, version_id)
+            _park_progress(db, user_id, {n: outgoing[n] for n in changed if n in outgoing})
+            db.flush()  # live rows for these weeks are gone before restored ones are inserted
+            _restore_progress(db, user_id, {n: incoming[n] for n in changed if n in incoming})
+    set_active_version(db, user_id, version_id)
+    db.flush()
+    return rebuild_progress_counters(db, user_id)
+
+
+def get_week_progress(db: Session, user_id: int, week_number: int) -> Optional[LearningWeekProgress]:
+    return (
+        db.query(LearningWeekProgress)
+        .filter(LearningWeekProgress.user_id == user_id, LearningWeekProgress.week_number == week_number)
+        .first()
+    )
+
+
+def apply_progress_delta(db: Session, user_id: int, week_number: int, resource_index: int, delta: int) -> None:
+    """Fold one LearningProgress insert (+1) or delete (-1) into the counters.
+
+    Two single-row UPDATEs in the caller's transaction; indices past the
+    week's visible resources never counted toward completion, so they are skipped.
+    """
+    new_count = LearningWeekProgress.completed_count + delta
+    updated = (
+        db.query(LearningWeekProgress)
+        .filter(
+            LearningWeekProgress.user_id == user_id,
+            LearningWeekProgress.week_number == week_number,
+            LearningWeekProgress.resource_count > resource_index,
+        )
+        .update(
+            {
+                LearningWeekProgress.completed_count: new_count,
+                LearningWeekProgress.status: case(
+                    (LearningWeekProgress.resource_count == 0, LearningWeekProgress.status),
+                    (new_count <= 0, "pending"),
+                    (new_count >= LearningWeekProgress.resource_count, "completed"),
+                    else_="in_progress",
+                ),
+            },
+            synchronize_session=False,
         )
+    )
+    if updated:
+        db.query(LearningProgressSummary).filter(LearningProgressSummary.user_id == user_id).update(
+            {LearningProgressSummary.resources_completed: LearningProgressSummary.resources_completed + delta},
+            synchronize_session=False,
+        )
+
+
+def load_progress_summary(db: Session, user_id: int) -> Optional[LearningProgressSummary]:
+    """The user's summary row; None when they have no active path."""
+    return db.get(LearningProgressSummary, user_id)
+
+
+def migrate_progress_counters(db: Session) -> int:
+    """Build counters once for active paths that predate them, so reads never write."""
+    user_ids = [
+        row[0]
+        for row in db.query(ActivePath.user_id)
+        .filter(~ActivePath.user_id.in_(db.query(LearningProgressSummary.user_id)))
+        .all()
+    ]
+    for user_id in user_ids:
+        rebuild_progress_counters(db, user_id)
+    db.commit()
+    return len(user_ids)
+
+
+def compute_path_completion(db: Session, user_id: int) -> dict:
+    return _completion(load_progress_summary(db, user_id))
+
+
+async def load_progress_summary_async(db: AsyncSession, user_id: int) -> Optional[LearningProgressSummary]:
+    return await db.get(LearningProgressSummary, user_id)
+
+
+def _completion(summary: Optional[LearningProgressSummary]) -> dict:
+    if summary is None or not summary.total_resources:
+        return {
+            "path_completion_pct": 0.0,
+            "resources_completed": summary.resources_completed if summary else 0,
+            "total_resources": 0,
+        }
 
-    overall_pct = round((resources_completed / total_resources) * 100, 1) if total_resources else 0.0
+    total_resources = summary.total_resources
+    resources_completed = summary.resources_completed
+    overall_pct = round((resources_completed / total_resources) * 100, 1)
     return {
         "path_completion_pct": overall_pct,
         "resources_completed": resources_completed,
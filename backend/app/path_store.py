@@ -0,0 +1,290 @@
+"""Normalized learning-path storage: path version -> weeks -> resources.
+
+Versions are immutable. A new version links to its parent's week rows when a
+week is unchanged, and `active_paths` holds the single pointer that decides
+which version a user sees. Resources are sanitized once on write, so reads
+are plain indexed joins with no regrouping or deduping in Python.
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.models import ActivePath, LearningPath, PathResource, PathVersion, PathVersionWeek, PathWeek
+from app.ai.learning_path_engine import sanitize_week_resources
+
+RESOURCE_LIMIT = 10
+WEEK_RESOURCE_LIMIT = min(RESOURCE_LIMIT, 3)
+
+
+def ensure_week_resources(resources: list, skill_name: str) -> list:
+    return sanitize_week_resources(skill_name, resources, limit=WEEK_RESOURCE_LIMIT)
+
+
+def active_version_id(db: Session, user_id: int) -> Optional[int]:
+    pointer = db.get(ActivePath, user_id)
+    return pointer.version_id if pointer else None
+
+
+def get_version(db: Session, user_id: int, version_id: int) -> Optional[PathVersion]:
+    return (
+        db.query(PathVersion)
+        .filter(PathVersion.id == version_id, PathVersion.user_id == user_id)
+        .first()
+    )
+
+
+def list_versions(db: Session, user_id: int) -> List[PathVersion]:
+    return (
+        db.query(PathVersion)
+        .filter(PathVersion.user_id == user_id)
+        .order_by(PathVersion.id.desc())
+        .all()
+    )
+
+
+def load_version_weeks(db: Session, version_id: int) -> List[PathWeek]:
+    return (
+        db.query(PathWeek)
+        .join(PathVersionWeek, PathVersionWeek.week_id == PathWeek.id)
+        .options(joinedload(PathWeek.resources))
+        .filter(PathVersionWeek.version_id == version_id)
+        .order_by(PathVersionWeek.week_number)
+        .all()
+    )
+
+
+def load_path_weeks(db: Session, user_id: int) -> List[PathWeek]:
+    """Weeks of the user's active path with resources, ordered by week number."""
+    version_id = active_version_id(db, user_id)
+    if version_id is None:
+        return []
+    return load_version_weeks(db, version_id)
+
+
+def get_path_week(db: Session, user_id: int, week_number: int) -> Optional[PathWeek]:
+    version_id = active_version_id(db, user_id)
+    if version_id is None:
+        return None
+    return (
+        db.query(PathWeek)
+        .join(PathVersionWeek, PathVersionWeek.week_id == PathWeek.id)
+        .options(joinedload(PathWeek.resources))
+        .filter(PathVersionWeek.version_id == version_id, PathVersionWeek.week_number == week_number)
+        .first()
+    )
+
+
+def resource_to_dict(resource: PathResource) -> dict:
+    return {
+        "id": resource.id,
+        "title": resource.title,
+        "type": resource.type,
+        "url": resource.url,
+        "estimated_hours": resource.estimated_hours,
+    }
+
+
+def week_to_dict(week: PathWeek) -> dict:
+    return {
+        "week_number": week.week_number,
+        "skill_name": week.skill_name,
+        "skills": list(week.skills or [week.skill_name]),
+        "resources": [resource_to_dict(r) for r in week.resources],
+        "estimated_hours": week.estimated_hours,
+        "is_revision": bool(week.is_revision),
+        "explanation": list(week.explanation or []),
+    }
+
+
+def _normalize_week(week_data: dict) -> dict:
+    skills = [s for s in (week_data.get("skills") or []) if s] or [week_data.get("skill_name") or "Skill"]
+    skill_name = week_data.get("skill_name") or skills[0]
+    resources = ensure_week_resources(week_data.get("resources") or [], skill_name)
+    return {
+        "week_number": week_data["week_number"],
+        "skill_name": skill_name,
+        "skills": skills,
+        "resources": [
+            {
+                "title": r["title"],
+                "type": r.get("type") or "article",
+                "url": r.get("url"),
+                "estimated_hours": float(r.get("estimated_hours") or 1.0),
+            }
+            for r in resources[:RESOURCE_LIMIT]
+        ],
+        "estimated_hours": float(week_data.get("estimated_hours") or 0.0),
+        "is_revision": bool(week_data.get("is_revision", False)),
+        "explanation": list(week_data.get("explanation") or [])[:2],
+    }
+
+
+def week_fingerprint(week: dict) -> tuple:
+    """Content identity of a normalized week dict; resource ids are ignored."""
+    return (
+        week["week_number"],
+        week["skill_name"],
+        tuple(week["skills"]),
+        round(float(week["estimated_hours"]), 2),
+        bool(week["is_revision"]),
+        tuple(week["explanation"]),
+        tuple(
+            (r["title"], r["type"], r["url"], round(float(r["estimated_hours"]), 2))
+            for r in week["resources"]
+        ),
+    )
+
+
+def _build_week(version_id: int, week: dict) -> PathWeek:
+    row = PathWeek(
+        version_id=version_id,
+        week_number=week["week_number"],
+        skill_name=week["skill_name"],
+        skills=week["skills"],
+        estimated_hours=week["estimated_hours"],
+        is_revision=week["is_revision"],
+        explanation=week["explanation"],
+    )
+    row.resources = [
+        PathResource(position=position, **resource)
+        for position, resource in enumerate(week["resources"])
+    ]
+    return row
+
+
+def set_active_version(db: Session, user_id: int, version_id: int) -> None:
+    pointer = db.get(ActivePath, user_id)
+    if pointer is None:
+        db.add(ActivePath(user_id=user_id, version_id=version_id))
+    else:
+        pointer.version_id = version_id
+
+
+def write_path_version(db: Session, user_id: int, weeks: List[dict], source: str) -> PathVersion:
+    """Write a new immutable version from engine week dicts, sharing unchanged weeks.
+
+    The new version is not activated; callers switch the pointer so progress
+    can be reconciled against the outgoing version first.
+    """
+    parent_id = active_version_id(db, user_id)
+    parent_weeks = {
+        w.week_number: w
+        for w in (load_version_weeks(db, parent_id) if parent_id is not None else [])
+    }
+
+    version = PathVersion(user_id=user_id, source=source)
+    db.add(version)
+    db.flush()
+
+    for week_data in weeks:
+        week = _normalize_week(week_data)
+        parent = parent_weeks.get(week["week_number"])
+        if parent is not None and week_fingerprint(week_to_dict(parent)) == week_fingerprint(week):
+            week_id = parent.id
+        else:
+            row = _build_week(version.id, week)
+            db.add(row)
+            db.flush()
+            week_id = row.id
+        db.add(PathVersionWeek(version_id=version.id, week_number=week["week_number"], week_id=week_id))
+
+    db.flush()
+    return version
+
+
+def diff_versions(db: Session, from_version_id: Optional[int], to_version_id: int) -> List[dict]:
+    """Week-by-week comparison of two versions, keyed by week number."""
+    before = {
+        w.week_number: w
+        for w in (load_version_weeks(db, from_version_id) if from_version_id is not None else [])
+    }
+    after = {w.week_number: w for w in load_version_weeks(db, to_version_id)}
+
+    changes = []
+    for week_number in sorted(set(before) | set(after)):
+        old, new = before.get(week_number), after.get(week_number)
+        if old is None:
+            change = "added"
+        elif new is None:
+            change = "removed"
+        elif old.id == new.id or week_fingerprint(week_to_dict(old)) == week_fingerprint(week_to_dict(new)):
+            change = "unchanged"
+        else:
+            change = "changed"
+        changes.append({
+            "week_number": week_number,
+            "change": change,
+            "from_skill": old.skill_name if old is not None else None,
+            "to_skill": new.skill_name if new is not None else None,
+            "from_hours": old.estimated_hours if old is not None else None,
+            "to_hours": new.estimated_hours if new is not None else None,
+        })
+    return changes
+
+
+def _group_legacy_rows(rows: List[LearningPath]) -> List[dict]:
+    weeks: Dict[int, dict] = {}
+    for row in rows:
+        week = weeks.setdefault(row.week_number, {
+            "week_number": row.week_number,
+            "skills": [],
+            "resources": [],
+            "estimated_hours": 0.0,
+        })
+        if row.skill_name not in week["skills"]:
+            week["skills"].append(row.skill_name)
+        week["resources"].extend(row.resources or [])
+        week["estimated_hours"] += row.estimated_hours or 0.0
+    for week in weeks.values():
+        week["skill_name"] = week["skills"][0] if week["skills"] else "Skill"
+    return [weeks[n] for n in sorted(weeks)]
+
+
+def migrate_path_storage(db: Session) -> int:
+    """Bring older path data up to the versioned layout.
+
+    Copies legacy learning_paths rows into versions, links weeks of versions
+    written before weeks were shared, and points each user at their newest
+    version when no pointer exists yet.
+    """
+    user_ids = [
+        row[0]
+        for row in db.query(LearningPath.user_id)
+        .filter(~LearningPath.user_id.in_(db.query(PathVersion.user_id)))
+        .distinct()
+        .all()
+    ]
+    for user_id in user_ids:
+        rows = (
+            db.query(LearningPath)
+            .filter(LearningPath.user_id == user_id)
+            .order_by(LearningPath.week_number, LearningPath.id)
+            .all()
+        )
+        version = write_path_version(db, user_id, _group_legacy_rows(rows), source="legacy")
+        set_active_version(db, user_id, version.id)
+        db.query(LearningPath).filter(LearningPath.user_id == user_id).delete()
+
+    unlinked = (
+        db.query(PathWeek.id, PathWeek.version_id, PathWeek.week_number)
+        .filter(~PathWeek.id.in_(db.query(PathVersionWeek.week_id)))
+        .all()
+    )
+    for week_id, version_id, week_number in unlinked:
+        db.add(PathVersionWeek(version_id=version_id, week_number=week_number, week_id=week_id))
+
+    unpointed = (
+        db.query(PathVersion.user_id, PathVersion.id)
+        .filter(~PathVersion.user_id.in_(db.query(ActivePath.user_id)))
+        .order_by(PathVersion.user_id, PathVersion.id)
+        .all()
+    )
+    # Legacy users were pointed above; those pointers are not flushed yet, so skip them here.
+    migrated = set(user_ids)
+    newest = {user_id: version_id for user_id, version_id in unpointed if user_id not in migrated}
+    for user_id, version_id in newest.items():
+        db.add(ActivePath(user_id=user_id, version_id=version_id))
+
+    db.commit()
+    return len(user_ids) + len(unlinked) + len(newest)
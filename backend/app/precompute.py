@@ -0,0 +1,153 @@
+"""Speculative recomputation after assessment writes.
+
+Submitting an assessment is almost always followed by a dashboard load and a
+"generate path" click, both of which wait on the LLM. `schedule_precompute`
+queues the user on a single background worker that warms career requirements,
+stores the user's skill gaps, creates this week's plan if it is missing, and
+builds a candidate learning path. The dashboard itself only reads, so this job
+is where those rows get written. `/api/learning-path/generate` uses the candidate only while
+career goal, hours and skill scores still match what it was built from.
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, List, Optional
+
+from app.database import SessionLocal
+from app.models import SkillGap, User
+from app.ai.gap_analyzer import calculate_skill_gaps
+from app.ai.learning_path_engine import generate_learning_path
+from app.ai.weekly_plan import generate_weekly_plan, monday_of
+from app.freshness import compute_freshness
+from app.path_progress import path_summary
+from app.skill_scores import best_scores
+
+logger = logging.getLogger(__name__)
+
+PRECOMPUTE_ENABLED = os.getenv("PRECOMPUTE_ENABLED", "1") != "0"
+MAX_CANDIDATES = 512
+
+_queue: "queue.Queue[int]" = queue.Queue()
+_pending: set[int] = set()
+_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+_candidates: "OrderedDict[int, tuple]" = OrderedDict()
+
+
+def inputs_key(career_goal: Optional[str], hours_per_week: Optional[int], user_skills: Dict[str, float]) -> tuple:
+    return (
+        career_goal,
+        int(hours_per_week or 0),
+        tuple(sorted((k, round(float(v), 2)) for k, v in (user_skills or {}).items())),
+    )
+
+
+def take_candidate_path(
+    user_id: int,
+    career_goal: Optional[str],
+    hours_per_week: Optional[int],
+    user_skills: Dict[str, float],
+) -> Optional[List[dict]]:
+    """Pop the precomputed path if it was built from the same inputs."""
+    with _lock:
+        entry = _candidates.pop(user_id, None)
+    if not entry:
+        return None
+    key, weeks = entry
+    if key != inputs_key(career_goal, hours_per_week, user_skills):
+        return None
+    return weeks
+
+
+def _store_candidate(user_id: int, key: tuple, weeks: List[dict]) -> None:
+    with _lock:
+        _candidates[user_id] = (key, weeks)
+        _candidates.move_to_end(user_id)
+        while len(_candidates) > MAX_CANDIDATES:
+            _candidates.popitem(last=False)
+
+
+def invalidate_candidate(user_id: int) -> None:
+    with _lock:
+        _candidates.pop(user_id, None)
+
+
+def store_skill_gaps(db, user_id: int, gaps: List[dict]) -> None:
+    """Upsert the user's skill_gaps rows from freshly computed gaps."""
+    existing = {row.skill_name: row for row in db.query(SkillGap).filter(SkillGap.user_id == user_id)}
+    for gap in gaps:
+        row = existing.get(gap["skill_name"])
+        if row is None:
+            row = SkillGap(user_id=user_id, skill_name=gap["skill_name"])
+            db.add(row)
+        row.current_level = gap["current_level"]
+        row.target_level = gap["target_level"]
+        row.gap = gap["gap"]
+        row.priority = gap["priority"]
+
+
+def _precompute(user_id: int) -> None:
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        if user is None:
+            return
+        user_skills = best_scores(db, user_id)
+        gaps = calculate_skill_gaps(user_skills, user.career_goal) if user.career_goal else []
+        if gaps:
+            store_skill_gaps(db, user_id, gaps)
+            db.commit()
+
+        if user.career_goal or user_skills:
+            freshness = compute_freshness(db, user_id, user_skills)
+            stale = [f["skill_name"] for f in freshness if f.get("status") == "stale"]
+            generate_weekly_plan(
+                db,
+                user,
+                user_skills,
+                gaps,
+                path_summary(db, user_id),
+                stale,
+                monday_of(date.today()),
+            )
+            db.commit()
+
+        if user.career_goal and gaps:
+            key = inputs_key(user.career_goal, user.hours_per_week, user_skills)
+            weeks = generate_learning_path(gaps, user.hours_per_week)
+            if weeks:
+                _store_candidate(user_id, key, weeks)
+    except Exception:
+        db.rollback()
+        logger.exception("Precompute failed for user %s", user_id)
+    finally:
+        db.close()
+
+
+def _run() -> None:
+    while True:
+        user_id = _queue.get()
+        with _lock:
+            _pending.discard(user_id)
+        _precompute(user_id)
+        _queue.task_done()
+
+
+def schedule_precompute(user_id: int) -> None:
+    """Queue a background refresh for the user; repeated calls coalesce."""
+    global _worker
+    if not PRECOMPUTE_ENABLED:
+        return
+    invalidate_candidate(user_id)
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="skillsync-precompute", daemon=True)
+            _worker.start()
+        if user_id in _pending:
+            return
+        _pending.add(user_id)
+    _queue.put(user_id)
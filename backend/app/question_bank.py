@@ -0,0 +1,138 @@
+"""In-memory MCQ question bank.
+
+The bank is read-mostly: it changes only when questions are seeded or
+imported, and both bump `question_bank_version`. Questions are loaded once
+into compact per-skill tuples so fetching and scoring never touch the DB.
+Other processes (seed script, another worker) are picked up by re-reading
+the version row at most every `RECHECK_SECONDS`.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models import MCQQuestion, QuestionBankVersion, QuestionCalibration
+
+RECHECK_SECONDS = float(os.getenv("QUESTION_BANK_RECHECK_SECONDS", "30"))
+
+
+@dataclass(frozen=True)
+class SkillQuestions:
+    ids: Tuple[int, ...]
+    correct_answers: Tuple[int, ...]
+    difficulties: Tuple[int, ...]
+    payloads: Tuple[dict, ...]  # MCQQuestionResponse-shaped dicts
+    positions: Dict[int, int] = field(default_factory=dict)
+    weights: Dict[int, float] = field(default_factory=dict)  # calibrated scoring weights only
+    irt: Dict[int, Tuple[float, float]] = field(default_factory=dict)  # calibrated (a, b) only
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def payload(self, question_id: int) -> dict:
+        return self.payloads[self.positions[question_id]]
+
+    def scoring_rows(self, question_ids: Optional[List[int]] = None) -> List[dict]:
+        """`calculate_skill_score` input for all questions or the given ids (unknown ids skipped)."""
+        if question_ids is None:
+            indices = range(len(self.ids))
+        else:
+            indices = [self.positions[qid] for qid in question_ids if qid in self.positions]
+        rows = []
+        for i in indices:
+            row = {"id": self.ids[i], "correct_answer": self.correct_answers[i], "difficulty": self.difficulties[i]}
+            if self.ids[i] in self.irt:
+                row["irt"] = self.irt[self.ids[i]]
+            rows.append(row)
+        return rows
+
+
+@dataclass(frozen=True)
+class QuestionBank:
+    version: int
+    skills: Dict[str, SkillQuestions]
+
+    def get(self, skill_name: str) -> Optional[SkillQuestions]:
+        return self.skills.get(skill_name)
+
+    def counts(self) -> Dict[str, int]:
+        return {name: len(skill) for name, skill in self.skills.items()}
+
+
+_lock = threading.Lock()
+_bank: Optional[QuestionBank] = None
+_checked_at = 0.0
+
+
+def current_bank_version(db: Session) -> int:
+    row = db.get(QuestionBankVersion, 1)
+    return row.version if row else 0
+
+
+def bump_bank_version(db: Session) -> int:
+    """Mark the bank as changed; call in the same transaction that edits questions."""
+    global _checked_at
+    row = db.get(QuestionBankVersion, 1)
+    if row is None:
+        row = QuestionBankVersion(id=1, version=0)
+        db.add(row)
+    row.version = (row.version or 0) + 1
+    db.flush()
+    with _lock:
+        _checked_at = 0.0
+    return row.version
+
+
+def _load(db: Session, version: int) -> QuestionBank:
+    calibrated = {
+        row.question_id: row
+        for row in db.query(QuestionCalibration).filter(QuestionCalibration.weight.isnot(None)).all()
+    }
+    grouped: Dict[str, list] = {}
+    for q in db.query(MCQQuestion).order_by(MCQQuestion.id).all():
+        grouped.setdefault(q.skill_name, []).append(q)
+
+    skills = {}
+    for skill_name, questions in grouped.items():
+        skills[skill_name] = SkillQuestions(
+            ids=tuple(q.id for q in questions),
+            correct_answers=tuple(q.correct_answer for q in questions),
+            difficulties=tuple(q.difficulty for q in questions),
+            payloads=tuple(
+                {
+                    "id": q.id,
+                    "skill_name": q.skill_name,
+                    "question_text": q.question_text,
+                    "options": [{"id": idx, "text": text} for idx, text in enumerate(q.options)],
+                    "difficulty": q.difficulty,
+                }
+                for q in questions
+            ),
+            positions={q.id: i for i, q in enumerate(questions)},
+            weights={q.id: calibrated[q.id].weight for q in questions if q.id in calibrated},
+            irt={q.id: (calibrated[q.id].irt_a, calibrated[q.id].irt_b) for q in questions if q.id in calibrated},
+        )
+    return QuestionBank(version=version, skills=skills)
+
+
+def get_question_bank(db: Session) -> QuestionBank:
+    """Return the cached bank, reloading only when the version row has moved."""
+    global _bank, _checked_at
+    now = time.monotonic()
+    with _lock:
+        bank = _bank
+        if bank is not None and now - _checked_at < RECHECK_SECONDS:
+            return bank
+
+    version = current_bank_version(db)
+    if bank is None or bank.version != version:
+        bank = _load(db, version)
+    with _lock:
+        if _bank is None or _bank.version <= bank.version:
+            _bank = bank
+        _checked_at = now
+        return _bank
@@ -0,0 +1,255 @@
+"""Grow the question bank ahead of demand.
+
+Career requirements come from the LLM and can name skills the bank has no
+questions for, so `/questions/{skill}` 404s and the gap never gets assessed.
+`generate_candidates` collects the required skills across every user's
+career goal, drafts questions for the uncovered ones concurrently (rate
+limited), dedupes them by content hash and parks them in
+`question_candidates`. Approving a candidate copies it into `mcq_questions`.
+
+A run can take minutes under the rate limit, so the admin API only starts
+one (`start_generation_run`) and drafts in a background task; candidates
+are committed skill by skill and the run row carries the final report.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import MCQQuestion, QuestionCandidate, QuestionGenerationRun, User
+from app.question_bank import bump_bank_version, get_question_bank
+from app.question_import import content_hash
+from app.schemas import MCQQuestionImport
+from app.ai.gap_analyzer import get_career_requirements, peek_cached_requirements
+from app.ai.question_generator import generate_questions
+
+MIN_BANK_QUESTIONS = 3
+QUESTIONS_PER_SKILL = 6
+# A run still "running" after this long died with its worker; a new one may start.
+RUN_TIMEOUT = timedelta(hours=1)
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Spaces calls at least `60 / per_minute` seconds apart across threads."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _requirements_by_goal(
+    goals: List[str],
+    limiter: RateLimiter,
+    pool: ThreadPoolExecutor,
+    failed: List[dict],
+) -> Dict[str, dict]:
+    """Career requirements for each goal, fetched concurrently under `limiter`.
+
+    A goal whose lookup fails is recorded in `failed` and skipped.
+    """
+    def fetch(goal: str) -> dict:
+        if peek_cached_requirements(goal) is None:
+            limiter.wait()
+        return get_career_requirements(goal)
+
+    futures = {pool.submit(fetch, goal): goal for goal in goals}
+    requirements: Dict[str, dict] = {}
+    for future in as_completed(futures):
+        goal = futures[future]
+        try:
+            requirements[goal] = future.result()
+        except Exception as exc:
+            failed.append({"career_goal": goal, "error": str(getattr(exc, "detail", exc))})
+    return requirements
+
+
+def find_uncovered_skills(
+    db: Session,
+    limiter: Optional[RateLimiter] = None,
+    pool: Optional[ThreadPoolExecutor] = None,
+    failed: Optional[List[dict]] = None,
+    per_minute: float = 30.0,
+    max_workers: int = 4,
+) -> Dict[str, str]:
+    """Required skill -> a career goal needing it, for skills short of questions.
+
+    Pass the limiter and pool of a generation run so requirement lookups share
+    its LLM budget; otherwise a local pair is built from per_minute / max_workers.
+    """
+    if pool is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as local_pool:
+            return find_uncovered_skills(db, limiter, local_pool, failed, per_minute, max_workers)
+    limiter = limiter or RateLimiter(per_minute)
+    failed = failed if failed is not None else []
+
+    bank_counts = get_question_bank(db).counts()
+    pending = dict(
+        db.query(QuestionCandidate.skill_name, func.count(QuestionCandidate.id))
+        .filter(QuestionCandidate.status == "pending")
+        .group_by(QuestionCandidate.skill_name)
+        .all()
+    )
+    goals = [row[0] for row in db.query(User.career_goal).filter(User.career_goal.isnot(None)).distinct()]
+
+    requirements = _requirements_by_goal(goals, limiter, pool, failed)
+
+    uncovered: Dict[str, str] = {}
+    for goal in sorted(requirements):
+        for skill_name in requirements[goal]:
+            if bank_counts.get(skill_name, 0) >= MIN_BANK_QUESTIONS or skill_name in uncovered:
+                continue
+            if pending.get(skill_name, 0) >= QUESTIONS_PER_SKILL:
+                continue
+            uncovered[skill_name] = goal
+    return uncovered
+
+
+def generate_candidates(
+    db: Session,
+    skills: Optional[Dict[str, str]] = None,
+    per_minute: float = 30.0,
+    max_workers: int = 4,
+    per_skill: int = QUESTIONS_PER_SKILL,
+) -> dict:
+    """Draft questions for uncovered skills into the review queue."""
+    limiter = RateLimiter(per_minute)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        failed: List[dict] = []
+        if skills is None:
+            skills = find_uncovered_skills(db, limiter, pool, failed)
+        return _draft_candidates(db, skills, limiter, pool, per_skill, failed)
+
+
+def _draft_candidates(
+    db: Session,
+    skills: Dict[str, str],
+    limiter: RateLimiter,
+    pool: ThreadPoolExecutor,
+    per_skill: int,
+    failed: List[dict],
+) -> dict:
+    report = {"skills": sorted(skills), "generated": 0, "queued": 0, "duplicates": 0, "invalid": 0, "failed": failed}
+    if not skills:
+        return report
+
+    seen = {
+        content_hash(skill, text, options or [])
+        for skill, text, options in db.query(
+            MCQQuestion.skill_name, MCQQuestion.question_text, MCQQuestion.options
+        ).filter(MCQQuestion.skill_name.in_(list(skills)))
+    }
+    seen.update(row[0] for row in db.query(QuestionCandidate.content_hash))
+
+    def draft(skill_name: str, goal: str):
+        limiter.wait()
+        return generate_questions(skill_name, count=per_skill, career_goal=goal)
+
+    futures = {pool.submit(draft, skill, goal): (skill, goal) for skill, goal in skills.items()}
+    for future in as_completed(futures):
+        skill_name, goal = futures[future]
+        try:
+            drafts = future.result()
+        except HTTPException as exc:
+            report["failed"].append({"skill_name": skill_name, "error": str(exc.detail)})
+            continue
+        report["generated"] += len(drafts)
+        for item in drafts:
+            try:
+                row = MCQQuestionImport(skill_name=skill_name, **item.model_dump())
+            except ValidationError:
+                report["invalid"] += 1
+                continue
+            key = content_hash(row.skill_name, row.question_text, row.options)
+            if key in seen:
+                report["duplicates"] += 1
+                continue
+            seen.add(key)
+            db.add(QuestionCandidate(**row.model_dump(), content_hash=key, career_goal=goal))
+            report["queued"] += 1
+        db.commit()  # reviewers see each skill's drafts as soon as they land
+
+    return report
+
+
+def start_generation_run(db: Session) -> Tuple[QuestionGenerationRun, bool]:
+    """(run, created): the run in progress, or a new one to hand to `run_generation_job`."""
+    since = datetime.now(timezone.utc) - RUN_TIMEOUT
+    running = (
+        db.query(QuestionGenerationRun)
+        .filter(QuestionGenerationRun.status == "running", QuestionGenerationRun.created_at >= since)
+        .order_by(QuestionGenerationRun.id.desc())
+        .first()
+    )
+    if running is not None:
+        return running, False
+    run = QuestionGenerationRun(status="running", created_at=datetime.now(timezone.utc))
+    db.add(run)
+    db.commit()
+    return run, True
+
+
+def run_generation_job(run_id: int) -> None:
+    """Background task: draft candidates for uncovered skills and record the report on the run."""
+    db = SessionLocal()
+    try:
+        try:
+            report, status = generate_candidates(db), "done"
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Question generation run %s failed", run_id)
+            report, status = {"error": str(getattr(exc, "detail", exc))}, "failed"
+        run = db.get(QuestionGenerationRun, run_id)
+        run.status = status
+        run.report = report
+        run.finished_at = datetime.now(timezone.utc)
+        db.commit()
+    finally:
+        db.close()
+
+
+def list_candidates(db: Session, status: str = "pending", skill_name: Optional[str] = None) -> List[QuestionCandidate]:
+    query = db.query(QuestionCandidate).filter(QuestionCandidate.status == status)
+    if skill_name:
+        query = query.filter(QuestionCandidate.skill_name == skill_name)
+    return query.order_by(QuestionCandidate.skill_name, QuestionCandidate.id).all()
+
+
+def review_candidate(db: Session, candidate: QuestionCandidate, approve: bool) -> QuestionCandidate:
+    """Approve (copy into the bank and bump its version) or reject a pending candidate."""
+    if approve:
+        question = MCQQuestion(
+            skill_name=candidate.skill_name,
+            question_text=candidate.question_text,
+            options=candidate.options,
+            correct_answer=candidate.correct_answer,
+            difficulty=candidate.difficulty,
+            explanation=candidate.explanation,
+        )
+        db.add(question)
+        db.flush()
+        candidate.question_id = question.id
+        bump_bank_version(db)
+    candidate.status = "approved" if approve else "rejected"
+    candidate.reviewed_at = datetime.now(timezone.utc)
+    db.commit()
+    return candidate
@@ -0,0 +1,138 @@
+"""Streaming bulk import for the MCQ question bank.
+
+Rows are read one at a time from JSONL or CSV, validated against the
+`MCQQuestion` shape, deduplicated by a normalized content hash (against the
+existing bank and earlier rows in the same file), and written with Core
+executemany inserts in batches. Everything lands in one transaction together
+with the question-bank version bump.
+"""
+
+import csv
+import hashlib
+import json
+import re
+import time
+from typing import IO, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import MCQQuestion
+from app.question_bank import bump_bank_version
+from app.schemas import MCQQuestionImport
+
+BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 20
+_SPACES = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    return _SPACES.sub(" ", str(text)).strip().lower()
+
+
+def content_hash(skill_name: str, question_text: str, options: List[str]) -> str:
+    """Identity of a question regardless of case, spacing and option order."""
+    parts = [_normalize(skill_name), _normalize(question_text), *sorted(_normalize(o) for o in options)]
+    return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+
+def _csv_row(row: dict) -> dict:
+    """CSV columns: skill_name, question_text, options (JSON array or "|"-separated),
+    correct_answer (index or letter), difficulty, explanation."""
+    options = (row.get("options") or "").strip()
+    if options.startswith("["):
+        row["options"] = json.loads(options)
+    else:
+        row["options"] = [o.strip() for o in options.split("|") if o.strip()]
+    answer = (row.get("correct_answer") or "").strip()
+    if len(answer) == 1 and answer.isalpha():
+        row["correct_answer"] = ord(answer.upper()) - ord("A")
+    return row
+
+
+def iter_rows(stream: IO[str], fmt: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (line number, raw row, parse error) without loading the whole file."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            try:
+                yield reader.line_num, _csv_row(row), None
+            except ValueError as exc:
+                yield reader.line_num, None, f"bad options: {exc}"
+        return
+    for line_num, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_num, json.loads(line), None
+        except ValueError as exc:
+            yield line_num, None, f"invalid JSON: {exc}"
+
+
+def import_questions(
+    db: Session,
+    stream: IO[str],
+    fmt: str = "jsonl",
+    dry_run: bool = False,
+    batch_size: int = BATCH_SIZE,
+) -> dict:
+    """Validate, dedupe and insert questions from `stream`; returns a throughput report."""
+    started = time.perf_counter()
+    seen = {
+        content_hash(skill, text, options or [])
+        for skill, text, options in db.query(
+            MCQQuestion.skill_name, MCQQuestion.question_text, MCQQuestion.options
+        )
+    }
+    report = {"read": 0, "inserted": 0, "duplicates": 0, "invalid": 0, "errors": [], "dry_run": dry_run}
+
+    def reject(line_num: int, message: str) -> None:
+        report["invalid"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"line": line_num, "error": message})
+
+    batch: List[dict] = []
+    try:
+        for line_num, raw, parse_error in iter_rows(stream, fmt):
+            report["read"] += 1
+            if parse_error:
+                reject(line_num, parse_error)
+                continue
+            try:
+                row = MCQQuestionImport.model_validate(raw)
+            except ValidationError as exc:
+                first = exc.errors()[0]
+                reject(line_num, f"{'.'.join(str(p) for p in first['loc'])}: {first['msg']}")
+                continue
+
+            key = content_hash(row.skill_name, row.question_text, row.options)
+            if key in seen:
+                report["duplicates"] += 1
+                continue
+            seen.add(key)
+            batch.append(row.model_dump())
+            if len(batch) >= batch_size:
+                if not dry_run:
+                    db.execute(insert(MCQQuestion), batch)
+                report["inserted"] += len(batch)
+                batch = []
+
+        if batch:
+            if not dry_run:
+                db.execute(insert(MCQQuestion), batch)
+            report["inserted"] += len(batch)
+
+        if dry_run or not report["inserted"]:
+            db.rollback()
+        else:
+            report["bank_version"] = bump_bank_version(db)
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    elapsed = time.perf_counter() - started
+    report["seconds"] = round(elapsed, 3)
+    report["rows_per_second"] = int(report["read"] / elapsed) if elapsed > 0 else report["read"]
+    return report
@@ -0,0 +1,148 @@
+"""Population-wide freshness pass that stages recert work ahead of time.
+
+`run_recert_schedule` reads every `skill_last_touch` row, classifies them
+with the same AGING_DAYS / STALE_DAYS cut-offs as `compute_freshness` in one
+NumPy pass, and rewrites `recert_queue` with the aging and stale skills.
+Each queued skill carries a pre-sampled three-question recert set, drawn per
+skill in one shot, so `/questions/{skill}?recert=true` and the dashboard
+just read rows. Run it from cron via `schedule_recerts.py`.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.freshness import AGING_DAYS, STALE_DAYS, _aware
+from app.models import RecertQueueItem, SkillLastTouch
+from app.question_bank import SkillQuestions, get_question_bank
+
+RECERT_QUESTIONS = 3
+CHUNK_SIZE = 20000
+INSERT_BATCH = 5000
+
+
+def classify(days: np.ndarray) -> np.ndarray:
+    return np.where(days >= STALE_DAYS, "stale", np.where(days >= AGING_DAYS, "aging", "fresh"))
+
+
+def _sample(rng: np.random.Generator, questions: SkillQuestions, count: int) -> List[List[int]]:
+    """`count` independent recert sets from one skill's bank."""
+    ids = np.asarray(questions.ids, dtype=np.int64)
+    k = min(RECERT_QUESTIONS, len(ids))
+    picks = rng.random((count, len(ids))).argsort(axis=1)[:, :k]
+    return ids[picks].tolist()
+
+
+def run_recert_schedule(db: Session, now: Optional[datetime] = None, seed: Optional[int] = None) -> dict:
+    """Recompute freshness for every user and rewrite the recert queue."""
+    started = time.perf_counter()
+    now = _aware(now) or datetime.now(timezone.utc)
+    bank = get_question_bank(db)
+    rng = np.random.default_rng(seed)
+
+    kept: Dict[Tuple[int, str], List[int]] = {
+        (row.user_id, row.skill_name): row.question_ids for row in db.query(RecertQueueItem)
+    }
+
+    users, skills, days_parts, status_parts = [], [], [], []
+    report = {"scanned": 0, "users": 0, "fresh": 0, "aging": 0, "stale": 0, "queued": 0, "no_questions": 0}
+    user_ids = set()
+
+    def fold(chunk: list) -> None:
+        stamps = np.asarray([_aware(row[2]).timestamp() for row in chunk], dtype=np.float64)
+        days = np.maximum(0, np.floor((now.timestamp() - stamps) / 86400.0)).astype(np.int64)
+        status = classify(days)
+        report["scanned"] += len(chunk)
+        user_ids.update(row[0] for row in chunk)
+        for name in ("fresh", "aging", "stale"):
+            report[name] += int((status == name).sum())
+        due = np.nonzero(status != "fresh")[0]
+        users.extend(chunk[i][0] for i in due)
+        skills.extend(chunk[i][1] for i in due)
+        days_parts.append(days[due])
+        status_parts.append(status[due])
+
+    query = (
+        db.query(SkillLastTouch.user_id, SkillLastTouch.skill_name, SkillLastTouch.touched_at)
+        .order_by(SkillLastTouch.user_id, SkillLastTouch.skill_name)
+        .yield_per(CHUNK_SIZE)
+    )
+    chunk: list = []
+    for row in query:
+        chunk.append(row)
+        if len(chunk) >= CHUNK_SIZE:
+            fold(chunk)
+            chunk = []
+    if chunk:
+        fold(chunk)
+    report["users"] = len(user_ids)
+
+    days_due = np.concatenate(days_parts) if days_parts else np.zeros(0, dtype=np.int64)
+    status_due = np.concatenate(status_parts) if status_parts else np.zeros(0, dtype=str)
+
+    by_skill: Dict[str, List[int]] = {}
+    for i, skill_name in enumerate(skills):
+        by_skill.setdefault(skill_name, []).append(i)
+
+    rows: List[dict] = []
+    for skill_name, indices in by_skill.items():
+        questions = bank.get(skill_name)
+        if not questions:
+            report["no_questions"] += len(indices)
+            continue
+        valid = set(questions.positions)
+        fresh_sets = iter(_sample(rng, questions, len(indices)))
+        for i in indices:
+            question_ids = next(fresh_sets)
+            previous = kept.get((users[i], skill_name))
+            if previous and all(qid in valid for qid in previous):
+                question_ids = previous  # keep a set the user may already be looking at
+            rows.append({
+                "user_id": users[i],
+                "skill_name": skill_name,
+                "status": str(status_due[i]),
+                "days_stale": int(days_due[i]),
+                "question_ids": question_ids,
+                "scheduled_at": now,
+            })
+
+    db.query(RecertQueueItem).delete(synchronize_session=False)
+    for start in range(0, len(rows), INSERT_BATCH):
+        db.execute(insert(RecertQueueItem), rows[start:start + INSERT_BATCH])
+    db.commit()
+
+    report["queued"] = len(rows)
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def recert_question_ids(db: Session, user_id: int, skill_name: str, questions: SkillQuestions) -> Optional[List[int]]:
+    """The staged recert set for this user and skill, if it still matches the bank."""
+    item = db.get(RecertQueueItem, (user_id, skill_name))
+    if item is None or not item.question_ids:
+        return None
+    if any(qid not in questions.positions for qid in item.question_ids):
+        return None
+    return list(item.question_ids)
+
+
+def load_recert_queue(db: Session, user_id: int) -> List[dict]:
+    items = (
+        db.query(RecertQueueItem)
+        .filter(RecertQueueItem.user_id == user_id)
+        .order_by(RecertQueueItem.days_stale.desc(), RecertQueueItem.skill_name)
+        .all()
+    )
+    return [
+        {
+            "skill_name": item.skill_name,
+            "status": item.status,
+            "days_stale": item.days_stale,
+            "scheduled_at": item.scheduled_at,
+        }
+        for item in items
+    ]
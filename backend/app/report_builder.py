@@ -4,13 +4,14 @@ from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
-from app.models import Assessment, TeachBack, User
+from app.models import TeachBack, User
 from app.ai.gap_analyzer import calculate_skill_gaps, compute_career_fork
 from app.ai.recommender import calculate_career_readiness
 from app.ai.gap_analyzer import get_career_requirements
 from app.freshness import compute_freshness
 from app.streak import get_streak
 from app.path_progress import compute_path_completion
+from app.skill_scores import best_scores
 
 
 def _score_level(score: float) -> str:
@@ -22,12 +23,7 @@ def _score_level(score: float) -> str:
 
 
 def build_readiness_snapshot(db: Session, user: User, local_date: str | None = None) -> dict:
-    assessments = db.query(Assessment).filter(Assessment.user_id == user.id).all()
-
-    user_skills: dict[str, float] = {}
-    for row in assessments:
-        if row.skill_name not in user_skills or row.score > user_skills[row.skill_name]:
-            user_skills[row.skill_name] = row.score
+    user_skills = best_scores(db, user.id)
 
     gaps = []
     if user.career_goal:
@@ -0,0 +1,217 @@
+"""Re-score stored assessments against the current question bank.
+
+Scores are frozen at submit time, so a change to question weights (see
+`calibration.py`) or to an answer key leaves every downstream number stale.
+This replays the original scoring method in bulk: answers are read in id
+order, flattened into NumPy arrays per chunk, scored, and written back with
+one bulk UPDATE per chunk.
+
+- "full" rows (`/submit`) are weighted accuracy over the questions the bank
+  held at submit time (`AssessmentScoring.question_ids`), with current
+  weights and answer keys; questions added since don't dilute old scores.
+- "adaptive" rows are re-estimated with the current IRT parameters.
+- "recert" rows are skipped: the stored value depends on earlier scores.
+
+Rows written before `assessment_scoring` existed were classified by migration
+0005; a row still without a method is left as is.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models import Assessment, AssessmentScoring, SkillGap
+from app.question_bank import get_question_bank
+from app.ai.adaptive_testing import ability_to_score, estimate_abilities, item_params
+
+CHUNK_SIZE = 20000
+SCORE_EPSILON = 0.005
+SAMPLE_LIMIT = 20
+
+
+class _BankArrays:
+    """Flat per-question arrays over the whole bank, indexed by position."""
+
+    def __init__(self, db: Session):
+        bank = get_question_bank(db)
+        self.skill_index = {name: i for i, name in enumerate(sorted(bank.skills))}
+        self.positions: Dict[int, int] = {}
+        self.ids: List[int] = []
+        correct, weight, skill, a, b = [], [], [], [], []
+        for name, questions in bank.skills.items():
+            for i, qid in enumerate(questions.ids):
+                self.positions[qid] = len(correct)
+                self.ids.append(qid)
+                correct.append(questions.correct_answers[i])
+                weight.append(questions.weights.get(qid, questions.difficulties[i]))
+                skill.append(self.skill_index[name])
+                qa, qb = questions.irt.get(qid) or item_params(questions.difficulties[i])
+                a.append(qa)
+                b.append(qb)
+        self.correct = np.asarray(correct, dtype=np.int64)
+        self.weight = np.asarray(weight, dtype=np.float64)
+        self.skill = np.asarray(skill, dtype=np.int64)
+        self.a = np.asarray(a, dtype=np.float64)
+        self.b = np.asarray(b, dtype=np.float64)
+
+    def members(self, skill: int, question_ids) -> List[int]:
+        """Bank positions of the given ids that still belong to the skill."""
+        positions = (self.positions.get(int(qid)) for qid in question_ids)
+        return [pos for pos in positions if pos is not None and self.skill[pos] == skill]
+
+
+def _levels(scores: np.ndarray) -> np.ndarray:
+    # Same cut points as classify_skill_level.
+    return np.where(scores >= 7.5, "Advanced", np.where(scores >= 4.5, "Intermediate", "Beginner"))
+
+
+def _score_chunk(rows: list, bank: _BankArrays) -> np.ndarray:
+    """New scores for (id, user_id, skill, score, answers, method, question_ids) rows; NaN means leave as is."""
+    scores = np.full(len(rows), np.nan)
+    row_idx, item_idx, chosen = [], [], []
+    member_rows, member_items = [], []
+    full = np.zeros(len(rows), dtype=bool)
+    adaptive = np.zeros(len(rows), dtype=bool)
+    for i, (_, _, skill_name, _, answers, method, question_ids) in enumerate(rows):
+        skill = bank.skill_index.get(skill_name)
+        if skill is None or method not in ("full", "adaptive"):
+            continue
+        adaptive[i] = method == "adaptive"
+        full[i] = not adaptive[i]
+        answers = {int(qid): answer for qid, answer in (answers or {}).items() if answer is not None}
+        if full[i]:
+            # Without a recorded bank, the answered questions are the best record of it.
+            members = bank.members(skill, answers if question_ids is None else question_ids)
+            member_rows.extend([i] * len(members))
+            member_items.extend(members)
+            scored = [pos for pos in members if bank.ids[pos] in answers]
+        else:
+            scored = bank.members(skill, answers)
+        for pos in scored:
+            row_idx.append(i)
+            item_idx.append(pos)
+            chosen.append(int(answers[bank.ids[pos]]))
+
+    scores[full] = 0.0  # a full test with no valid answers scores zero
+    if not row_idx:
+        return scores
+
+    rows_arr = np.asarray(row_idx, dtype=np.int64)
+    items = np.asarray(item_idx, dtype=np.int64)
+    hits = (np.asarray(chosen, dtype=np.int64) == bank.correct[items]).astype(np.float64)
+
+    earned = np.bincount(rows_arr, weights=hits * bank.weight[items], minlength=len(rows))
+    total = np.bincount(
+        np.asarray(member_rows, dtype=np.int64),
+        weights=bank.weight[np.asarray(member_items, dtype=np.int64)],
+        minlength=len(rows),
+    )
+    ratio = np.divide(earned, total, out=np.zeros_like(earned), where=total > 0)
+    scores[full] = np.round(ratio[full] * 10.0, 2)
+
+    in_adaptive = adaptive[rows_arr]
+    if in_adaptive.any():
+        a_rows, a_items, a_hits = rows_arr[in_adaptive], items[in_adaptive], hits[in_adaptive]
+        owners, starts = np.unique(a_rows, return_index=True)
+        thetas = estimate_abilities(starts, bank.a[a_items], bank.b[a_items], a_hits)
+        scores[owners] = ability_to_score(thetas)
+    return scores
+
+
+def rescore_assessments(
+    db: Session,
+    dry_run: bool = False,
+    skill_name: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> dict:
+    """Re-score every stored assessment (or one skill's); returns a diff summary."""
+    bank = _BankArrays(db)
+    query = (
+        db.query(
+            Assessment.id,
+            Assessment.user_id,
+            Assessment.skill_name,
+            Assessment.score,
+            Assessment.answers,
+            AssessmentScoring.method,
+            AssessmentScoring.question_ids,
+        )
+        .outerjoin(AssessmentScoring, AssessmentScoring.assessment_id == Assessment.id)
+        .order_by(Assessment.id)
+    )
+    if skill_name:
+        query = query.filter(Assessment.skill_name == skill_name)
+
+    summary = {
+        "dry_run": dry_run,
+        "scanned": 0,
+        "changed": 0,
+        "level_changes": 0,
+        "mean_abs_delta": 0.0,
+        "max_abs_delta": 0.0,
+        "users_affected": 0,
+        "samples": [],
+    }
+    users: set = set()
+    delta_total = 0.0
+    last_id = 0
+
+    while True:
+        chunk = query.filter(Assessment.id > last_id).limit(chunk_size).all()
+        if not chunk:
+            break
+        last_id = chunk[-1][0]
+        rows = [tuple(r) for r in chunk]
+        summary["scanned"] += len(rows)
+
+        new_scores = _score_chunk(rows, bank)
+        old_scores = np.asarray([r[3] for r in rows], dtype=np.float64)
+        changed = ~np.isnan(new_scores) & (np.abs(new_scores - old_scores) >= SCORE_EPSILON)
+        if not changed.any():
+            continue
+
+        idx = np.nonzero(changed)[0]
+        deltas = np.abs(new_scores[idx] - old_scores[idx])
+        old_levels, new_levels = _levels(old_scores[idx]), _levels(new_scores[idx])
+        summary["changed"] += len(idx)
+        summary["level_changes"] += int((old_levels != new_levels).sum())
+        summary["max_abs_delta"] = max(summary["max_abs_delta"], float(deltas.max()))
+        delta_total += float(deltas.sum())
+        users.update(rows[i][1] for i in idx)
+
+        for j, i in enumerate(idx[: max(0, SAMPLE_LIMIT - len(summary["samples"]))]):
+            summary["samples"].append({
+                "assessment_id": rows[i][0],
+                "skill_name": rows[i][2],
+                "old_score": float(old_scores[i]),
+                "new_score": float(new_scores[i]),
+                "new_level": str(new_levels[j]),
+            })
+
+        if not dry_run:
+            db.bulk_update_mappings(Assessment, [
+                {"id": rows[i][0], "score": float(new_scores[i]), "level": str(new_levels[j])}
+                for j, i in enumerate(idx)
+            ])
+            db.commit()
+
+    if summary["changed"]:
+        summary["mean_abs_delta"] = round(delta_total / summary["changed"], 3)
+    summary["max_abs_delta"] = round(summary["max_abs_delta"], 3)
+    summary["users_affected"] = len(users)
+    if users and not dry_run:
+        _invalidate_dependents(db, sorted(users))
+    return summary
+
+
+def _invalidate_dependents(db: Session, user_ids: List[int]) -> None:
+    """Drop stored gap rows; the user's next precompute pass rebuilds them from the new scores.
+
+    Readiness, fork and precomputed paths are cached by skill scores, so they
+    miss on their own once the scores move.
+    """
+    for start in range(0, len(user_ids), 500):
+        batch = user_ids[start:start + 500]
+        db.query(SkillGap).filter(SkillGap.user_id.in_(batch)).delete(synchronize_session=False)
+    db.commit()
@@ -0,0 +1,97 @@
+import io
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Path, Query, UploadFile
+from sqlalchemy.orm import Session
+
+from app.auth import Principal, get_admin_user
+from app.database import get_db
+from app.models import QuestionCandidate, QuestionGenerationRun
+from app.question_candidates import list_candidates, review_candidate, run_generation_job, start_generation_run
+from app.question_import import import_questions
+from app.schemas import QuestionCandidateResponse, QuestionGenerationRunResponse, QuestionImportReport
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.post("/questions/import", response_model=QuestionImportReport)
+def import_question_bank(
+    file: UploadFile = File(...),
+    format: str = Query("jsonl", pattern="^(jsonl|csv)$"),
+    dry_run: bool = Query(False),
+    current_user: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_db),
+):
+    """Bulk-load questions from a JSONL or CSV upload."""
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        return import_questions(db, stream, fmt=format, dry_run=dry_run)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 text")
+    finally:
+        stream.detach()
+
+
+def _run_response(run: QuestionGenerationRun) -> dict:
+    report = run.report or {}
+    return {
+        "id": run.id,
+        "status": run.status,
+        "report": report if run.status == "done" else None,
+        "error": report.get("error"),
+        "created_at": run.created_at,
+        "finished_at": run.finished_at,
+    }
+
+
+@router.post("/question-candidates/generate", response_model=QuestionGenerationRunResponse, status_code=202)
+def generate_question_candidates(
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_db),
+):
+    """Start drafting questions for uncovered required skills; poll the returned run.
+
+    Returns the run already in progress instead of starting a second one.
+    """
+    run, created = start_generation_run(db)
+    if created:
+        background_tasks.add_task(run_generation_job, run.id)
+    return _run_response(run)
+
+
+@router.get("/question-candidates/generate/{run_id}", response_model=QuestionGenerationRunResponse)
+def get_question_generation_run(
+    run_id: int,
+    current_user: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_db),
+):
+    run = db.get(QuestionGenerationRun, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Generation run not found")
+    return _run_response(run)
+
+
+@router.get("/question-candidates", response_model=list[QuestionCandidateResponse])
+def get_question_candidates(
+    status: str = Query("pending", pattern="^(pending|approved|rejected)$"),
+    skill_name: Optional[str] = Query(None),
+    current_user: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_db),
+):
+    return list_candidates(db, status=status, skill_name=skill_name)
+
+
+@router.post("/question-candidates/{candidate_id}/{decision}", response_model=QuestionCandidateResponse)
+def review_question_candidate(
+    candidate_id: int,
+    decision: str = Path(..., pattern="^(approve|reject)$"),
+    current_user: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_db),
+):
+    candidate = db.get(QuestionCandidate, candidate_id)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    if candidate.status != "pending":
+        raise HTTPException(status_code=409, detail=f"Candidate already {candidate.status}")
+    return review_candidate(db, candidate, approve=decision == "approve")
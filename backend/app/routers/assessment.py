@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from datetime import date, timedelta
+from typing import Optional
+import hashlib
 import random
-from app.database import get_db
-from app.models import User, Assessment, MCQQuestion
+from app.database import get_async_db, get_db
+from app.models import Assessment, AssessmentFeedback, AssessmentScoring
 from app.schemas import (
     MCQQuestionResponse,
     AssessmentSubmission,
@@ -11,106 +15,303 @@ from app.schemas import (
     SkillInfo,
     AssessmentHistoryEntry,
     RecertResult,
+    AssessmentFeedbackResponse,
+    AdaptiveStepRequest,
+    AdaptiveStepResponse,
+    AssessmentBatchSubmission,
+    AssessmentBundle,
+    AssessmentBundleSkill,
 )
-from app.auth import get_current_user
-from app.streak import get_local_date, record_activity
+from app.auth import Principal, get_current_principal, get_optional_principal
+from app.streak import get_local_date, parse_activity_date, record_activity
 from app.ai.skill_evaluator import calculate_skill_score, classify_skill_level, generate_assessment_breakdown
 from app.ai.gap_analyzer import peek_cached_requirements
-from app.freshness import compute_freshness
+from app.ai.adaptive_testing import MAX_ITEMS, run_step
+from app.freshness import compute_freshness, touch_skills
+from app.precompute import schedule_precompute
+from app.question_bank import get_question_bank
+from app.recert_queue import recert_question_ids
+from app.skill_scores import best_scores
+from app.assessment_feedback import feedback_payload, queue_feedback, run_feedback_job
 
 router = APIRouter(prefix="/api/assessment", tags=["assessment"])
 
+MAX_BATCH_ITEMS = 20
+OFFLINE_WINDOW_DAYS = 14
+_bundle_cache: dict = {}
+
+
+def _offline_day(taken_on: Optional[str], local_date: str) -> str:
+    """Activity day for a batched item: its offline date when within the window, else the sync day."""
+    if not taken_on:
+        return local_date
+    day = date.fromisoformat(parse_activity_date(taken_on))
+    today = date.fromisoformat(local_date)
+    if day > today or day < today - timedelta(days=OFFLINE_WINDOW_DAYS):
+        return local_date
+    return day.isoformat()
+
+
+def _record_assessment(
+    db: Session,
+    background_tasks: BackgroundTasks,
+    user_id: int,
+    skill_name: str,
+    score: float,
+    level: str,
+    answers: dict,
+    breakdown: dict,
+    local_date: str,
+    method: str,
+    question_ids: Optional[list] = None,
+) -> Assessment:
+    """Store the assessment, then queue feedback and precompute once it is committed."""
+    assessment = _add_assessment(db, user_id, skill_name, score, level, answers, method, question_ids)
+    record_activity(db, user_id, local_date)
+    db.commit()
+    schedule_precompute(user_id)
+    background_tasks.add_task(run_feedback_job, assessment.id, skill_name, breakdown)
+    return assessment
+
+
+def _add_assessment(
+    db: Session,
+    user_id: int,
+    skill_name: str,
+    score: float,
+    level: str,
+    answers: dict,
+    method: str,
+    question_ids: Optional[list] = None,
+) -> Assessment:
+    assessment = Assessment(
+        user_id=user_id,
+        skill_name=skill_name,
+        score=score,
+        level=level,
+        answers=answers,
+    )
+    db.add(assessment)
+    db.flush()
+    db.add(AssessmentScoring(assessment_id=assessment.id, method=method, question_ids=question_ids))
+    touch_skills(db, user_id, [skill_name])
+    queue_feedback(db, assessment.id)
+    return assessment
+
+
+def _score_full(questions, skill_name: str, answers: dict) -> tuple:
+    """(score, level, breakdown) for a whole-bank submission."""
+    questions_data = questions.scoring_rows()
+    score = calculate_skill_score(questions_data, answers, questions.weights)
+    level = classify_skill_level(score)
+    breakdown = generate_assessment_breakdown(questions_data, answers, score, skill_name=skill_name)
+    return score, level, breakdown
+
+
+def _recommended_skills(career_goal: Optional[str], skill_names) -> list[str]:
+    """Skills to offer: the career's required skills when known, else every skill in the bank."""
+    names = sorted(skill_names)
+    if career_goal:
+        career_requirements = peek_cached_requirements(career_goal)
+        if career_requirements:
+            filtered = [name for name in names if name in career_requirements]
+            if filtered:
+                return filtered
+    return names
+
+
 @router.get("/questions/{skill_name}", response_model=list[MCQQuestionResponse])
 def get_questions(
     skill_name: str,
     recert: bool = Query(False),
+    current_user: Optional[Principal] = Depends(get_optional_principal),
     db: Session = Depends(get_db),
 ):
-    """Get MCQ questions for a skill."""
-    questions = db.query(MCQQuestion).filter(MCQQuestion.skill_name == skill_name).all()
+    """Get MCQ questions for a skill; recert serves the user's staged set when one exists."""
+    questions = get_question_bank(db).get(skill_name)
     
     if not questions:
         raise HTTPException(status_code=404, detail="No questions found for this skill")
 
+    payloads = list(questions.payloads)
     if recert:
-        questions = random.sample(questions, k=min(3, len(questions)))
+        staged = recert_question_ids(db, current_user.id, skill_name, questions) if current_user else None
+        if staged:
+            return [questions.payload(qid) for qid in staged]
+        payloads = random.sample(payloads, k=min(3, len(payloads)))
     
-    result = []
-    for q in questions:
-        options = []
-        for idx, option_text in enumerate(q.options):
-            options.append({"id": idx, "text": option_text})
-        
-        result.append(MCQQuestionResponse(
-            id=q.id,
-            skill_name=q.skill_name,
-            question_text=q.question_text,
-            options=options,
-            difficulty=q.difficulty
-        ))
-    
-    return result
+    return payloads
 
 @router.post("/submit", response_model=AssessmentResult)
 def submit_assessment(
     submission: AssessmentSubmission,
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
     local_date: str = Depends(get_local_date),
 ):
-    """Submit assessment answers and get results."""
-    questions = db.query(MCQQuestion).filter(MCQQuestion.skill_name == submission.skill_name).all()
+    """Submit assessment answers and get results; feedback follows via /{id}/feedback."""
+    questions = get_question_bank(db).get(submission.skill_name)
     
     if not questions:
         raise HTTPException(status_code=404, detail="No questions found for this skill")
     
-    questions_data = []
-    for q in questions:
-        questions_data.append({
-            "id": q.id,
-            "correct_answer": q.correct_answer,
-            "difficulty": q.difficulty
-        })
-    
-    score = calculate_skill_score(questions_data, submission.answers)
-    level = classify_skill_level(score)
+    score, level, breakdown = _score_full(questions, submission.skill_name, submission.answers)
     
-    breakdown = generate_assessment_breakdown(
-        questions_data,
-        submission.answers,
-        score,
-        skill_name=submission.skill_name,
+    assessment = _record_assessment(
+        db, background_tasks, current_user.id, submission.skill_name,
+        score, level, submission.answers, breakdown, local_date, "full", list(questions.ids),
     )
     
-    assessment = Assessment(
-        user_id=current_user.id,
+    return AssessmentResult(
         skill_name=submission.skill_name,
         score=score,
         level=level,
-        answers=submission.answers
+        breakdown=breakdown,
+        assessment_id=assessment.id,
+        feedback_status="pending",
     )
-    db.add(assessment)
-    record_activity(db, current_user.id, local_date)
+
+@router.post("/submit-batch", response_model=list[AssessmentResult])
+def submit_assessment_batch(
+    batch: AssessmentBatchSubmission,
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+    local_date: str = Depends(get_local_date),
+):
+    """Score several (possibly offline) assessments in one transaction."""
+    if not batch.items:
+        raise HTTPException(status_code=400, detail="Batch is empty.")
+    if len(batch.items) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_ITEMS} assessments per batch.")
+
+    bank = get_question_bank(db)
+    missing = sorted({item.skill_name for item in batch.items if not bank.get(item.skill_name)})
+    if missing:
+        raise HTTPException(status_code=404, detail=f"No questions found for: {', '.join(missing)}")
+
+    results, feedback_jobs, days = [], [], set()
+    for item in batch.items:
+        questions = bank.get(item.skill_name)
+        score, level, breakdown = _score_full(questions, item.skill_name, item.answers)
+        assessment = _add_assessment(
+            db, current_user.id, item.skill_name, score, level, item.answers, "full", list(questions.ids),
+        )
+        days.add(_offline_day(item.taken_on, local_date))
+        feedback_jobs.append((assessment.id, item.skill_name, breakdown))
+        results.append(AssessmentResult(
+            skill_name=item.skill_name,
+            score=score,
+            level=level,
+            breakdown=breakdown,
+            assessment_id=assessment.id,
+            feedback_status="pending",
+        ))
+    for day in sorted(days):
+        record_activity(db, current_user.id, day)
     db.commit()
-    
-    return AssessmentResult(
-        skill_name=submission.skill_name,
+
+    schedule_precompute(current_user.id)
+    for job in feedback_jobs:
+        background_tasks.add_task(run_feedback_job, *job)
+    return results
+
+
+@router.get("/bundle", response_model=AssessmentBundle)
+def get_assessment_bundle(
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+):
+    """Questions for every recommended skill in one ETag-versioned payload."""
+    bank = get_question_bank(db)
+    skill_names = tuple(_recommended_skills(current_user.career_goal, bank.skills))
+    etag, body = _bundle_body(bank, skill_names)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _bundle_body(bank, skill_names: tuple) -> tuple[str, bytes]:
+    key = (bank.version, skill_names)
+    cached = _bundle_cache.get(key)
+    if cached:
+        return cached
+    bundle = AssessmentBundle(
+        version=bank.version,
+        skills=[
+            AssessmentBundleSkill(name=name, questions=list(bank.get(name).payloads))
+            for name in skill_names
+        ],
+    )
+    body = bundle.model_dump_json().encode()
+    etag = f'"{bank.version}-{hashlib.sha1(body).hexdigest()[:16]}"'
+    if len(_bundle_cache) >= 64:
+        _bundle_cache.clear()
+    _bundle_cache[key] = (etag, body)
+    return etag, body
+
+
+@router.post("/adaptive", response_model=AdaptiveStepResponse)
+def adaptive_step(
+    step: AdaptiveStepRequest,
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+    local_date: str = Depends(get_local_date),
+):
+    """One round of an adaptive (IRT) assessment.
+
+    The client resends every answer so far and gets back the next question, or
+    the stored result once the ability estimate is precise enough.
+    """
+    questions = get_question_bank(db).get(step.skill_name)
+    if not questions:
+        raise HTTPException(status_code=404, detail="No questions found for this skill")
+
+    questions_data = questions.scoring_rows(list(step.answers))
+    if len(questions_data) != len(step.answers):
+        raise HTTPException(status_code=400, detail="Invalid adaptive answers.")
+
+    state = run_step(questions.scoring_rows(), step.answers)
+    response = dict(
+        skill_name=step.skill_name,
+        done=state["done"],
+        questions_answered=state["answered"],
+        max_questions=min(MAX_ITEMS, len(questions)),
+        ability=state["theta"],
+        standard_error=state["standard_error"],
+    )
+    if not state["done"]:
+        return AdaptiveStepResponse(**response, question=questions.payload(state["next_id"]))
+
+    score = state["score"]
+    level = classify_skill_level(score)
+    breakdown = generate_assessment_breakdown(questions_data, step.answers, score, skill_name=step.skill_name)
+    breakdown["ability"] = state["theta"]
+    breakdown["standard_error"] = state["standard_error"]
+    assessment = _record_assessment(
+        db, background_tasks, current_user.id, step.skill_name,
+        score, level, step.answers, breakdown, local_date, "adaptive",
+    )
+    return AdaptiveStepResponse(**response, result=AssessmentResult(
+        skill_name=step.skill_name,
         score=score,
         level=level,
-        breakdown=breakdown
-    )
+        breakdown=breakdown,
+        assessment_id=assessment.id,
+        feedback_status="pending",
+    ))
 
 @router.get("/skills", response_model=list[SkillInfo])
 def get_available_skills(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get skills available for assessment with metadata."""
-    counts = dict(
-        db.query(MCQQuestion.skill_name, func.count(MCQQuestion.id))
-        .group_by(MCQQuestion.skill_name)
-        .all()
-    )
+    counts = get_question_bank(db).counts()
 
     recommended_skills: set[str] = set()
     if current_user.career_goal:
@@ -134,10 +335,7 @@ def get_available_skills(
 
     skills.sort(key=lambda s: (not s.recommended, s.name))
 
-    user_skills = {}
-    for row in db.query(Assessment).filter(Assessment.user_id == current_user.id).all():
-        if row.skill_name not in user_skills or row.score > user_skills[row.skill_name]:
-            user_skills[row.skill_name] = row.score
+    user_skills = best_scores(db, current_user.id)
     fresh_map = {item["skill_name"]: item for item in compute_freshness(db, current_user.id, user_skills)}
     for skill in skills:
         item = fresh_map.get(skill.name)
@@ -148,17 +346,18 @@ def get_available_skills(
     return skills
 
 @router.get("/history", response_model=list[AssessmentHistoryEntry])
-def get_assessment_history(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_assessment_history(
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get assessment history for the current user."""
     assessments = (
-        db.query(Assessment)
-        .filter(Assessment.user_id == current_user.id)
-        .order_by(Assessment.created_at.asc())
-        .all()
-    )
+        await db.scalars(
+            select(Assessment)
+            .where(Assessment.user_id == current_user.id)
+            .order_by(Assessment.created_at.asc())
+        )
+    ).all()
 
     return [
         AssessmentHistoryEntry(
@@ -174,7 +373,8 @@ def get_assessment_history(
 @router.post("/recert", response_model=RecertResult)
 def recert_skill(
     submission: AssessmentSubmission,
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
     local_date: str = Depends(get_local_date),
 ):
@@ -183,22 +383,12 @@ def recert_skill(
     if not question_ids or len(question_ids) > 3:
         raise HTTPException(status_code=400, detail="Recert needs at most 3 answers.")
 
-    questions = (
-        db.query(MCQQuestion)
-        .filter(
-            MCQQuestion.skill_name == submission.skill_name,
-            MCQQuestion.id.in_(question_ids),
-        )
-        .all()
-    )
-    if len(questions) != len(question_ids):
+    questions = get_question_bank(db).get(submission.skill_name)
+    questions_data = questions.scoring_rows(question_ids) if questions else []
+    if len(questions_data) != len(question_ids):
         raise HTTPException(status_code=400, detail="Invalid recert questions.")
 
-    questions_data = [
-        {"id": q.id, "correct_answer": q.correct_answer, "difficulty": q.difficulty}
-        for q in questions
-    ]
-    recert_score = calculate_skill_score(questions_data, submission.answers)
+    recert_score = calculate_skill_score(questions_data, submission.answers, questions.weights)
     passed = recert_score >= 6.0
 
     previous = (
@@ -219,15 +409,10 @@ def recert_skill(
         recert_score,
         skill_name=submission.skill_name,
     )
-    db.add(Assessment(
-        user_id=current_user.id,
-        skill_name=submission.skill_name,
-        score=stored,
-        level=level,
-        answers=submission.answers,
-    ))
-    record_activity(db, current_user.id, local_date)
-    db.commit()
+    assessment = _record_assessment(
+        db, background_tasks, current_user.id, submission.skill_name,
+        stored, level, submission.answers, breakdown, local_date, "recert",
+    )
     return RecertResult(
         skill_name=submission.skill_name,
         score=recert_score,
@@ -235,4 +420,23 @@ def recert_skill(
         level=level,
         passed=passed,
         breakdown=breakdown,
+        assessment_id=assessment.id,
+        feedback_status="pending",
+    )
+
+
+@router.get("/{assessment_id}/feedback", response_model=AssessmentFeedbackResponse)
+def get_assessment_feedback(
+    assessment_id: int,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+):
+    """Poll for the narrative feedback generated after submit or recert."""
+    owned = (
+        db.query(Assessment.id)
+        .filter(Assessment.id == assessment_id, Assessment.user_id == current_user.id)
+        .first()
     )
+    if owned is None:
+        raise HTTPException(status_code=404, detail="Assessment not found")
+    return feedback_payload(db.get(AssessmentFeedback, assessment_id), assessment_id)
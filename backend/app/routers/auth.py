@@ -1,19 +1,44 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import User
 from app.schemas import UserSignup, UserLogin, Token, UserResponse, SignupResponse
-from app.auth import verify_password, get_password_hash, create_access_token, get_current_user
+from app.auth import create_access_token, get_current_user
+from app.password_hashing import check_password_async, hash_password_async, needs_rehash
 from datetime import timedelta
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+def _user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+def _create_user(db: Session, user_data: UserSignup, hashed_password: str) -> User:
+    new_user = User(
+        email=user_data.email,
+        hashed_password=hashed_password,
+        full_name=user_data.full_name
+    )
+    db.add(new_user)
+    db.commit()
+    db.refresh(new_user)
+    return new_user
+
+
+def _store_hash(db: Session, user: User, hashed_password: str) -> None:
+    user.hashed_password = hashed_password
+    db.commit()
+
+
+# Signup and login are async so bcrypt waits on the hashing pool without
+# holding a threadpool slot; their short DB calls go to the threadpool.
 @router.post("/signup", response_model=SignupResponse)
-def signup(user_data: UserSignup, db: Session = Depends(get_db)):
+async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
     """User registration - returns token and user profile."""
     # Check if user exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_in_threadpool(_user_by_email, db, user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -21,15 +46,8 @@ def signup(user_data: UserSignup, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    new_user = User(
-        email=user_data.email,
-        hashed_password=hashed_password,
-        full_name=user_data.full_name
-    )
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    hashed_password = await hash_password_async(user_data.password)
+    new_user = await run_in_threadpool(_create_user, db, user_data, hashed_password)
     
     # Create access token
     access_token_expires = timedelta(minutes=30 * 24 * 60)
@@ -44,16 +62,19 @@ def signup(user_data: UserSignup, db: Session = Depends(get_db)):
     )
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    """User login - returns JWT token."""
-    user = db.query(User).filter(User.email == form_data.username).first()
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    """User login - returns JWT token; rehashes passwords stored at an old bcrypt cost."""
+    user = await run_in_threadpool(_user_by_email, db, form_data.username)
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await check_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    if needs_rehash(user.hashed_password):
+        await run_in_threadpool(_store_hash, db, user, await hash_password_async(form_data.password))
     
     access_token_expires = timedelta(minutes=30 * 24 * 60)
     access_token = create_access_token(
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models import User, Assessment, CoachMessage, WeeklyPlan
+from app.models import User, CoachMessage, WeeklyPlan
 from app.path_progress import path_summary
 from app.schemas import ChatRequest, ChatResponse
 from app.auth import get_current_user
@@ -10,6 +10,7 @@ from app.ai.gap_analyzer import calculate_skill_gaps
 from app.ai.coach import chat_with_coach
 from app.ai.weekly_plan import generate_weekly_plan, monday_of
 from app.freshness import compute_freshness
+from app.skill_scores import best_scores
 from datetime import date
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
@@ -50,14 +51,7 @@ def chat(
     local_date: str = Depends(get_local_date),
 ):
     """Chat with the AI career coach."""
-    assessments = db.query(Assessment).filter(Assessment.user_id == current_user.id).all()
-
-    user_skills: dict = {}
-    for assessment in assessments:
-        if assessment.skill_name not in user_skills:
-            user_skills[assessment.skill_name] = assessment.score
-        elif assessment.score > user_skills[assessment.skill_name]:
-            user_skills[assessment.skill_name] = assessment.score
+    user_skills = best_scores(db, current_user.id)
 
     skill_gaps = []
     if current_user.career_goal:
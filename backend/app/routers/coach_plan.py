@@ -1,28 +1,31 @@
 """Coach weekly plan and persisted chat history."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.auth import get_current_user
 from app.database import get_db
-from app.models import Assessment, CoachMessage, User
+from app.models import CoachMessage, User
 from app.schemas import ChatMessage, CoachHistoryResponse, WeeklyPlanItem, WeeklyPlanResponse
 from app.ai.gap_analyzer import calculate_skill_gaps
-from app.ai.weekly_plan import generate_weekly_plan, monday_of
+from app.ai.weekly_plan import generate_weekly_plan, load_weekly_plan, monday_of
 from app.path_progress import path_summary
 from app.freshness import compute_freshness
+from app.skill_scores import best_scores
 from datetime import date
 
 router = APIRouter(prefix="/api/coach", tags=["coach"])
 
 
-def _user_skills(db: Session, user_id: int) -> dict:
-    assessments = db.query(Assessment).filter(Assessment.user_id == user_id).all()
-    skills: dict = {}
-    for row in assessments:
-        if row.skill_name not in skills or row.score > skills[row.skill_name]:
-            skills[row.skill_name] = row.score
-    return skills
+def _plan_response(plan) -> WeeklyPlanResponse:
+    return WeeklyPlanResponse(
+        week_start=plan.week_start,
+        focus=plan.focus,
+        plan=[WeeklyPlanItem(**item) for item in (plan.plan_items or [])],
+        check_in=plan.check_in,
+        next_step=plan.next_step,
+        generated_at=plan.generated_at,
+    )
 
 
 @router.get("/weekly-plan", response_model=WeeklyPlanResponse)
@@ -30,7 +33,20 @@ def get_weekly_plan(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    user_skills = _user_skills(db, current_user.id)
+    """This week's stored plan; POST creates it when missing."""
+    plan = load_weekly_plan(db, current_user.id, monday_of(date.today()))
+    if plan is None:
+        raise HTTPException(status_code=404, detail="No weekly plan for this week yet.")
+    return _plan_response(plan)
+
+
+@router.post("/weekly-plan", response_model=WeeklyPlanResponse)
+def create_weekly_plan(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Generate this week's plan, or return it if it already exists."""
+    user_skills = best_scores(db, current_user.id)
     skill_gaps = []
     if current_user.career_goal:
         skill_gaps = calculate_skill_gaps(user_skills, current_user.career_goal)
@@ -49,16 +65,7 @@ def get_weekly_plan(
     )
     db.commit()
     db.refresh(plan)
-
-    items = [WeeklyPlanItem(**item) for item in (plan.plan_items or [])]
-    return WeeklyPlanResponse(
-        week_start=plan.week_start,
-        focus=plan.focus,
-        plan=items,
-        check_in=plan.check_in,
-        next_step=plan.next_step,
-        generated_at=plan.generated_at,
-    )
+    return _plan_response(plan)
 
 
 @router.get("/history", response_model=CoachHistoryResponse)
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import Dict, List, Set, Tuple
-from app.database import get_db
-from app.models import User, Assessment, LearningPath, LearningProgress, TeachBack
+from typing import Dict, List, Optional, Set, Tuple
+from app.database import get_async_db, get_db
+from app.models import Assessment, LearningProgress, LearningProgressSummary, LearningWeekProgress, PathVersionWeek, PathWeek, TeachBack
 from app.schemas import (
     LearningPathResponse,
     WeeklyLearningPath,
@@ -12,200 +14,162 @@ from app.schemas import (
     ProgressToggle,
     LearningProgressResponse,
     ProgressItem,
+    PathVersionInfo,
+    PathVersionDiffResponse,
+    PathVersionWeekDiff,
 )
-from app.auth import get_current_user
+from app.auth import Principal, get_current_principal
 from app.streak import get_local_date, record_activity
 from app.ai.gap_analyzer import calculate_skill_gaps, get_career_requirements
-from app.ai.learning_path_engine import generate_learning_path, sanitize_week_resources
-from app.ai.recommender import adapt_learning_path
+from app.ai.learning_path_engine import generate_learning_path
+from app.precompute import take_candidate_path
+from app.path_progress import (
+    activate_path_version,
+    apply_progress_delta,
+    get_week_progress,
+    load_progress_summary,
+    load_progress_summary_async,
+)
+from app.path_store import (
+    RESOURCE_LIMIT,
+    active_version_id,
+    diff_versions,
+    get_version,
+    list_versions,
+    load_path_weeks,
+    week_to_dict,
+    write_path_version,
+)
+from app.skill_scores import best_scores
+from app.ai.recommender import adapt_learning_path, calculate_progress_velocity, explain_adaptation
 
 router = APIRouter(prefix="/api/learning-path", tags=["learning-path"])
 
-RESOURCE_LIMIT = 10
 
-
-def _dedupe_resources(resources: list) -> list:
-    seen = set()
-    deduped = []
-    for resource in resources or []:
-        if not isinstance(resource, dict) or not resource.get("title"):
-            continue
-        key = (resource.get("title"), resource.get("url"))
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(resource)
-    return deduped
+def _completed_query(user_id: int):
+    return select(LearningProgress.week_number, LearningProgress.resource_index).where(
+        LearningProgress.user_id == user_id
+    )
 
 
-def _ensure_week_resources(resources: list, skill_name: str) -> list:
-    return sanitize_week_resources(skill_name, resources, limit=min(RESOURCE_LIMIT, 3))
+def _get_completed_set(db: Session, user_id: int) -> Set[Tuple[int, int]]:
+    return {(w, idx) for w, idx in db.execute(_completed_query(user_id))}
 
 
-def _group_paths_by_week(learning_paths: list) -> Dict[int, dict]:
-    weeks_dict: Dict[int, dict] = {}
-    for lp in learning_paths:
-        week_num = lp.week_number
-        if week_num not in weeks_dict:
-            weeks_dict[week_num] = {
-                "week_number": week_num,
-                "skills": [],
-                "resources": [],
-                "total_hours": 0.0,
-                "status": lp.status,
-            }
-        weeks_dict[week_num]["skills"].append(lp.skill_name)
-        weeks_dict[week_num]["resources"].extend(lp.resources or [])
-        weeks_dict[week_num]["total_hours"] += lp.estimated_hours
+async def _get_completed_set_async(db: AsyncSession, user_id: int) -> Set[Tuple[int, int]]:
+    return {(w, idx) for w, idx in await db.execute(_completed_query(user_id))}
 
-    for week_num, week_data in weeks_dict.items():
-        skill_name = week_data["skills"][0] if week_data["skills"] else "Skill"
-        week_data["resources"] = _ensure_week_resources(week_data["resources"], skill_name)
 
-    return weeks_dict
+def _completed_indices_for_week(week_number: int, completed: Set[Tuple[int, int]]) -> List[int]:
+    return sorted(idx for w, idx in completed if w == week_number)
 
 
-def _get_completed_set(db: Session, user_id: int) -> Set[Tuple[int, int]]:
-    rows = db.query(LearningProgress).filter(LearningProgress.user_id == user_id).all()
-    return {(r.week_number, r.resource_index) for r in rows}
+def _week_status_query(user_id: int):
+    return select(LearningWeekProgress.week_number, LearningWeekProgress.status).where(
+        LearningWeekProgress.user_id == user_id
+    )
 
 
-def _completed_indices_for_week(week_number: int, completed: Set[Tuple[int, int]]) -> List[int]:
-    return sorted(idx for w, idx in completed if w == week_number)
+def _week_status_map(db: Session, user_id: int) -> Dict[int, str]:
+    return dict(db.execute(_week_status_query(user_id)).all())
 
 
-def _compute_progress_stats(weeks_dict: Dict[int, dict], completed: Set[Tuple[int, int]]) -> dict:
-    total_resources = 0
-    resources_completed = 0
-    week_status: Dict[int, str] = {}
+async def _week_status_map_async(db: AsyncSession, user_id: int) -> Dict[int, str]:
+    return dict((await db.execute(_week_status_query(user_id))).all())
 
-    for week_num, week_data in weeks_dict.items():
-        resource_count = min(len(week_data["resources"]), RESOURCE_LIMIT)
-        total_resources += resource_count
-        week_completed = sum(
-            1 for idx in range(resource_count)
-            if (week_num, idx) in completed
-        )
-        resources_completed += week_completed
-
-        if resource_count == 0:
-            week_status[week_num] = week_data.get("status", "pending")
-        elif week_completed == 0:
-            week_status[week_num] = "pending"
-        elif week_completed >= resource_count:
-            week_status[week_num] = "completed"
-        else:
-            week_status[week_num] = "in_progress"
-
-    overall_pct = round((resources_completed / total_resources) * 100, 1) if total_resources else 0.0
-    return {
-        "week_status": week_status,
-        "overall_pct": overall_pct,
-        "resources_completed": resources_completed,
-        "total_resources": total_resources,
-    }
 
-
-def _build_weekly_paths(weeks_dict: Dict[int, dict], completed: Set[Tuple[int, int]]) -> List[WeeklyLearningPath]:
+def _build_weekly_paths(
+    weeks: List[PathWeek],
+    completed: Set[Tuple[int, int]],
+    week_status: Dict[int, str],
+) -> List[WeeklyLearningPath]:
     weekly_paths = []
-    stats = _compute_progress_stats(weeks_dict, completed)
-
-    for week_num in sorted(weeks_dict.keys()):
-        week_data = weeks_dict[week_num]
-        resources_raw = week_data["resources"][:RESOURCE_LIMIT]
-        resources = [
-            LearningResource(**r) if isinstance(r, dict) else LearningResource(**r)
-            for r in resources_raw
-        ]
 
+    for week in weeks:
+        skills = week.skills or [week.skill_name]
         weekly_paths.append(WeeklyLearningPath(
-            week_number=week_data["week_number"],
-            skill_name=week_data["skills"][0] if len(week_data["skills"]) == 1 else "Multiple Skills",
-            resources=resources,
-            estimated_hours=week_data["total_hours"],
-            status=stats["week_status"].get(week_num, week_data.get("status", "pending")),
-            explanation=week_data.get("explanation", []) or [],
-            completed_resources=_completed_indices_for_week(week_num, completed),
+            week_number=week.week_number,
+            skill_name=week.skill_name if len(skills) == 1 else "Multiple Skills",
+            resources=[
+                LearningResource(
+                    id=r.id,
+                    title=r.title,
+                    type=r.type,
+                    url=r.url,
+                    estimated_hours=r.estimated_hours,
+                )
+                for r in week.resources[:RESOURCE_LIMIT]
+            ],
+            estimated_hours=week.estimated_hours,
+            status=week_status.get(week.week_number, "pending"),
+            is_revised=bool(week.is_revision),
+            explanation=week.explanation or [],
+            completed_resources=_completed_indices_for_week(week.week_number, completed),
         ))
 
     return weekly_paths
 
 
-def _update_week_status_in_db(db: Session, user_id: int, week_number: int, status: str):
-    rows = db.query(LearningPath).filter(
-        LearningPath.user_id == user_id,
-        LearningPath.week_number == week_number,
-    ).all()
-    for row in rows:
-        row.status = status
+def _path_response(db: Session, user_id: int, weeks: List[PathWeek]) -> LearningPathResponse:
+    completed = _get_completed_set(db, user_id)
+    weekly_paths = _build_weekly_paths(weeks, completed, _week_status_map(db, user_id))
+    return LearningPathResponse(
+        total_weeks=len(weekly_paths),
+        weekly_paths=weekly_paths
+    )
+
+
+def _progress_payload(
+    summary: Optional[LearningProgressSummary],
+    completed: Set[Tuple[int, int]],
+    week_status: Dict[int, str],
+) -> LearningProgressResponse:
+    total = summary.total_resources if summary else 0
+    done = summary.resources_completed if summary else 0
+
+    return LearningProgressResponse(
+        completed=[
+            ProgressItem(week_number=w, resource_index=idx)
+            for w, idx in sorted(completed)
+        ],
+        week_status=week_status,
+        overall_pct=round((done / total) * 100, 1) if total else 0.0,
+        resources_completed=done,
+        total_resources=total,
+    )
+
+
+def _progress_response(db: Session, user_id: int) -> LearningProgressResponse:
+    summary = load_progress_summary(db, user_id)
+    return _progress_payload(summary, _get_completed_set(db, user_id), _week_status_map(db, user_id))
 
 
 @router.post("/generate", response_model=LearningPathResponse)
 def generate_path(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Generate personalized learning path."""
     if not current_user.career_goal:
         raise HTTPException(status_code=400, detail="Please set your career goal first")
 
-    assessments = db.query(Assessment).filter(Assessment.user_id == current_user.id).all()
-
-    user_skills = {}
-    for assessment in assessments:
-        if assessment.skill_name not in user_skills:
-            user_skills[assessment.skill_name] = assessment.score
-        else:
-            if assessment.score > user_skills[assessment.skill_name]:
-                user_skills[assessment.skill_name] = assessment.score
-
-    gaps = calculate_skill_gaps(user_skills, current_user.career_goal)
-    weekly_paths_data = generate_learning_path(gaps, current_user.hours_per_week)
+    user_skills = best_scores(db, current_user.id)
 
-    db.query(LearningPath).filter(LearningPath.user_id == current_user.id).delete()
-    db.query(LearningProgress).filter(LearningProgress.user_id == current_user.id).delete()
-
-    weekly_paths = []
-    for week_data in weekly_paths_data:
-        for skill_name in week_data.get("skills", [week_data["skill_name"]]):
-            learning_path = LearningPath(
-                user_id=current_user.id,
-                skill_name=skill_name,
-                week_number=week_data["week_number"],
-                resources=week_data["resources"],
-                estimated_hours=week_data["estimated_hours"] / len(week_data.get("skills", [1]))
-            )
-            db.add(learning_path)
-
-        resources = []
-        for r in week_data["resources"]:
-            if isinstance(r, dict):
-                resource = {
-                    "title": r.get("title", "Untitled Resource"),
-                    "type": r.get("type", "course"),
-                    "url": r.get("url"),
-                    "estimated_hours": r.get("estimated_hours", 1.0)
-                }
-                resources.append(LearningResource(**resource))
-            else:
-                resources.append(r)
-
-        weekly_paths.append(WeeklyLearningPath(
-            week_number=week_data["week_number"],
-            skill_name=week_data["skill_name"],
-            resources=resources,
-            estimated_hours=week_data["estimated_hours"],
-            status="pending",
-            explanation=week_data.get("explanation", []),
-            completed_resources=[],
-        ))
+    weekly_paths_data = take_candidate_path(
+        current_user.id,
+        current_user.career_goal,
+        current_user.hours_per_week,
+        user_skills,
+    )
+    if weekly_paths_data is None:
+        gaps = calculate_skill_gaps(user_skills, current_user.career_goal)
+        weekly_paths_data = generate_learning_path(gaps, current_user.hours_per_week)
 
+    version = write_path_version(db, current_user.id, weekly_paths_data, source="generate")
+    activate_path_version(db, current_user.id, version.id)
     db.commit()
 
-    return LearningPathResponse(
-        total_weeks=len(weekly_paths),
-        weekly_paths=weekly_paths
-    )
+    return _path_response(db, current_user.id, load_path_weeks(db, current_user.id))
 
 class ProgressUpdate(BaseModel):
     skill_name: str
@@ -214,140 +178,105 @@ class ProgressUpdate(BaseModel):
 @router.post("/adapt", response_model=LearningPathAdaptationResponse)
 def adapt_path(
     progress_updates: list[ProgressUpdate],
-    current_user: User = Depends(get_current_user),
+    explain: bool = Query(False),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    """Adapt learning path based on user progress."""
+    """Adapt learning path based on user progress (local rules; `explain` adds an LLM rewording)."""
     if not current_user.career_goal:
         raise HTTPException(status_code=400, detail="Please set your career goal first")
 
-    learning_paths = db.query(LearningPath).filter(
-        LearningPath.user_id == current_user.id
-    ).order_by(LearningPath.week_number).all()
+    weeks = load_path_weeks(db, current_user.id)
 
-    if not learning_paths:
+    if not weeks:
         raise HTTPException(status_code=404, detail="No learning path found. Please generate one first.")
 
     progress_data = {update.skill_name: update.progress_percentage for update in progress_updates}
 
-    weeks_dict = _group_paths_by_week(learning_paths)
-    current_path = []
-    for week_num in sorted(weeks_dict.keys()):
-        week_data = weeks_dict[week_num]
-        current_path.append({
-            "week_number": week_data["week_number"],
-            "skill_name": week_data["skills"][0] if len(week_data["skills"]) == 1 else "Multiple Skills",
-            "skills": week_data["skills"],
-            "resources": week_data["resources"],
-            "estimated_hours": week_data["total_hours"],
-            "status": week_data["status"]
-        })
-
-    adaptation_result = adapt_learning_path(current_path, progress_data, current_user.hours_per_week)
-
-    db.query(LearningPath).filter(LearningPath.user_id == current_user.id).delete()
-
-    adapted_paths = adaptation_result["adapted_path"]
-    weekly_paths = []
-
-    for week_data in adapted_paths:
-        week_resources = _ensure_week_resources(
-            week_data.get("resources", []),
-            week_data.get("skill_name") or week_data.get("skills", ["Skill"])[0],
+    current_path = [week_to_dict(week) for week in weeks]
+    week_completion = {
+        row.week_number: (row.completed_count, row.resource_count)
+        for row in db.query(LearningWeekProgress).filter(LearningWeekProgress.user_id == current_user.id).all()
+    }
+    teachback_stats: Dict[int, Dict[str, int]] = {}
+    for week_number, passed, count in (
+        db.query(TeachBack.week_number, TeachBack.passed, func.count(TeachBack.id))
+        .filter(TeachBack.user_id == current_user.id)
+        .group_by(TeachBack.week_number, TeachBack.passed)
+        .all()
+    ):
+        teachback_stats.setdefault(week_number, {})["passed" if passed else "failed"] = count
+    velocity = calculate_progress_velocity([
+        {
+            "skill_name": row.skill_name,
+            "score": row.score,
+            "created_at": row.created_at.isoformat() if row.created_at else "",
+        }
+        for row in (
+            db.query(Assessment.skill_name, Assessment.score, Assessment.created_at)
+            .filter(Assessment.user_id == current_user.id)
+            .all()
         )
-        for skill_name in week_data.get("skills", [week_data.get("skill_name", "")]):
-            learning_path = LearningPath(
-                user_id=current_user.id,
-                skill_name=skill_name,
-                week_number=week_data["week_number"],
-                resources=week_resources,
-                estimated_hours=week_data.get("estimated_hours", 0) / len(week_data.get("skills", [1])),
-                status=week_data.get("status", "pending")
-            )
-            db.add(learning_path)
+    ])
+
+    adaptation_result = adapt_learning_path(
+        current_path,
+        progress_data,
+        current_user.hours_per_week,
+        week_completion=week_completion,
+        teachback_stats=teachback_stats,
+        velocity=velocity,
+    )
+    changes = adaptation_result["changes"]
+    if explain:
+        changes = explain_adaptation(changes, progress_data)
 
-        resources = [
-            LearningResource(**r) if isinstance(r, dict) else r
-            for r in week_resources
-        ]
+    if adaptation_result["changed"]:
+        version = write_path_version(db, current_user.id, adaptation_result["adapted_path"], source="adapt")
+        activate_path_version(db, current_user.id, version.id)
+        db.commit()
 
-        weekly_paths.append(WeeklyLearningPath(
-            week_number=week_data["week_number"],
-            skill_name=week_data.get("skill_name", ""),
-            resources=resources[:RESOURCE_LIMIT],
-            estimated_hours=week_data.get("estimated_hours", 0),
-            status=week_data.get("status", "pending"),
-            is_revised=week_data.get("is_revision", False),
-            completed_resources=[],
-        ))
-
-    db.commit()
-
-    adapted_response = LearningPathResponse(
-        total_weeks=len(weekly_paths),
-        weekly_paths=weekly_paths
-    )
+    adapted_response = _path_response(db, current_user.id, load_path_weeks(db, current_user.id))
 
     return LearningPathAdaptationResponse(
         adapted_path=adapted_response,
-        explanation=adaptation_result["changes"]
+        explanation=changes
     )
 
 
 @router.get("/progress", response_model=LearningProgressResponse)
-def get_progress(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_progress(
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get learning path progress for the current user."""
-    learning_paths = db.query(LearningPath).filter(
-        LearningPath.user_id == current_user.id
-    ).order_by(LearningPath.week_number).all()
-
-    if not learning_paths:
+    summary = await load_progress_summary_async(db, current_user.id)
+    if summary is None:
         raise HTTPException(status_code=404, detail="No learning path found.")
 
-    weeks_dict = _group_paths_by_week(learning_paths)
-    completed = _get_completed_set(db, current_user.id)
-    stats = _compute_progress_stats(weeks_dict, completed)
-
-    return LearningProgressResponse(
-        completed=[
-            ProgressItem(week_number=w, resource_index=idx)
-            for w, idx in sorted(completed)
-        ],
-        week_status=stats["week_status"],
-        overall_pct=stats["overall_pct"],
-        resources_completed=stats["resources_completed"],
-        total_resources=stats["total_resources"],
+    return _progress_payload(
+        summary,
+        await _get_completed_set_async(db, current_user.id),
+        await _week_status_map_async(db, current_user.id),
     )
 
 
 @router.post("/progress", response_model=LearningProgressResponse)
 def toggle_progress(
     toggle: ProgressToggle,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
     local_date: str = Depends(get_local_date),
 ):
     """Toggle completion of a learning resource."""
-    learning_paths = db.query(LearningPath).filter(
-        LearningPath.user_id == current_user.id,
-        LearningPath.week_number == toggle.week_number,
-    ).all()
-
-    if not learning_paths:
+    if load_progress_summary(db, current_user.id) is None:
         raise HTTPException(status_code=404, detail="Week not found in learning path.")
 
-    weeks_dict = _group_paths_by_week(
-        db.query(LearningPath).filter(LearningPath.user_id == current_user.id).all()
-    )
-    week_data = weeks_dict.get(toggle.week_number)
-    if not week_data:
+    week = get_week_progress(db, current_user.id, toggle.week_number)
+    if not week:
         raise HTTPException(status_code=404, detail="Week not found.")
 
-    resource_count = min(len(week_data["resources"]), RESOURCE_LIMIT)
-    if toggle.resource_index < 0 or toggle.resource_index >= resource_count:
+    if toggle.resource_index < 0 or toggle.resource_index >= week.resource_count:
         raise HTTPException(status_code=400, detail="Invalid resource index.")
 
     existing = db.query(LearningProgress).filter(
@@ -379,54 +308,98 @@ def toggle_progress(
                 week_number=toggle.week_number,
                 resource_index=toggle.resource_index,
             ))
+            apply_progress_delta(db, current_user.id, toggle.week_number, toggle.resource_index, 1)
         record_activity(db, current_user.id, local_date)
     else:
         if existing:
             db.delete(existing)
-
-    completed = _get_completed_set(db, current_user.id)
-    db.flush()
-    completed = _get_completed_set(db, current_user.id)
-    stats = _compute_progress_stats(weeks_dict, completed)
-
-    for week_num, status in stats["week_status"].items():
-        _update_week_status_in_db(db, current_user.id, week_num, status)
+            apply_progress_delta(db, current_user.id, toggle.week_number, toggle.resource_index, -1)
 
     db.commit()
 
-    completed = _get_completed_set(db, current_user.id)
-    stats = _compute_progress_stats(weeks_dict, completed)
-
-    return LearningProgressResponse(
-        completed=[
-            ProgressItem(week_number=w, resource_index=idx)
-            for w, idx in sorted(completed)
-        ],
-        week_status=stats["week_status"],
-        overall_pct=stats["overall_pct"],
-        resources_completed=stats["resources_completed"],
-        total_resources=stats["total_resources"],
-    )
+    return _progress_response(db, current_user.id)
 
 
 @router.get("", response_model=LearningPathResponse)
 def get_learning_path(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get current user's learning path."""
-    learning_paths = db.query(LearningPath).filter(
-        LearningPath.user_id == current_user.id
-    ).order_by(LearningPath.week_number).all()
+    weeks = load_path_weeks(db, current_user.id)
 
-    if not learning_paths:
+    if not weeks:
         raise HTTPException(status_code=404, detail="No learning path found. Please generate one first.")
 
-    weeks_dict = _group_paths_by_week(learning_paths)
-    completed = _get_completed_set(db, current_user.id)
-    weekly_paths = _build_weekly_paths(weeks_dict, completed)
+    return _path_response(db, current_user.id, weeks)
 
-    return LearningPathResponse(
-        total_weeks=len(weekly_paths),
-        weekly_paths=weekly_paths
+
+@router.get("/versions", response_model=list[PathVersionInfo])
+def get_path_versions(
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """List every stored version of the user's learning path, newest first."""
+    versions = list_versions(db, current_user.id)
+    active_id = active_version_id(db, current_user.id)
+
+    skills_by_version: Dict[int, List[str]] = {v.id: [] for v in versions}
+    if versions:
+        rows = (
+            db.query(PathVersionWeek.version_id, PathWeek.skill_name)
+            .join(PathWeek, PathWeek.id == PathVersionWeek.week_id)
+            .filter(PathVersionWeek.version_id.in_(list(skills_by_version)))
+            .order_by(PathVersionWeek.version_id, PathVersionWeek.week_number)
+            .all()
+        )
+        for version_id, skill_name in rows:
+            skills_by_version[version_id].append(skill_name)
+
+    return [
+        PathVersionInfo(
+            id=v.id,
+            source=v.source,
+            created_at=v.created_at,
+            total_weeks=len(skills_by_version[v.id]),
+            skills=skills_by_version[v.id],
+            active=v.id == active_id,
+        )
+        for v in versions
+    ]
+
+
+@router.get("/versions/diff", response_model=PathVersionDiffResponse)
+def diff_path_versions(
+    to_version: int = Query(...),
+    from_version: Optional[int] = Query(None),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """Compare two path versions week by week (defaults to the active version)."""
+    if from_version is None:
+        from_version = active_version_id(db, current_user.id)
+    for version_id in (from_version, to_version):
+        if version_id is not None and not get_version(db, current_user.id, version_id):
+            raise HTTPException(status_code=404, detail="Path version not found.")
+
+    return PathVersionDiffResponse(
+        from_version=from_version,
+        to_version=to_version,
+        weeks=[PathVersionWeekDiff(**item) for item in diff_versions(db, from_version, to_version)],
     )
+
+
+@router.post("/versions/{version_id}/activate", response_model=LearningPathResponse)
+def activate_path(
+    version_id: int,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """Switch back (or forward) to a stored path version without regenerating it."""
+    if not get_version(db, current_user.id, version_id):
+        raise HTTPException(status_code=404, detail="Path version not found.")
+
+    activate_path_version(db, current_user.id, version_id)
+    db.commit()
+
+    return _path_response(db, current_user.id, load_path_weeks(db, current_user.id))
@@ -3,7 +3,8 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import User
 from app.schemas import ProfileUpdate, UserResponse
-from app.auth import get_current_user
+from app.auth import get_current_user, invalidate_principal
+from app.precompute import schedule_precompute
 
 router = APIRouter(prefix="/api/profile", tags=["profile"])
 
@@ -29,6 +30,9 @@ def update_profile(
         current_user.hours_per_week = profile_data.hours_per_week
     
     db.commit()
+    invalidate_principal(current_user.id)
+    if profile_data.career_goal is not None or profile_data.hours_per_week is not None:
+        schedule_precompute(current_user.id)  # refresh stored gaps and the candidate path
     db.refresh(current_user)
     
     return current_user
@@ -1,31 +1,31 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.auth import get_current_user
-from app.database import get_db
-from app.models import User
+from app.auth import Principal, get_current_principal
+from app.database import get_async_db, get_db
 from app.schemas import StreakResponse
-from app.streak import get_local_date, get_streak, record_activity
+from app.streak import get_local_date, get_streak_async, record_activity
 
 router = APIRouter(prefix="/api/streak", tags=["streak"])
 
 
 @router.get("", response_model=StreakResponse)
-def read_streak(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+async def read_streak(
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db),
     local_date: str = Depends(get_local_date),
 ):
-    return StreakResponse(**get_streak(db, current_user.id, local_date))
+    return StreakResponse(**await get_streak_async(db, current_user.id, local_date))
 
 
 @router.post("", response_model=StreakResponse)
 @router.post("/ping", response_model=StreakResponse)
 def ping_streak(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
     local_date: str = Depends(get_local_date),
 ):
-    streak = record_activity(db, current_user.id, local_date)
+    streak = record_activity(db, current_user.id, local_date, with_dates=True)
     db.commit()
     return StreakResponse(**streak)
@@ -2,9 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
-from app.auth import get_current_user
+from app.auth import Principal, get_current_principal
 from app.database import get_db
-from app.models import LearningPath, LearningProgress, TeachBack, User
+from app.freshness import touch_skills
+from app.models import LearningProgress, TeachBack
+from app.path_progress import apply_progress_delta
+from app.path_store import get_path_week, resource_to_dict
 from app.schemas import TeachbackResponse, TeachbackStart, TeachbackSubmit
 from app.streak import get_local_date, record_activity
 from app.ai.ollama_client import chat_json
@@ -23,21 +26,14 @@ class TeachbackScore(BaseModel):
 
 
 def _week_and_resource(db: Session, user_id: int, week_number: int, resource_index: int):
-    rows = db.query(LearningPath).filter(
-        LearningPath.user_id == user_id,
-        LearningPath.week_number == week_number,
-    ).all()
-    if not rows:
+    week = get_path_week(db, user_id, week_number)
+    if not week:
         raise HTTPException(status_code=404, detail="Week not found in learning path.")
-    resources = []
-    for row in rows:
-        resources.extend(row.resources or [])
-    if resource_index < 0 or resource_index >= len(resources):
+    if resource_index < 0 or resource_index >= len(week.resources):
         raise HTTPException(status_code=400, detail="Invalid resource index.")
-    resource = resources[resource_index] if isinstance(resources[resource_index], dict) else {}
-    skill_name = rows[0].skill_name
+    resource = resource_to_dict(week.resources[resource_index])
     title = resource.get("title") or "this resource"
-    return skill_name, title, resource
+    return week, title, resource
 
 
 def _prompt_for(skill_name: str, title: str) -> str:
@@ -81,18 +77,20 @@ def _complete_resource(db: Session, user_id: int, week_number: int, resource_ind
             week_number=week_number,
             resource_index=resource_index,
         ))
+        apply_progress_delta(db, user_id, week_number, resource_index, 1)
     record_activity(db, user_id, local_date)
 
 
 @router.post("/start", response_model=TeachbackResponse)
 def start_teachback(
     body: TeachbackStart,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
-    skill_name, title, _ = _week_and_resource(
+    week, title, _ = _week_and_resource(
         db, current_user.id, body.week_number, body.resource_index
     )
+    skill_name = week.skill_name
     prompt = _prompt_for(skill_name, title)
     passed = db.query(TeachBack).filter(
         TeachBack.user_id == current_user.id,
@@ -123,13 +121,14 @@ def start_teachback(
 @router.post("/submit", response_model=TeachbackResponse)
 def submit_teachback(
     body: TeachbackSubmit,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
     local_date: str = Depends(get_local_date),
 ):
-    skill_name, title, _ = _week_and_resource(
+    week, title, _ = _week_and_resource(
         db, current_user.id, body.week_number, body.resource_index
     )
+    skill_name = week.skill_name
     prompt = _prompt_for(skill_name, title)
     answer = (body.answer or "").strip()
     if len(answer) < 12:
@@ -165,6 +164,7 @@ def submit_teachback(
     db.add(row)
     if passed:
         _complete_resource(db, current_user.id, body.week_number, body.resource_index, local_date)
+        touch_skills(db, current_user.id, week.skills or [skill_name])
     db.commit()
 
     return TeachbackResponse(
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -46,11 +46,105 @@ class AssessmentSubmission(BaseModel):
     skill_name: str
     answers: Dict[int, int]  # question_id -> selected_option_index
 
+class MCQQuestionImport(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    skill_name: str = Field(min_length=1)
+    question_text: str = Field(min_length=1)
+    options: List[str] = Field(min_length=2, max_length=6)
+    correct_answer: int
+    difficulty: int = Field(ge=1, le=5)
+    explanation: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _answer_in_range(self):
+        if not 0 <= self.correct_answer < len(self.options):
+            raise ValueError("correct_answer must index into options")
+        return self
+
+class QuestionImportReport(BaseModel):
+    read: int
+    inserted: int
+    duplicates: int
+    invalid: int
+    errors: List[Dict[str, Any]]
+    dry_run: bool
+    seconds: float
+    rows_per_second: int
+    bank_version: Optional[int] = None
+
+class QuestionCandidateResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    skill_name: str
+    question_text: str
+    options: List[str]
+    correct_answer: int
+    difficulty: int
+    explanation: Optional[str] = None
+    status: str
+    career_goal: Optional[str] = None
+    question_id: Optional[int] = None
+
+class QuestionGenerationReport(BaseModel):
+    skills: List[str]
+    generated: int
+    queued: int
+    duplicates: int
+    invalid: int
+    failed: List[Dict[str, Any]]
+
+class QuestionGenerationRunResponse(BaseModel):
+    id: int
+    status: str  # running | done | failed
+    report: Optional[QuestionGenerationReport] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class AssessmentBatchItem(BaseModel):
+    skill_name: str
+    answers: Dict[int, int]
+    taken_on: Optional[str] = None  # local YYYY-MM-DD the test was taken offline
+
+class AssessmentBatchSubmission(BaseModel):
+    items: List[AssessmentBatchItem]
+
+class AssessmentBundleSkill(BaseModel):
+    name: str
+    questions: List[MCQQuestionResponse]
+
+class AssessmentBundle(BaseModel):
+    version: int
+    skills: List[AssessmentBundleSkill]
+
 class AssessmentResult(BaseModel):
     skill_name: str
     score: float
     level: str
     breakdown: Dict[str, Any]
+    assessment_id: Optional[int] = None
+    feedback_status: str = "pending"
+
+class AdaptiveStepRequest(BaseModel):
+    skill_name: str
+    answers: Dict[int, int] = {}  # every answer so far, question_id -> option index
+
+class AdaptiveStepResponse(BaseModel):
+    skill_name: str
+    done: bool
+    question: Optional[MCQQuestionResponse] = None
+    questions_answered: int
+    max_questions: int
+    ability: float
+    standard_error: float
+    result: Optional[AssessmentResult] = None
+
+class AssessmentFeedbackResponse(BaseModel):
+    assessment_id: int
+    feedback_status: str  # "pending", "ready", "unavailable"
+    feedback: Optional[str] = None
 
 class SkillInfo(BaseModel):
     name: str
@@ -87,6 +181,7 @@ class CareerReadinessResponse(BaseModel):
 class StreakResponse(BaseModel):
     count: int
     last: Optional[str] = None
+    longest: int = 0
     dates: List[str] = []
 
 class CareerForkRole(BaseModel):
@@ -109,6 +204,12 @@ class FreshnessItem(BaseModel):
     status: str
     days_stale: int = 0
 
+class RecertQueueEntry(BaseModel):
+    skill_name: str
+    status: str
+    days_stale: int = 0
+    scheduled_at: Optional[datetime] = None
+
 class DashboardResponse(BaseModel):
     user: UserResponse
     skill_radar: List[SkillRadarData]
@@ -118,6 +219,7 @@ class DashboardResponse(BaseModel):
     streak: Optional[StreakResponse] = None
     career_fork: Optional[CareerForkResponse] = None
     freshness: List[FreshnessItem] = []
+    recert_queue: List[RecertQueueEntry] = []
     weekly_plan: Optional["WeeklyPlanResponse"] = None
 
 class TeachbackStart(BaseModel):
@@ -147,9 +249,12 @@ class RecertResult(BaseModel):
     level: str
     passed: bool
     breakdown: Dict[str, Any]
+    assessment_id: Optional[int] = None
+    feedback_status: str = "pending"
 
 # Learning Path Schemas
 class LearningResource(BaseModel):
+    id: Optional[int] = None
     title: str
     type: str  # "video", "article", "course", "practice"
     url: Optional[str] = None
@@ -199,6 +304,27 @@ class LearningPathAdaptationResponse(BaseModel):
     adapted_path: LearningPathResponse
     explanation: List[str]
 
+class PathVersionInfo(BaseModel):
+    id: int
+    source: str
+    created_at: Optional[datetime] = None
+    total_weeks: int
+    skills: List[str] = []
+    active: bool = False
+
+class PathVersionWeekDiff(BaseModel):
+    week_number: int
+    change: str  # "added", "removed", "changed", "unchanged"
+    from_skill: Optional[str] = None
+    to_skill: Optional[str] = None
+    from_hours: Optional[float] = None
+    to_hours: Optional[float] = None
+
+class PathVersionDiffResponse(BaseModel):
+    from_version: Optional[int] = None
+    to_version: int
+    weeks: List[PathVersionWeekDiff]
+
 # Profile Schemas
 class ProfileUpdate(BaseModel):
     full_name: Optional[str] = None
@@ -0,0 +1,32 @@
+"""A user's skill vector: best assessment score per skill.
+
+Aggregated by the database (GROUP BY skill_name over the
+(user_id, skill_name, score) index) instead of loading every assessment row,
+answers included, and reducing it in Python.
+"""
+
+from typing import Dict, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models import Assessment
+
+
+def _vector_query(user_id: int):
+    return (
+        select(Assessment.skill_name, func.max(Assessment.score), func.count())
+        .where(Assessment.user_id == user_id)
+        .group_by(Assessment.skill_name)
+        .order_by(Assessment.skill_name)
+    )
+
+
+def skill_vector(db: Session, user_id: int) -> Tuple[Dict[str, float], int]:
+    """(best score per skill, total assessments taken)."""
+    rows = db.execute(_vector_query(user_id)).all()
+    return {skill: best for skill, best, _ in rows}, sum(count for _, _, count in rows)
+
+
+def best_scores(db: Session, user_id: int) -> Dict[str, float]:
+    return skill_vector(db, user_id)[0]
@@ -1,12 +1,23 @@
+import threading
+from collections import OrderedDict
 from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import Header
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models import UserActivity
-
-EMPTY_STREAK = {"count": 0, "last": None, "dates": []}
+from app.models import UserActivityYear, UserStreak
+from app.activity_bitmap import (
+    load_history,
+    load_history_async,
+    mark_day,
+    recent_days,
+    recent_days_async,
+    runs,
+)
 
 
 def utc_today() -> str:
@@ -31,52 +42,219 @@ def get_local_date(x_local_date: Optional[str] = Header(default=None, alias="X-L
     return parse_activity_date(x_local_date)
 
 
-def activity_dates(db: Session, user_id: int) -> list[str]:
-    rows = (
-        db.query(UserActivity.activity_date)
-        .filter(UserActivity.user_id == user_id)
-        .order_by(UserActivity.activity_date.asc())
-        .all()
+HEATMAP_DAYS = 60
+
+
+def _previous_day(day: str) -> str:
+    return (date.fromisoformat(day) - timedelta(days=1)).isoformat()
+
+
+def _history_state(db: Session, user_id: int) -> UserStreak:
+    """An unsaved streak row computed from the activity bitsets."""
+    return _state_from_history(user_id, *load_history(db, user_id))
+
+
+def _state_from_history(user_id: int, origin: Optional[date], history: int) -> UserStreak:
+    current, longest, top = runs(history)
+    return UserStreak(
+        user_id=user_id,
+        current_count=current,
+        longest=longest,
+        last_date=(origin + timedelta(days=top)).isoformat() if origin and top >= 0 else None,
     )
-    return [row[0] for row in rows]
 
 
-def compute_streak(dates: list[str], today: str) -> dict:
-    unique = sorted({d for d in dates if d})
-    if not unique:
-        return {**EMPTY_STREAK}
+def rebuild_streak(db: Session, user_id: int) -> UserStreak:
+    """Recompute the streak row from the activity bitsets."""
+    fresh = _history_state(db, user_id)
+    state = db.get(UserStreak, user_id)
+    if state is not None:
+        state.current_count = fresh.current_count
+        state.longest = fresh.longest
+        state.last_date = fresh.last_date
+        db.flush()
+        return state
+    try:
+        with db.begin_nested():
+            db.add(fresh)
+    except IntegrityError:
+        # A concurrent first ping stored the row already; build on theirs.
+        state = db.get(UserStreak, user_id)
+        if state is None:
+            raise
+        return state
+    return fresh
+
+
+def _window_start(end: str) -> str:
+    return (date.fromisoformat(end) - timedelta(days=HEATMAP_DAYS - 1)).isoformat()
+
+
+def _load_dates(db: Session, user_id: int, last_date: Optional[str], today: str) -> list[str]:
+    """Active days in the HEATMAP_DAYS window ending today (or the last active day, if later)."""
+    end = max(today, last_date or today)
+    return recent_days(db, user_id, date.fromisoformat(end), HEATMAP_DAYS)
+
+
+async def _load_dates_async(db: AsyncSession, user_id: int, last_date: Optional[str], today: str) -> list[str]:
+    end = max(today, last_date or today)
+    return await recent_days_async(db, user_id, date.fromisoformat(end), HEATMAP_DAYS)
+
+
+# In-process view of committed streak state, so the many same-day pings from
+# one user skip the database. Entries are published only after the writing
+# transaction commits; another process advancing the streak just means the
+# next new-day call here misses the cache and reads the row.
+STATE_CACHE_SIZE = 50000
+_state_lock = threading.Lock()
+_states: "OrderedDict[int, dict]" = OrderedDict()
+
+
+def _cached_state(user_id: int) -> Optional[dict]:
+    with _state_lock:
+        snapshot = _states.get(user_id)
+        if snapshot is not None:
+            _states.move_to_end(user_id)
+        return snapshot
+
+
+def _publish(snapshots: dict) -> None:
+    with _state_lock:
+        for user_id, snapshot in snapshots.items():
+            _states[user_id] = snapshot
+            _states.move_to_end(user_id)
+        while len(_states) > STATE_CACHE_SIZE:
+            _states.popitem(last=False)
 
-    last = unique[-1]
-    yesterday = (date.fromisoformat(today) - timedelta(days=1)).isoformat()
-    if last not in (today, yesterday):
-        return {"count": 0, "last": last, "dates": unique[-60:]}
 
-    count = 1
-    cursor = date.fromisoformat(last)
-    seen = set(unique)
-    while True:
-        prev = (cursor - timedelta(days=1)).isoformat()
-        if prev not in seen:
-            break
-        count += 1
-        cursor = date.fromisoformat(prev)
+def forget_streak(user_id: Optional[int] = None) -> None:
+    with _state_lock:
+        if user_id is None:
+            _states.clear()
+        else:
+            _states.pop(user_id, None)
 
-    return {"count": count, "last": last, "dates": unique[-60:]}
 
+def _stage(db: Session, user_id: int, snapshot: dict, wrote: bool) -> None:
+    """Publish now for pure reads, after commit when this transaction wrote."""
+    pending = db.info.setdefault("streak_snapshots", {})
+    if wrote or user_id in pending:
+        pending[user_id] = snapshot
+    else:
+        _publish({user_id: snapshot})
 
-def record_activity(db: Session, user_id: int, local_date: Optional[str] = None) -> dict:
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session) -> None:
+    snapshots = session.info.pop("streak_snapshots", None)
+    if snapshots:
+        _publish(snapshots)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_uncommitted(session) -> None:
+    session.info.pop("streak_snapshots", None)
+
+
+def _snapshot(state: UserStreak, dates: Optional[list[str]]) -> dict:
+    return {
+        "current_count": state.current_count,
+        "last_date": state.last_date,
+        "longest": state.longest,
+        "dates": dates,
+    }
+
+
+def _summary(snapshot: dict, today: str, with_dates: bool = False) -> dict:
+    last = snapshot["last_date"]
+    alive = last is not None and last >= _previous_day(today)
+    summary = {"count": snapshot["current_count"] if alive else 0, "last": last, "longest": snapshot["longest"]}
+    if with_dates:
+        start = _window_start(max(today, last or today))
+        summary["dates"] = [d for d in snapshot["dates"] if d >= start]
+    return summary
+
+
+def _load_state(db: Session, user_id: int) -> UserStreak:
+    state = db.get(UserStreak, user_id)
+    return state if state is not None else rebuild_streak(db, user_id)
+
+
+def record_activity(db: Session, user_id: int, local_date: Optional[str] = None, with_dates: bool = False) -> dict:
+    """Mark `local_date` active and advance the streak row.
+
+    A day already recorded (per the in-process cache) costs no queries at
+    all; otherwise one primary-key read. A new day sets the day's bit and
+    bumps the counters; a backdated day (offline sync) is the only case that
+    replays history.
+    """
     day = parse_activity_date(local_date)
-    exists = (
-        db.query(UserActivity)
-        .filter(UserActivity.user_id == user_id, UserActivity.activity_date == day)
-        .first()
-    )
-    if not exists:
-        db.add(UserActivity(user_id=user_id, activity_date=day))
+    cached = _cached_state(user_id)
+    if cached is not None and (
+        day == cached["last_date"] or (cached["dates"] is not None and day in cached["dates"])
+    ):
+        if not with_dates or cached["dates"] is not None:
+            return _summary(cached, day, with_dates)
+
+    state = _load_state(db, user_id)
+    dates = cached["dates"] if cached is not None and cached["last_date"] == state.last_date else None
+    wrote = False
+    if state.last_date is None or day > state.last_date:
+        mark_day(db, user_id, date.fromisoformat(day))
+        extends = state.last_date is not None and _previous_day(day) == state.last_date
+        state.current_count = state.current_count + 1 if extends else 1
+        state.longest = max(state.longest or 0, state.current_count)
+        state.last_date = day
         db.flush()
-    return get_streak(db, user_id, day)
+        wrote = True
+        if dates is not None:
+            dates = [d for d in dates if d >= _window_start(day)] + [day]
+    elif day < state.last_date:
+        if mark_day(db, user_id, date.fromisoformat(day)):
+            db.flush()
+            state = rebuild_streak(db, user_id)
+            wrote = True
+            dates = None
+
+    if with_dates and dates is None:
+        dates = _load_dates(db, user_id, state.last_date, day)
+    snapshot = _snapshot(state, dates)
+    _stage(db, user_id, snapshot, wrote)
+    return _summary(snapshot, day, with_dates)
 
 
 def get_streak(db: Session, user_id: int, local_date: Optional[str] = None) -> dict:
     today = parse_activity_date(local_date)
-    return compute_streak(activity_dates(db, user_id), today)
+    cached = _cached_state(user_id)
+    if cached is not None and cached["dates"] is not None:
+        return _summary(cached, today, with_dates=True)
+    # Users with no streak row yet are computed without saving one; GETs never write.
+    state = db.get(UserStreak, user_id) or _history_state(db, user_id)
+    snapshot = _snapshot(state, _load_dates(db, user_id, state.last_date, today))
+    _stage(db, user_id, snapshot, wrote=False)
+    return _summary(snapshot, today, with_dates=True)
+
+
+async def get_streak_async(db: AsyncSession, user_id: int, local_date: Optional[str] = None) -> dict:
+    """`get_streak` on an async session; a warm cache answers without awaiting the database."""
+    today = parse_activity_date(local_date)
+    cached = _cached_state(user_id)
+    if cached is not None and cached["dates"] is not None:
+        return _summary(cached, today, with_dates=True)
+    state = await db.get(UserStreak, user_id)
+    if state is None:
+        state = _state_from_history(user_id, *await load_history_async(db, user_id))
+    snapshot = _snapshot(state, await _load_dates_async(db, user_id, state.last_date, today))
+    _stage(db.sync_session, user_id, snapshot, wrote=False)
+    return _summary(snapshot, today, with_dates=True)
+
+
+def repair_streaks(db: Session) -> int:
+    """Rebuild every user's streak row from history; returns users repaired."""
+    user_ids = [row[0] for row in db.query(UserActivityYear.user_id).distinct().all()]
+    for user_id in user_ids:
+        rebuild_streak(db, user_id)
+    db.query(UserStreak).filter(~UserStreak.user_id.in_(user_ids)).delete(synchronize_session=False)
+    db.commit()
+    forget_streak()
+    return len(user_ids)
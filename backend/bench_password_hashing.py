@@ -0,0 +1,43 @@
+"""
+Benchmark login password checks: logins/sec at a bcrypt cost, serially and
+through a process pool the size used by the API (PASSWORD_HASH_WORKERS,
+default one per core). Use it to pick BCRYPT_ROUNDS for the hardware.
+"""
+
+import sys
+import os
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.password_hashing import BCRYPT_ROUNDS, HASH_WORKERS, check_password, hash_password
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bcrypt login throughput")
+    parser.add_argument("--rounds", type=int, default=BCRYPT_ROUNDS, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=HASH_WORKERS, help="Process pool size")
+    parser.add_argument("--logins", type=int, default=0, help="Checks to run (default: 8 per worker)")
+    args = parser.parse_args()
+
+    logins = args.logins or 8 * args.workers
+    hashed = hash_password("benchmark-password", rounds=args.rounds)
+
+    started = time.perf_counter()
+    check_password("benchmark-password", hashed)
+    single = time.perf_counter() - started
+    print(f"cost {args.rounds}: {single * 1000:.0f} ms per check, {1 / single:.1f} logins/sec on one core")
+
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        list(pool.map(check_password, ["warm"] * args.workers, [hashed] * args.workers))
+        started = time.perf_counter()
+        list(pool.map(check_password, ["benchmark-password"] * logins, [hashed] * logins))
+        elapsed = time.perf_counter() - started
+    rate = logins / elapsed
+    print(
+        f"{args.workers} workers: {logins} checks in {elapsed:.2f}s, "
+        f"{rate:.1f} logins/sec ({rate / args.workers:.1f} per core)"
+    )
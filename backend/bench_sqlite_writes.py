@@ -0,0 +1,91 @@
+"""
+Benchmark concurrent write transactions on a scratch SQLite file, with the
+old engine setup ("default") and with the production profile from
+app/db_profile.py ("profile"). Each worker thread commits small
+transactions shaped like activity pings and coach messages.
+"""
+
+import sys
+import os
+import argparse
+import tempfile
+import threading
+import time
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.db_profile import apply_sqlite_pragmas, engine_options, serialize_writes
+from app.migrations import run_migrations
+from app.models import CoachMessage, User, UserStreak
+
+
+def build(url: str, profile: bool):
+    if not profile:
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        return engine, sessionmaker(bind=engine, autoflush=False)
+    engine = create_engine(url, **engine_options(url))
+    apply_sqlite_pragmas(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    serialize_writes(factory)
+    return engine, factory
+
+
+def run(profile: bool, threads: int, per_thread: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine, factory = build(url, profile)
+        run_migrations(engine)
+        with factory() as db:
+            for i in range(threads):
+                db.add(User(id=i + 1, email=f"bench{i}@example.com", hashed_password="x"))
+                db.add(UserStreak(user_id=i + 1, current_count=0, longest=0))
+            db.commit()
+
+        counts = {"ok": 0, "locked": 0}
+        counts_lock = threading.Lock()
+
+        def worker(user_id: int) -> None:
+            for n in range(per_thread):
+                db = factory()
+                try:
+                    state = db.get(UserStreak, user_id)
+                    state.current_count += 1
+                    db.add(CoachMessage(user_id=user_id, role="user", content=f"message {n}"))
+                    db.commit()
+                    outcome = "ok"
+                except OperationalError:
+                    db.rollback()
+                    outcome = "locked"
+                finally:
+                    db.close()
+                with counts_lock:
+                    counts[outcome] += 1
+
+        workers = [threading.Thread(target=worker, args=(i + 1,)) for i in range(threads)]
+        started = time.perf_counter()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+    return {**counts, "seconds": elapsed, "writes_per_second": counts["ok"] / elapsed}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SQLite write throughput")
+    parser.add_argument("--threads", type=int, default=12)
+    parser.add_argument("--per-thread", type=int, default=200)
+    args = parser.parse_args()
+
+    for profile in (False, True):
+        result = run(profile, args.threads, args.per_thread)
+        print(
+            f"{'profile' if profile else 'default'}: {result['ok']} commits, {result['locked']} locked "
+            f"in {result['seconds']:.2f}s = {result['writes_per_second']:.0f} writes/sec"
+        )
@@ -0,0 +1,35 @@
+"""
+Calibrate MCQ question difficulty from stored assessment answers.
+Run after new assessments accumulate; by default only assessments newer than
+the last run are folded in.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+from app.calibration import run_calibration
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate SkillSync question bank")
+    parser.add_argument("--full", action="store_true", help="Recompute from every stored assessment")
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        run = run_calibration(db, incremental=not args.full)
+        elapsed = time.perf_counter() - started
+        print(
+            f"Calibration v{run.version} ({run.mode}): {run.assessments_read} assessments, "
+            f"{run.answers_read} answers in {elapsed:.2f}s"
+        )
+    finally:
+        db.close()
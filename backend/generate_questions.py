@@ -0,0 +1,52 @@
+"""
+Draft MCQ questions for required skills the question bank does not cover.
+Drafts go to the question_candidates review queue; approve them through
+/api/admin/question-candidates before users see them.
+"""
+
+import sys
+import os
+import argparse
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+from app.question_candidates import QUESTIONS_PER_SKILL, find_uncovered_skills, generate_candidates
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate candidate questions for uncovered skills")
+    parser.add_argument("--skill", action="append", help="Generate for this skill (repeatable) instead of scanning career goals")
+    parser.add_argument("--per-minute", type=float, default=30.0, help="LLM calls allowed per minute")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent LLM calls")
+    parser.add_argument("--per-skill", type=int, default=QUESTIONS_PER_SKILL, help="Questions to draft per skill")
+    parser.add_argument("--list", action="store_true", help="Only list uncovered skills")
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        skills = {name: None for name in args.skill} if args.skill else None
+        if args.list:
+            if skills is None:
+                skills = find_uncovered_skills(db, per_minute=args.per_minute, max_workers=args.workers)
+            for name, goal in sorted(skills.items()):
+                print(f"{name} ({goal})")
+            sys.exit(0)
+        report = generate_candidates(
+            db,
+            skills=skills,
+            per_minute=args.per_minute,
+            max_workers=args.workers,
+            per_skill=args.per_skill,
+        )
+    finally:
+        db.close()
+
+    print(
+        f"{len(report['skills'])} skills: {report['generated']} drafted, {report['queued']} queued, "
+        f"{report['duplicates']} duplicates, {report['invalid']} invalid"
+    )
+    for failure in report["failed"]:
+        print(f"  {failure.get('skill_name') or failure['career_goal']}: {failure['error']}")
@@ -0,0 +1,42 @@
+"""
+Bulk-import MCQ questions from a JSONL or CSV file.
+Rows are validated and deduplicated against the existing bank; the import
+runs in one transaction and bumps the question-bank version.
+"""
+
+import sys
+import os
+import argparse
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+from app.question_import import BATCH_SIZE, import_questions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import questions into the SkillSync bank")
+    parser.add_argument("path", help="JSONL or CSV file")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Defaults to the file extension")
+    parser.add_argument("--dry-run", action="store_true", help="Validate and dedupe without writing")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows per bulk insert")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "jsonl")
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        with open(args.path, encoding="utf-8", newline="") as stream:
+            report = import_questions(db, stream, fmt=fmt, dry_run=args.dry_run, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    verb = "Would insert" if args.dry_run else "Inserted"
+    print(
+        f"{verb} {report['inserted']} of {report['read']} rows "
+        f"({report['duplicates']} duplicates, {report['invalid']} invalid) "
+        f"in {report['seconds']}s, {report['rows_per_second']} rows/s"
+    )
+    for error in report["errors"]:
+        print(f"  line {error['line']}: {error['error']}")
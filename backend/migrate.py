@@ -0,0 +1,27 @@
+"""
+Apply pending schema migrations (app/migrations.py) to DATABASE_URL.
+The API also runs them at startup; use this to migrate ahead of a deploy.
+"""
+
+import sys
+import os
+import argparse
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import engine
+from app.migrations import MIGRATIONS, current_version, run_migrations
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate the SkillSync database")
+    parser.add_argument("--status", action="store_true", help="Show the current version without migrating")
+    args = parser.parse_args()
+
+    if args.status:
+        version = current_version(engine)
+        pending = [f"{v:04d}_{name}" for v, name, _ in MIGRATIONS if v > version]
+        print(f"Schema version {version}; pending: {', '.join(pending) or 'none'}")
+    else:
+        applied = run_migrations(engine)
+        print(f"Applied: {', '.join(applied)}" if applied else "Schema is up to date")
@@ -0,0 +1,23 @@
+"""
+Rebuild every user's streak row from the user_activity history.
+Run after restoring activity data or if streak counters ever look wrong.
+"""
+
+import sys
+import os
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+from app.streak import repair_streaks
+
+if __name__ == "__main__":
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        repaired = repair_streaks(db)
+    finally:
+        db.close()
+    print(f"Rebuilt streaks for {repaired} users")
@@ -0,0 +1,44 @@
+"""
+Re-score stored assessments against the current question bank.
+Run after calibrate_questions.py or after fixing an answer key; use --dry-run
+to see what would change first.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+from app.rescoring import CHUNK_SIZE, rescore_assessments
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-score SkillSync assessments")
+    parser.add_argument("--dry-run", action="store_true", help="Report the diff without writing scores")
+    parser.add_argument("--skill", help="Only re-score assessments for this skill")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Assessments per batch")
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        summary = rescore_assessments(db, dry_run=args.dry_run, skill_name=args.skill, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - started
+        verb = "would change" if args.dry_run else "changed"
+        print(
+            f"Scanned {summary['scanned']} assessments in {elapsed:.2f}s; {verb} {summary['changed']} "
+            f"({summary['level_changes']} level changes, {summary['users_affected']} users), "
+            f"mean |delta| {summary['mean_abs_delta']}, max {summary['max_abs_delta']}"
+        )
+        for sample in summary["samples"]:
+            print(
+                f"  #{sample['assessment_id']} {sample['skill_name']}: "
+                f"{sample['old_score']} -> {sample['new_score']} ({sample['new_level']})"
+            )
+    finally:
+        db.close()
@@ -0,0 +1,33 @@
+"""
+Stage recert work for every user from skill freshness.
+Meant to run from cron (e.g. nightly); rewrites the recert queue with each
+user's aging and stale skills and a pre-sampled recert question set.
+"""
+
+import sys
+import os
+import argparse
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal, engine
+from app.migrations import run_migrations
+from app.recert_queue import run_recert_schedule
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Schedule SkillSync recerts")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for question sampling")
+    args = parser.parse_args()
+
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        report = run_recert_schedule(db, seed=args.seed)
+        print(
+            f"Scanned {report['scanned']} skills for {report['users']} users in {report['seconds']:.2f}s: "
+            f"{report['fresh']} fresh, {report['aging']} aging, {report['stale']} stale; "
+            f"queued {report['queued']} ({report['no_questions']} without questions)"
+        )
+    finally:
+        db.close()
@@ -12,17 +12,20 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from sqlalchemy.orm import Session
 from app.database import SessionLocal, engine
-from app.models import Base, MCQQuestion, User
+from app.migrations import run_migrations
+from app.models import MCQQuestion, User
 from app.auth import get_password_hash
+from app.question_bank import bump_bank_version
 
 # Initialize database
-Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 db = SessionLocal()
 
 def seed_mcq_questions(reset: bool = False):
     """Seed MCQ questions for various skills."""
     if reset:
         db.query(MCQQuestion).delete()
+        bump_bank_version(db)
         db.commit()
         print("Cleared existing MCQ questions")
     
@@ -649,6 +652,8 @@ def seed_mcq_questions(reset: bool = False):
             db.add(MCQQuestion(**q_data))
             added += 1
 
+    if added:
+        bump_bank_version(db)
     db.commit()
     print(f"Seeded {added} new MCQ questions ({len(questions_data)} total in seed file)")
 
@@ -0,0 +1,19 @@
+"""Point the app at a scratch SQLite database before any test imports it.
+
+app.database reads DATABASE_URL at import time; test_postgres.py overrides
+it when TEST_DATABASE_URL is set.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("READ_DATABASE_URL", None)
+os.environ["PRECOMPUTE_ENABLED"] = "0"
+os.environ["OLLAMA_BASE_URL"] = "http://127.0.0.1:9"
+os.environ.pop("GROQ_API_KEY", None)
+os.environ.setdefault("ADMIN_EMAILS", "admin@example.com")
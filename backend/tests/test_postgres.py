@@ -0,0 +1,171 @@
+"""Checks against a real PostgreSQL server.
+
+Skipped unless TEST_DATABASE_URL points at PostgreSQL. The database is wiped
+(every app table dropped), so use a throwaway one:
+
+    createdb skillsync_test
+    TEST_DATABASE_URL=postgresql://localhost/skillsync_test python -m pytest -q tests/test_postgres.py
+
+Needs psycopg2 and asyncpg from requirements.txt, plus pytest.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+if not TEST_DATABASE_URL.startswith(("postgresql", "postgres:")):
+    pytest.skip("TEST_DATABASE_URL is not a PostgreSQL URL", allow_module_level=True)
+
+# app.database reads this at import time (conftest.py points it at SQLite otherwise).
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+from sqlalchemy import inspect, text  # noqa: E402
+
+from app.database import Base, SessionLocal, async_engine, engine  # noqa: E402
+from app.migrations import JSONB_COLUMNS, MIGRATIONS, _0003_postgres_jsonb, _meta, current_version, run_migrations  # noqa: E402
+from app.models import (  # noqa: E402
+    ActivePath,
+    Assessment,
+    PathVersion,
+    PathVersionWeek,
+    PathWeek,
+    SkillLastTouch,
+    TeachBack,
+    User,
+)
+
+
+def _column_type(conn, table: str, column: str) -> str:
+    return conn.execute(
+        text("SELECT data_type FROM information_schema.columns WHERE table_name = :t AND column_name = :c"),
+        {"t": table, "c": column},
+    ).scalar()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def schema():
+    Base.metadata.drop_all(engine)
+    _meta.drop_all(engine)
+    applied = run_migrations(engine)
+    assert len(applied) == len(MIGRATIONS)
+    yield
+    engine.dispose()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.rollback()
+    session.close()
+
+
+def _user(db, email: str) -> User:
+    user = User(email=email, hashed_password="x", career_goal="Software Engineer", hours_per_week=10)
+    db.add(user)
+    db.flush()
+    return user
+
+
+def test_migrations_are_current_and_idempotent():
+    assert current_version(engine) == MIGRATIONS[-1][0]
+    assert run_migrations(engine) == []
+    indexes = {index["name"] for index in inspect(engine).get_indexes("assessments")}
+    assert {"ix_assessments_user_skill_score", "ix_assessments_user_created"} <= indexes
+
+
+def test_document_columns_are_jsonb():
+    with engine.connect() as conn:
+        for table, column in JSONB_COLUMNS:
+            assert _column_type(conn, table, column) == "jsonb"
+
+
+def test_jsonb_migration_converts_json_columns(db):
+    user = _user(db, "jsonb@example.com")
+    db.add(Assessment(user_id=user.id, skill_name="Python", score=6.0, level="Intermediate", answers={"1": 2}))
+    db.commit()
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE assessments ALTER COLUMN answers TYPE JSON USING answers::json"))
+        assert _column_type(conn, "assessments", "answers") == "json"
+        _0003_postgres_jsonb(conn)
+        assert _column_type(conn, "assessments", "answers") == "jsonb"
+    db.expire_all()
+    row = db.query(Assessment).filter(Assessment.user_id == user.id).one()
+    assert row.answers == {"1": 2}
+
+
+def test_skill_vector_aggregates_in_sql(db):
+    from app.skill_scores import best_scores, skill_vector
+
+    user = _user(db, "vector@example.com")
+    for skill_name, score in (("Python", 4.0), ("Python", 7.5), ("SQL", 3.0)):
+        db.add(Assessment(user_id=user.id, skill_name=skill_name, score=score, level="Beginner", answers={}))
+    db.commit()
+    assert skill_vector(db, user.id) == ({"Python": 7.5, "SQL": 3.0}, 3)
+    assert best_scores(db, user.id) == {"Python": 7.5, "SQL": 3.0}
+
+
+def test_migrate_last_touch_groups_teachbacks_by_week(db):
+    from app.freshness import migrate_last_touch
+
+    db.query(SkillLastTouch).delete()
+    user = _user(db, "touch@example.com")
+    version = PathVersion(user_id=user.id, source="generate")
+    db.add(version)
+    db.flush()
+    week = PathWeek(
+        version_id=version.id, week_number=1, skill_name="Docker",
+        skills=["Docker", "Kubernetes"], estimated_hours=5.0,
+    )
+    db.add(week)
+    db.flush()
+    db.add(PathVersionWeek(version_id=version.id, week_number=1, week_id=week.id))
+    db.add(ActivePath(user_id=user.id, version_id=version.id))
+    earlier = datetime.now(timezone.utc) - timedelta(days=3)
+    for stamp in (earlier, earlier + timedelta(days=1)):
+        db.add(TeachBack(
+            user_id=user.id, week_number=1, resource_index=0,
+            prompt="Explain it", passed=True, created_at=stamp,
+        ))
+    db.add(Assessment(
+        user_id=user.id, skill_name="Python", score=5.0, level="Intermediate",
+        answers={}, created_at=earlier,
+    ))
+    db.commit()
+
+    assert migrate_last_touch(db) >= 3
+    touched = dict(
+        db.query(SkillLastTouch.skill_name, SkillLastTouch.touched_at)
+        .filter(SkillLastTouch.user_id == user.id)
+        .all()
+    )
+    assert set(touched) == {"Docker", "Kubernetes", "Python"}
+    assert touched["Docker"] == earlier + timedelta(days=1)
+
+
+def test_async_history_route_runs_on_asyncpg(db):
+    from fastapi.testclient import TestClient
+
+    from app.auth import create_access_token
+    from app.main import app
+
+    assert async_engine.dialect.driver == "asyncpg"
+    user = _user(db, "async@example.com")
+    db.add(Assessment(user_id=user.id, skill_name="Python", score=8.0, level="Advanced", answers={"3": 1}))
+    db.commit()
+
+    token = create_access_token({"sub": user.id})
+    with TestClient(app) as client:
+        response = client.get("/api/assessment/history", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert [entry["skill_name"] for entry in response.json()] == ["Python"]
+
+
+def test_pool_options_apply_to_postgres_engine():
+    from app.db_profile import POOL_MAX_OVERFLOW, POOL_SIZE
+
+    assert engine.pool.size() == POOL_SIZE
+    assert engine.pool._max_overflow == POOL_MAX_OVERFLOW
+    assert engine.pool._pre_ping
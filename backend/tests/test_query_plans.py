@@ -0,0 +1,119 @@
+"""The routers' hot queries must be served by indexes.
+
+Builds a scratch SQLite database through the migrations and fails when
+EXPLAIN QUERY PLAN shows a full table scan or a sort in a temp b-tree.
+Add a query here when a route gains a new lookup.
+"""
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from app.migrations import run_migrations
+from app.models import (
+    ActivePath,
+    Assessment,
+    CoachMessage,
+    LearningPath,
+    LearningProgress,
+    LearningProgressSummary,
+    LearningWeekProgress,
+    MCQQuestion,
+    ParkedProgress,
+    PathResource,
+    PathVersion,
+    PathVersionWeek,
+    PathWeek,
+    QuestionCandidate,
+    ReadinessReport,
+    RecertQueueItem,
+    SkillGap,
+    SkillLastTouch,
+    TeachBack,
+    UserActivityYear,
+    UserStreak,
+    WeeklyPlan,
+)
+
+HOT_QUERIES = {
+    "assessments by user": select(Assessment).where(Assessment.user_id == 1),
+    "assessment history": select(Assessment).where(Assessment.user_id == 1).order_by(Assessment.created_at),
+    "best assessment for skill": select(Assessment)
+    .where(Assessment.user_id == 1, Assessment.skill_name == "Python")
+    .order_by(Assessment.score.desc())
+    .limit(1),
+    "skill vector": select(Assessment.skill_name, func.max(Assessment.score), func.count())
+    .where(Assessment.user_id == 1)
+    .group_by(Assessment.skill_name),
+    "skill gap upsert": select(SkillGap).where(SkillGap.user_id == 1, SkillGap.skill_name == "Python"),
+    "coach history": select(CoachMessage)
+    .where(CoachMessage.user_id == 1)
+    .order_by(CoachMessage.created_at.desc())
+    .limit(20),
+    "questions for skill": select(MCQQuestion).where(MCQQuestion.skill_name == "Python"),
+    "legacy path rows": select(LearningPath)
+    .where(LearningPath.user_id == 1)
+    .order_by(LearningPath.week_number),
+    "progress by user": select(LearningProgress).where(LearningProgress.user_id == 1),
+    "passed teach-back": select(TeachBack).where(
+        TeachBack.user_id == 1,
+        TeachBack.week_number == 1,
+        TeachBack.resource_index == 0,
+        TeachBack.passed.is_(True),
+    ),
+    "latest readiness report": select(ReadinessReport)
+    .where(ReadinessReport.user_id == 1)
+    .order_by(ReadinessReport.created_at.desc())
+    .limit(1),
+    "candidate review queue": select(QuestionCandidate)
+    .where(QuestionCandidate.status == "pending", QuestionCandidate.skill_name == "Python"),
+    "weekly plan": select(WeeklyPlan).where(WeeklyPlan.user_id == 1, WeeklyPlan.week_start == "2026-01-05"),
+    "skill last touch": select(SkillLastTouch).where(SkillLastTouch.user_id == 1),
+    "recert queue": select(RecertQueueItem).where(RecertQueueItem.user_id == 1),
+    "active path": select(ActivePath).where(ActivePath.user_id == 1),
+    "path versions": select(PathVersion).where(PathVersion.user_id == 1).order_by(PathVersion.id.desc()),
+    "version weeks": select(PathWeek)
+    .join(PathVersionWeek, PathVersionWeek.week_id == PathWeek.id)
+    .where(PathVersionWeek.version_id == 1)
+    .order_by(PathVersionWeek.week_number),
+    "active path week": select(PathWeek)
+    .join(PathVersionWeek, PathVersionWeek.week_id == PathWeek.id)
+    .where(PathVersionWeek.version_id == 1, PathVersionWeek.week_number == 2),
+    "week resources": select(PathResource).where(PathResource.week_id == 1).order_by(PathResource.position),
+    "week progress": select(LearningWeekProgress)
+    .where(LearningWeekProgress.user_id == 1, LearningWeekProgress.week_number == 2),
+    "progress summary": select(LearningProgressSummary).where(LearningProgressSummary.user_id == 1),
+    "parked progress": select(ParkedProgress)
+    .where(ParkedProgress.user_id == 1, ParkedProgress.week_id.in_([1, 2])),
+    "activity year": select(UserActivityYear)
+    .where(UserActivityYear.user_id == 1, UserActivityYear.year == 2026),
+    "activity years in range": select(UserActivityYear.year, UserActivityYear.bits)
+    .where(UserActivityYear.user_id == 1, UserActivityYear.year.between(2025, 2026)),
+    "streak": select(UserStreak).where(UserStreak.user_id == 1),
+}
+
+
+def problems(plan_rows) -> list:
+    found = []
+    for row in plan_rows:
+        detail = row[-1]
+        if detail.startswith("SCAN ") and " USING " not in detail:
+            found.append(detail)
+        if "USE TEMP B-TREE" in detail:
+            found.append(detail)
+    return found
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+    run_migrations(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_indexes(engine, name):
+    sql = str(HOT_QUERIES[name].compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    assert not problems(plan), f"{name}: {' | '.join(row[-1] for row in plan)}"
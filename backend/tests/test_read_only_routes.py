@@ -0,0 +1,101 @@
+"""Every GET route must run on the read-only session without writing.
+
+GET requests get a ReadOnlySession (app/database.py), which raises
+ReadOnlySessionError on any flush or ORM write. This builds a user with
+assessments, an active path, progress, streak history, a weekly plan, a
+readiness report, a question generation run and a staged recert through
+the write endpoints, then
+calls every GET route in the OpenAPI schema and fails on any 5xx.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.ai.learning_path_engine as learning_path_engine
+from app.auth import create_access_token
+from app.database import ReadOnlySessionError, ReadSessionLocal, SessionLocal
+from app.main import app
+from app.models import MCQQuestion, ReadinessReport, SkillGap, TeachBack, User
+from app.recert_queue import run_recert_schedule
+from seed_data import seed_mcq_questions
+
+LOCAL_DATE = "2026-10-19"
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def state(client):
+    """Ids and headers for a user who has touched every feature."""
+    seed_mcq_questions()
+    with SessionLocal() as db:
+        user = db.query(User).filter(User.email == "admin@example.com").first()
+        if user is None:
+            user = User(email="admin@example.com", hashed_password="x", full_name="Admin")
+            db.add(user)
+            db.commit()
+        user_id = user.id
+        answers = {str(q.id): q.correct_answer for q in db.query(MCQQuestion).filter(MCQQuestion.skill_name == "Python")}
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user_id})}", "X-Local-Date": LOCAL_DATE}
+    post = lambda path, **kw: client.post(path, headers=headers, **kw)  # noqa: E731
+    assert client.put("/api/profile", headers=headers, json={"career_goal": "Software Engineer", "hours_per_week": 8}).status_code == 200
+    assessment = post("/api/assessment/submit", json={"skill_name": "Python", "answers": answers})
+    assert assessment.status_code == 200
+    # Skip the outbound resource URL checks; only the trusted-domain rule applies offline.
+    learning_path_engine._url_is_usable = learning_path_engine._is_trusted_url
+    assert post("/api/learning-path/generate").status_code == 200
+    with SessionLocal() as db:
+        db.add(TeachBack(user_id=user_id, week_number=1, resource_index=0, prompt="Explain it", passed=True))
+        db.commit()
+    assert post("/api/learning-path/progress", json={"week_number": 1, "resource_index": 0, "completed": True}).status_code == 200
+    assert post("/api/learning-path/generate").status_code == 200
+    assert post("/api/streak/ping").status_code == 200
+    assert post("/api/coach/weekly-plan").status_code == 200
+    assert post("/api/readiness-report").status_code == 200
+    run = post("/api/admin/question-candidates/generate")
+    assert run.status_code == 202
+
+    with SessionLocal() as db:
+        run_recert_schedule(db, now=datetime.now(timezone.utc) + timedelta(days=365), seed=0)
+        token = db.query(ReadinessReport.share_token).filter(ReadinessReport.user_id == user_id).scalar()
+    return {
+        "headers": headers,
+        "params": {
+            "skill_name": "Python",
+            "assessment_id": assessment.json()["assessment_id"],
+            "token": token,
+            "run_id": run.json()["id"],
+        },
+        "query": {"/api/learning-path/versions/diff": {"from_version": 1, "to_version": 2}},
+    }
+
+
+def _get_paths():
+    return [path for path, operations in app.openapi()["paths"].items() if "get" in operations]
+
+
+def test_read_session_refuses_writes():
+    with ReadSessionLocal() as db:
+        db.add(SkillGap(user_id=1, skill_name="Python", current_level=1, target_level=2, gap=1, priority="high"))
+        with pytest.raises(ReadOnlySessionError):
+            db.flush()
+
+
+@pytest.mark.parametrize("path", _get_paths())
+def test_get_route_does_not_write(client, state, path):
+    url = path.format(**state["params"])
+    response = client.get(url, headers=state["headers"], params=state["query"].get(path))
+    assert response.status_code < 500, f"GET {url}: {response.text}"
+
+
+def test_recert_questions_come_from_the_staged_set(client, state):
+    response = client.get("/api/assessment/questions/Python", headers=state["headers"], params={"recert": True})
+    assert response.status_code == 200
+    assert response.json()
@@ -21,11 +21,25 @@ const MCQTest = () => {
   const [submitting, setSubmitting] = useState(false);
   const [elapsed, setElapsed] = useState(0);
   const [dir, setDir] = useState(1);
+  const [maxQuestions, setMaxQuestions] = useState(0);
+  // Regular tests are adaptive (one question per round trip); recert keeps its fixed three.
+  const adaptive = !recert;
+
+  const applyStep = (data, elapsedSoFar) => {
+    if (data.done) {
+      navigate('/assessment-result', { state: { result: data.result, elapsed: elapsedSoFar, recert } });
+      return;
+    }
+    setMaxQuestions(data.max_questions);
+    setQuestions((qs) => [...qs, data.question]);
+    setCurrent(data.questions_answered);
+  };
 
   useEffect(() => {
-    api.get(`/api/assessment/questions/${skillName}${recert ? '?recert=true' : ''}`)
-      .then((r) => setQuestions(r.data))
-      .finally(() => setLoading(false));
+    const request = adaptive
+      ? api.post('/api/assessment/adaptive', { skill_name: skillName, answers: {} }).then((r) => applyStep(r.data, 0))
+      : api.get(`/api/assessment/questions/${skillName}?recert=true`).then((r) => setQuestions(r.data));
+    request.catch(() => {}).finally(() => setLoading(false));
   }, [skillName, recert]);
 
   useEffect(() => {
@@ -39,6 +53,7 @@ const MCQTest = () => {
       if (!q) return;
       const idx = LETTERS.indexOf(e.key.toUpperCase());
       if (idx >= 0 && q.options[idx]) setAnswers((a) => ({ ...a, [q.id]: q.options[idx].id }));
+      if (adaptive) return;
       if (e.key === 'ArrowRight' && current < questions.length - 1) {
         setDir(1);
         setCurrent((c) => c + 1);
@@ -55,8 +70,13 @@ const MCQTest = () => {
   const submit = async () => {
     setSubmitting(true);
     try {
-      const endpoint = recert ? '/api/assessment/recert' : '/api/assessment/submit';
-      const response = await api.post(endpoint, { skill_name: skillName, answers });
+      if (adaptive) {
+        const response = await api.post('/api/assessment/adaptive', { skill_name: skillName, answers });
+        setDir(1);
+        applyStep(response.data, elapsed);
+        return;
+      }
+      const response = await api.post('/api/assessment/recert', { skill_name: skillName, answers });
       navigate('/assessment-result', { state: { result: response.data, elapsed, recert } });
     } catch (err) {
       toastError(getApiErrorMessage(err, 'Failed to submit assessment.'));
@@ -69,6 +89,8 @@ const MCQTest = () => {
   if (!questions.length) return <div className="card panel-glow">No questions for this skill.</div>;
 
   const question = questions[current];
+  const total = adaptive ? maxQuestions : questions.length;
+  const isLast = adaptive || current === questions.length - 1;
   const mins = String(Math.floor(elapsed / 60)).padStart(2, '0');
   const secs = String(elapsed % 60).padStart(2, '0');
 
@@ -76,13 +98,13 @@ const MCQTest = () => {
     <div className="mx-auto max-w-2xl">
       <p className="page-kicker">{recert ? `Recert · ${skillName}` : skillName}</p>
       <div className="mb-4 flex justify-between font-mono text-sm text-muted">
-        <span>{current + 1} / {questions.length}</span>
+        <span>{current + 1} / {adaptive ? `≤${total}` : total}</span>
         <span className="tabular text-accent">{mins}:{secs}</span>
       </div>
       <div className="mb-6 h-1.5 rounded-full bg-line overflow-hidden">
         <div
           className="h-full rounded-full bg-gradient-to-r from-accent to-violet shadow-neon-sm transition-all duration-300"
-          style={{ width: `${((current + 1) / questions.length) * 100}%` }}
+          style={{ width: `${Math.min(100, ((current + 1) / total) * 100)}%` }}
         />
       </div>
       <AnimatePresence mode="wait">
@@ -118,7 +140,7 @@ const MCQTest = () => {
           <div className="mt-8 flex justify-between">
             <button
               className="btn-secondary"
-              disabled={current === 0}
+              disabled={adaptive || current === 0}
               onClick={() => {
                 setDir(-1);
                 setCurrent((c) => c - 1);
@@ -126,9 +148,13 @@ const MCQTest = () => {
             >
               Previous
             </button>
-            {current === questions.length - 1 ? (
-              <button className="btn-primary" onClick={submit} disabled={submitting || Object.keys(answers).length < questions.length}>
-                {submitting ? 'Submitting…' : 'Submit'}
+            {isLast ? (
+              <button
+                className="btn-primary"
+                onClick={submit}
+                disabled={submitting || (adaptive ? answers[question.id] === undefined : Object.keys(answers).length < questions.length)}
+              >
+                {submitting ? 'Submitting…' : adaptive ? 'Next' : 'Submit'}
               </button>
             ) : (
               <button
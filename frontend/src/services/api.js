@@ -76,8 +76,15 @@ export async function clearCoachHistory() {
 }
 
 export async function getWeeklyPlan() {
-  const res = await api.get('/api/coach/weekly-plan');
-  return res.data;
+  try {
+    const res = await api.get('/api/coach/weekly-plan');
+    return res.data;
+  } catch (error) {
+    // No plan stored for this week yet: ask the server to generate it.
+    if (error?.response?.status !== 404) throw error;
+    const res = await api.post('/api/coach/weekly-plan');
+    return res.data;
+  }
 }
 
 export function publicReportUrl(sharePath) {
@@ -0,0 +1,85 @@
+import AsyncStorage from '@react-native-async-storage/async-storage';
+import api, { localDateKey, submitAssessmentBatch } from '../services/api';
+
+const BUNDLE_KEY = 'skillsync-assessment-bundle';
+const BUNDLE_ETAG_KEY = 'skillsync-assessment-bundle-etag';
+const QUEUE_KEY = 'skillsync-offline-assessments';
+const MAX_BATCH = 20;
+
+export type BundleQuestion = {
+  id: number;
+  skill_name: string;
+  question_text: string;
+  options: { id: number; text: string }[];
+  difficulty: number;
+};
+
+export type AssessmentBundle = {
+  version: number;
+  skills: { name: string; questions: BundleQuestion[] }[];
+};
+
+type QueuedAssessment = {
+  skill_name: string;
+  answers: Record<number, number>;
+  taken_on: string;
+};
+
+async function readJson<T>(key: string, fallback: T): Promise<T> {
+  try {
+    const raw = await AsyncStorage.getItem(key);
+    return raw ? (JSON.parse(raw) as T) : fallback;
+  } catch {
+    return fallback;
+  }
+}
+
+/** The last bundle stored on the device, without touching the network. */
+export async function cachedAssessmentBundle(): Promise<AssessmentBundle | null> {
+  return readJson<AssessmentBundle | null>(BUNDLE_KEY, null);
+}
+
+/** True when a request failed without any server response (no connectivity). */
+export function isOfflineError(error: any) {
+  return Boolean(error?.request) && !error?.response;
+}
+
+/** Refresh the question bundle when online; falls back to the stored copy. */
+export async function loadAssessmentBundle(): Promise<AssessmentBundle | null> {
+  const cached = await readJson<AssessmentBundle | null>(BUNDLE_KEY, null);
+  try {
+    const etag = await AsyncStorage.getItem(BUNDLE_ETAG_KEY);
+    const res = await api.get('/api/assessment/bundle', {
+      headers: cached && etag ? { 'If-None-Match': etag } : {},
+      validateStatus: (status) => status === 200 || status === 304,
+    });
+    if (res.status === 304 && cached) return cached;
+    await AsyncStorage.multiSet([
+      [BUNDLE_KEY, JSON.stringify(res.data)],
+      [BUNDLE_ETAG_KEY, res.headers.etag ?? ''],
+    ]);
+    return res.data;
+  } catch {
+    return cached;
+  }
+}
+
+export async function queueOfflineAssessment(skillName: string, answers: Record<number, number>) {
+  const queue = await readJson<QueuedAssessment[]>(QUEUE_KEY, []);
+  queue.push({ skill_name: skillName, answers, taken_on: localDateKey() });
+  await AsyncStorage.setItem(QUEUE_KEY, JSON.stringify(queue));
+  return queue.length;
+}
+
+/** Submit queued assessments in batches; returns the results that synced. */
+export async function syncOfflineAssessments() {
+  let queue = await readJson<QueuedAssessment[]>(QUEUE_KEY, []);
+  const results = [];
+  while (queue.length) {
+    const batch = queue.slice(0, MAX_BATCH);
+    results.push(...(await submitAssessmentBatch(batch)));
+    queue = queue.slice(batch.length);
+    await AsyncStorage.setItem(QUEUE_KEY, JSON.stringify(queue));
+  }
+  return results;
+}
@@ -1,4 +1,4 @@
-import React, { useEffect } from 'react';
+import React, { useEffect, useState } from 'react';
 import { View, Text, ScrollView } from 'react-native';
 import { Card } from '../components/Card';
 import { Button } from '../components/Button';
@@ -6,6 +6,7 @@ import { AppTheme } from '../theme';
 import { useStyles } from '../theme/useStyles';
 import { useTheme } from '../context/ThemeContext';
 import { useProgress } from '../context/ProgressContext';
+import { getAssessmentFeedback } from '../services/api';
 
 interface AssessmentResultScreenProps {
   navigation: any;
@@ -18,6 +19,8 @@ interface AssessmentResultScreenProps {
         breakdown: any;
         passed?: boolean;
         stored_score?: number;
+        assessment_id?: number;
+        feedback_status?: string;
       };
       skillName: string;
       recert?: boolean;
@@ -138,10 +141,38 @@ export const AssessmentResultScreen: React.FC<AssessmentResultScreenProps> = ({
   const { theme } = useTheme();
   const styles = useStyles(createStyles);
 
+  const [feedback, setFeedback] = useState<string | null>(result.breakdown?.feedback ?? null);
+
   useEffect(() => {
     refreshProgress().catch(() => {});
   }, []);
 
+  useEffect(() => {
+    if (feedback || !result.assessment_id || result.feedback_status !== 'pending') return;
+    let cancelled = false;
+    let attempts = 0;
+    let timer: ReturnType<typeof setTimeout>;
+    const poll = async () => {
+      attempts += 1;
+      try {
+        const data = await getAssessmentFeedback(result.assessment_id as number);
+        if (cancelled) return;
+        if (data.feedback_status === 'ready' && data.feedback) {
+          setFeedback(data.feedback);
+          return;
+        }
+      } catch {
+        // keep polling; feedback is optional
+      }
+      if (!cancelled && attempts < 10) timer = setTimeout(poll, 2000);
+    };
+    timer = setTimeout(poll, 1000);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [result.assessment_id]);
+
   const getLevelColor = (level: string) => {
     switch (level.toLowerCase()) {
       case 'advanced':
@@ -199,10 +230,10 @@ export const AssessmentResultScreen: React.FC<AssessmentResultScreenProps> = ({
         )}
       </Card>
 
-      {result.breakdown?.feedback && (
+      {feedback && (
         <Card style={styles.feedbackCard}>
           <Text style={styles.feedbackLabel}>AI Feedback</Text>
-          <Text style={styles.feedbackText}>{result.breakdown.feedback}</Text>
+          <Text style={styles.feedbackText}>{feedback}</Text>
         </Card>
       )}
 
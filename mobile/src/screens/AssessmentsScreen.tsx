@@ -4,6 +4,7 @@ import { Card } from '../components/Card';
 import { LoadingScreen } from '../components/LoadingScreen';
 import { PageHeader } from '../components/PageHeader';
 import api from '../services/api';
+import { loadAssessmentBundle, syncOfflineAssessments } from '../lib/offlineAssessments';
 import { AppTheme } from '../theme';
 import { useStyles } from '../theme/useStyles';
 import { useAuth } from '../context/AuthContext';
@@ -126,11 +127,25 @@ export const AssessmentsScreen: React.FC<AssessmentsScreenProps> = ({ navigation
   }, [user]);
 
   const fetchSkills = async () => {
+    // Flush tests taken offline, and refresh the question bundle MCQTest reads from.
+    await syncOfflineAssessments().catch(() => null);
+    const bundle = loadAssessmentBundle();
     try {
       const response = await api.get('/api/assessment/skills');
       setSkills(response.data);
+      await bundle;
     } catch (error) {
-      console.error('Failed to fetch skills:', error);
+      // Offline: list the skills in the stored bundle instead.
+      const cached = await bundle;
+      if (cached) {
+        setSkills(cached.skills.map((s) => ({
+          name: s.name,
+          question_count: s.questions.length,
+          recommended: true,
+        })));
+      } else {
+        console.error('Failed to fetch skills:', error);
+      }
     } finally {
       setLoading(false);
       setRefreshing(false);
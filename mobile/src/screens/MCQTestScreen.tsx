@@ -4,6 +4,12 @@ import { Button } from '../components/Button';
 import { Card } from '../components/Card';
 import { LoadingScreen } from '../components/LoadingScreen';
 import api from '../services/api';
+import {
+  cachedAssessmentBundle,
+  isOfflineError,
+  queueOfflineAssessment,
+  syncOfflineAssessments,
+} from '../lib/offlineAssessments';
 import { AppTheme } from '../theme';
 import { useStyles } from '../theme/useStyles';
 
@@ -124,6 +130,16 @@ export const MCQTestScreen: React.FC<MCQTestScreenProps> = ({ navigation, route
 
   const fetchQuestions = async () => {
     try {
+      // Full tests come from the bundle cached by the Assessments screen; recerts
+      // need the user's staged set from the server.
+      if (!recert) {
+        const bundle = await cachedAssessmentBundle();
+        const cached = bundle?.skills.find((s) => s.name === skillName);
+        if (cached && cached.questions.length) {
+          setQuestions(cached.questions);
+          return;
+        }
+      }
       const response = await api.get(
         `/api/assessment/questions/${skillName}${recert ? '?recert=true' : ''}`
       );
@@ -174,15 +190,17 @@ export const MCQTestScreen: React.FC<MCQTestScreenProps> = ({ navigation, route
 
   const submitAnswers = async () => {
     setSubmitting(true);
+    const submitted = Object.keys(answers).reduce((acc, questionId) => {
+      acc[parseInt(questionId)] = answers[parseInt(questionId)];
+      return acc;
+    }, {} as Record<number, number>);
     try {
       const endpoint = recert ? '/api/assessment/recert' : '/api/assessment/submit';
       const response = await api.post(endpoint, {
         skill_name: skillName,
-        answers: Object.keys(answers).reduce((acc, questionId) => {
-          acc[parseInt(questionId)] = answers[parseInt(questionId)];
-          return acc;
-        }, {} as Record<number, number>),
+        answers: submitted,
       });
+      syncOfflineAssessments().catch(() => null);
 
       navigation.replace('AssessmentResult', {
         result: response.data,
@@ -190,6 +208,12 @@ export const MCQTestScreen: React.FC<MCQTestScreenProps> = ({ navigation, route
         recert: Boolean(recert),
       });
     } catch (error: any) {
+      if (!recert && isOfflineError(error)) {
+        await queueOfflineAssessment(skillName, submitted);
+        Alert.alert('Saved offline', 'Your answers will be scored when you are back online.');
+        navigation.goBack();
+        return;
+      }
       console.error('Failed to submit assessment:', error);
       Alert.alert('Error', error.response?.data?.detail || 'Failed to submit assessment');
     } finally {
@@ -49,7 +49,7 @@ const api = axios.create({
   timeout: 30000,
 });
 
-function localDateKey(date = new Date()) {
+export function localDateKey(date = new Date()) {
   const y = date.getFullYear();
   const m = String(date.getMonth() + 1).padStart(2, '0');
   const d = String(date.getDate()).padStart(2, '0');
@@ -122,6 +122,18 @@ export function getApiErrorMessage(
   return fallback;
 }
 
+export async function getAssessmentFeedback(assessmentId: number) {
+  const res = await api.get(`/api/assessment/${assessmentId}/feedback`);
+  return res.data;
+}
+
+export async function submitAssessmentBatch(
+  items: { skill_name: string; answers: Record<number, number>; taken_on?: string }[]
+) {
+  const res = await api.post('/api/assessment/submit-batch', { items });
+  return res.data;
+}
+
 export async function createReadinessReport() {
   const res = await api.post('/api/readiness-report');
   return res.data;
@@ -138,8 +150,15 @@ export async function clearCoachHistory() {
 }
 
 export async function getWeeklyPlan() {
-  const res = await api.get('/api/coach/weekly-plan');
-  return res.data;
+  try {
+    const res = await api.get('/api/coach/weekly-plan');
+    return res.data;
+  } catch (error: any) {
+    // No plan stored for this week yet: ask the server to generate it.
+    if (error?.response?.status !== 404) throw error;
+    const res = await api.post('/api/coach/weekly-plan');
+    return res.data;
+  }
 }
 
 export function publicReportUrl(sharePath: string) {